@@ -0,0 +1,74 @@
+"""Compare the sentence splitters available to ``udar.Document`` with the
+stanza splitter: speed, and agreement of sentence boundaries.
+
+Usage: python dev/bench_sentence_splitters.py [N_REPEATS]
+
+Each file of the stress corpus is treated as one document. A boundary is
+the number of non-whitespace characters before the end of a sentence, so
+that splitters that normalize whitespace differently can still be compared.
+The first call to each splitter (which loads its model) is timed separately.
+"""
+
+from pathlib import Path
+import re
+import sys
+from time import perf_counter
+
+from udar.document import get_sentence_splitter
+from udar.document import SENTENCE_SPLITTERS
+from udar.misc import destress
+
+CORPUS_DIR = Path(__file__).parent.parent / 'udar' / 'experiments' / 'stress_corpus'  # noqa: E501
+
+
+def load_docs():
+    return [destress(path.read_text())
+            for path in sorted(CORPUS_DIR.glob('*.ref'))]
+
+
+def boundaries(sents):
+    ends = set()
+    n_chars = 0
+    for sent in sents:
+        n_chars += len(re.sub(r'\s+', '', sent))
+        ends.add(n_chars)
+    return ends
+
+
+def main(n_repeats=1):
+    docs = load_docs() * n_repeats
+    print(f'{len(docs)} documents, {sum(len(doc) for doc in docs)} chars')
+    print(f'{"splitter":<10}{"load (s)":>10}{"split (s)":>11}'
+          f'{"sents":>8}{"precision":>11}{"recall":>8}{"F1":>7}')
+    reference = None
+    for name in SENTENCE_SPLITTERS:
+        start = perf_counter()
+        try:
+            split = get_sentence_splitter(name)
+            split('Загрузка.')
+        except ModuleNotFoundError as e:
+            print(f'{name:<10}skipped: {e}', file=sys.stderr)
+            continue
+        load_time = perf_counter() - start
+        start = perf_counter()
+        output = [split(doc) for doc in docs]
+        split_time = perf_counter() - start
+        n_sents = sum(len(sents) for sents in output)
+        if reference is None:  # the first splitter (stanza) is the reference
+            reference = output
+        true_pos = n_pred = n_ref = 0
+        for sents, ref_sents in zip(output, reference):
+            pred, ref = boundaries(sents), boundaries(ref_sents)
+            true_pos += len(pred & ref)
+            n_pred += len(pred)
+            n_ref += len(ref)
+        precision = true_pos / n_pred if n_pred else float('nan')
+        recall = true_pos / n_ref if n_ref else float('nan')
+        f1 = (2 * true_pos / (n_pred + n_ref) if n_pred + n_ref
+              else float('nan'))
+        print(f'{name:<10}{load_time:>10.3f}{split_time:>11.3f}{n_sents:>8}'
+              f'{precision:>11.3f}{recall:>8.3f}{f1:>7.3f}')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
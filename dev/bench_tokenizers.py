@@ -0,0 +1,71 @@
+"""Compare the throughput of the hfst-tokenize backends.
+
+Usage: python dev/bench_tokenizers.py [N_REPEATS]
+
+Each line of the stress corpus is treated as one sentence. Every backend
+tokenizes the same sentences, first one call per sentence, then (if the
+backend supports it) with a single call to ``tokenize_many``.
+
+Finally, a pool of ``pipe`` workers (one per core, up to 8) is benchmarked
+with ``tokenize_many``.
+"""
+
+import os
+from pathlib import Path
+import sys
+from time import perf_counter
+
+from udar.misc import destress
+from udar.sentence import get_tokenizer
+
+CORPUS_DIR = Path(__file__).parent.parent / 'udar' / 'experiments' / 'stress_corpus'  # noqa: E501
+
+
+def load_sents():
+    return [destress(line.strip())
+            for path in sorted(CORPUS_DIR.glob('*.ref'))
+            for line in path.read_text().splitlines()
+            if line.strip()]
+
+
+def bench(name, func, sents):
+    start = perf_counter()
+    output = func(sents)
+    elapsed = perf_counter() - start
+    n_toks = sum(len(toks) for toks in output)
+    print(f'{name:<28}{elapsed:>8.3f} s{len(sents) / elapsed:>12.0f} sent/s'
+          f'{n_toks / elapsed:>12.0f} tok/s')
+    return output
+
+
+def main(n_repeats=1):
+    sents = load_sents() * n_repeats
+    print(f'{len(sents)} sentences')
+    reference = None
+    for backend in ('subprocess', 'pexpect', 'pipe'):
+        tokenizer = get_tokenizer(backend=backend)
+        if backend == 'subprocess':
+            sents_to_run = sents[:200]  # one process per call is very slow
+        else:
+            sents_to_run = sents
+        output = bench(f'{backend} (per sentence)',
+                       lambda ss: [tokenizer(s) for s in ss], sents_to_run)
+        if hasattr(tokenizer, 'tokenize_many'):
+            output = bench(f'{backend} (tokenize_many)',
+                           tokenizer.tokenize_many, sents_to_run)
+        if backend != 'subprocess':
+            if reference is None:
+                reference = output
+            elif output != reference:
+                print(f'WARNING: {backend} output differs!', file=sys.stderr)
+    n_procs = min(os.cpu_count() or 1, 8)
+    if n_procs > 1:
+        pool = get_tokenizer(backend='pipe', n_procs=n_procs)
+        output = bench(f'pipe x {n_procs} (tokenize_many)', pool.tokenize_many,
+                       sents)
+        if output != reference:
+            print('WARNING: pool output differs!', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,23 @@
+"""Regenerate ``udar/features/_registry.py``, the precomputed metadata
+(categories, default keyword arguments, and dependencies) of the features in
+``udar.features.ALL``. Run this from the repository root whenever a feature
+is added or changed: python dev/make_feature_registry.py
+"""
+
+from pathlib import Path
+import sys
+
+from udar.features import ALL
+from udar.features.registry import make_registry
+
+REGISTRY_PATH = Path(__file__).parent.parent / 'udar' / 'features' / '_registry.py'  # noqa: E501
+
+
+def main():
+    REGISTRY_PATH.write_text(make_registry(ALL.values()))
+    print(f'Wrote metadata of {len(ALL)} features to {REGISTRY_PATH}.',
+          file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,8 @@ from itertools import chain
 from pkg_resources import resource_filename
 from sys import stderr
 
+import pytest
+
 import udar
 
 
@@ -177,3 +179,105 @@ def test_str2Sentences():
     super_sentence = udar.Sentence(joined_sents)
     sentences = udar.document._str2Sentences(super_sentence.text)
     assert len(super_sentence) == len(list(chain(*sentences)))
+
+
+def test_disambiguate_batched():
+    per_sent = udar.Document(joined_sents)
+    for sent in per_sent.sentences:
+        sent.disambiguate()
+    for batch_size in (None, 1, 2):
+        doc = udar.Document(joined_sents)
+        doc.disambiguate(batch_size=batch_size)
+        assert doc == per_sent
+        assert doc.cg3_str() == per_sent.cg3_str()
+    doc = udar.Document(joined_sents)
+    doc.disambiguate(persistent=False)
+    assert doc.cg3_str() == per_sent.cg3_str()
+    doc = udar.Document(joined_sents, disambiguate=True)
+    assert doc.cg3_str() == per_sent.cg3_str()
+
+
+def test_depparse_batched():
+    doc = udar.Document(joined_sents)
+    doc.depparse(batch_size=2)
+    ref = udar.Document(joined_sents)
+    for sent in ref.sentences:
+        sent.depparse()
+    assert ([[(tok.id, tok.head, tok.deprel) for tok in sent]
+             for sent in doc.sentences]
+            == [[(tok.id, tok.head, tok.deprel) for tok in sent]
+                for sent in ref.sentences])
+    assert all(tok._stanza_token is not None for tok in doc)
+    with pytest.raises(ValueError):
+        doc.depparse(batch_size=0)
+
+
+def test_rule_sent_split():
+    from udar.document import rule_sent_split
+    text = ('Это А. С. Пушкин, ул. Ленина. «Привет!» — сказал он. Ну... Да?'
+            '\n\nВ 1999 г. Он ушёл')
+    assert rule_sent_split(text) == ['Это А. С. Пушкин, ул. Ленина.',
+                                     '«Привет!» — сказал он.', 'Ну...', 'Да?',
+                                     'В 1999 г. Он ушёл']
+
+
+def test_sentence_splitter():
+    s = 'Мы все говорили об этом с тобой. ## Он стоял в парке и. Ленина.'
+    sents = [['Мы', 'все', 'говорили', 'об', 'этом', 'с', 'тобой', '.'],
+             ['Он', 'стоял', 'в', 'парке', 'и.', 'Ленина', '.']]
+    for splitter in ('rule', 'tokens', lambda text: text.split('    ')):
+        doc = udar.Document(s, sentence_splitter=splitter)
+        assert sents == [[token.text for token in sent]
+                         for sent in doc.sentences]
+    with pytest.raises(ValueError):
+        udar.Document(s, sentence_splitter='spacy')
+
+
+def test_tokenize_and_split():
+    from udar.document import tokenize_and_split
+    text = 'Он сказал : " Привет . "  Она ушла !  Ну ... и что ?'
+    assert tokenize_and_split(text, tokenizer=str.split) == [
+        ('Он сказал : " Привет . "',
+         ['Он', 'сказал', ':', '"', 'Привет', '.', '"']),
+        ('Она ушла !', ['Она', 'ушла', '!']),
+        ('Ну ... и что ?', ['Ну', '...', 'и', 'что', '?'])]
+
+
+def test_tokenize_and_split_long_text():
+    from udar.document import MAX_TOKENIZER_LINE
+    from udar.document import tokenize_and_split
+
+    class LineTokenizer:
+        def __init__(self):
+            self.lines = []
+
+        def __call__(self, line):
+            return self.tokenize_many([line])[0]
+
+        def tokenize_many(self, lines):
+            self.lines.extend(lines)
+            return [line.split() for line in lines]
+
+    para = ' '.join(['Мы все говорили об этом с тобой .'] * 500)
+    text = f'{para}\n\n\n{para}\nи т.д. .\n\n'
+    tokenizer = LineTokenizer()
+    sents = tokenize_and_split(text, tokenizer=tokenizer)
+    assert all(0 < len(line) <= MAX_TOKENIZER_LINE and '\n' not in line
+               for line in tokenizer.lines)
+    assert len(sents) == 1000
+    assert sents[-1] == ('Мы все говорили об этом с тобой .\nи т.д. .',
+                         ['Мы', 'все', 'говорили', 'об', 'этом', 'с',
+                          'тобой', '.', 'и', 'т.д.', '.'])
+    assert all(toks and '' not in toks for _, toks in sents)
+    # A custom analyzer can be a plain callable
+
+    def analyzer(tok):
+        return [('§+SENT', 50.0)] if tok == '§' else []
+    assert tokenize_and_split('Да § Нет', tokenizer=str.split,
+                              _analyzer=analyzer) == [
+        ('Да §', ['Да', '§']), ('Нет', ['Нет'])]
+    # A paragraph break ends a sentence without final punctuation
+    assert tokenize_and_split('Заголовок\n\nТекст .', tokenizer=str.split) == [
+        ('Заголовок', ['Заголовок']), ('Текст .', ['Текст', '.'])]
+    doc = udar.Document(text, sentence_splitter='tokens')
+    assert len(doc.sentences) == 1000
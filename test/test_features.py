@@ -1,10 +1,19 @@
 from functools import partial
+import gc
 import inspect
 from pkg_resources import resource_filename
 import re
+from statistics import mean
+import warnings
+
+import pytest
 
 import udar
 from udar.features import ALL
+from udar.features.feature import Feature
+from udar.features.feature_extractor import FeatureExtractor
+from udar.features.features import MOST_LIKELY
+from udar.features.features import vowel_re
 
 
 RSRC_PATH = resource_filename('udar', 'resources/')
@@ -38,6 +47,54 @@ def test_extract_subset():
     assert repr(list(zip(*subset(doc1)))) == "[('type_token_ratio', 0.8571428571428571)]"  # noqa: E501
 
 
+def test_extract_parallel():
+    docs = [udar.Document(text, depparse=True) for _ in range(5)]
+    subset = ALL.new_extractor_from_subset(['type_token_ratio',
+                                            'sylls_per_word',
+                                            'num_abstract_nouns'])
+    progress = []
+    serial = subset(docs)
+    parallel = subset(docs, n_jobs=2, chunksize=2,
+                      progress=lambda i, n: progress.append((i, n)))
+    assert repr(parallel) == repr(serial)
+    assert [doc.features for doc in docs] == parallel[1:]
+    assert progress == [(i, 5) for i in range(1, 6)]
+    with pytest.raises(ValueError):
+        subset(docs, n_jobs=0)
+
+
+def test_to_array(tmp_path):
+    np = pytest.importorskip('numpy')
+    docs = [udar.Document(text, depparse=True) for _ in range(5)]
+    subset = ALL.new_extractor_from_subset(['type_token_ratio',
+                                            'type_token_ratio_Interj',
+                                            'sylls_per_word'])
+    rows = subset(docs, header=False)
+    arr, cols = subset.to_array(docs)
+    assert arr.dtype == np.float64 and arr.shape == (5, 3)
+    assert cols == list(subset)
+    assert np.array_equal(arr, np.array(rows, dtype=np.float64),
+                          equal_nan=True)
+    assert np.isnan(arr[:, 1]).all()
+    path = tmp_path / 'features.npy'
+    assert subset.to_npy((doc for doc in docs), path, n_docs=5,
+                         chunk_size=2) == cols
+    assert np.array_equal(np.load(path, mmap_mode='r'), arr, equal_nan=True)
+    with pytest.raises(ValueError):
+        subset.to_npy(iter(docs), path, n_docs=4)
+    tsv = subset(docs[:1], tsv=True)
+    assert tsv.split('\n')[1].split('\t') == [str(val) for val in rows[0]]
+    features = [doc.features for doc in docs]
+    parallel_arr, _ = subset.to_array(docs, n_jobs=2)
+    assert np.array_equal(parallel_arr, arr, equal_nan=True)
+    assert [doc.features for doc in docs] == features
+    assert subset.to_npy(iter(docs), path, n_docs=5, chunk_size=2,
+                         n_jobs=2) == cols
+    assert np.array_equal(np.load(path, mmap_mode='r'), arr, equal_nan=True)
+    with pytest.raises(ValueError):
+        subset.to_array(iter(docs), n_jobs=0)
+
+
 def test_feature_keywords_declared_in_alphabetical_order():
     for name, feat in ALL.items():
         kwargs = list(feat.default_kwargs)
@@ -94,3 +151,251 @@ def test_name_of_func_matches_name_in_extractor():
     """Ensure that the function's name matches the key in the extractor."""
     for feat_name, feat in ALL.items():
         assert feat.func.__name__ == feat_name
+
+
+def test_filter_toks_uses_tag_index():
+    doc = udar.Document(text, depparse=True)
+    index = ALL['_tag_index'](doc)
+    assert set(index) == {'tags', 'ms_feats'}
+    toks = list(doc)
+    for has_tag in ('N', 'Anim', 'Inan', 'AnIn', 'CC', ('A', 'N'), 'Foo'):
+        tags = has_tag if isinstance(has_tag, tuple) else (has_tag,)
+        expected = [t for t in toks
+                    if any(t.has_tag_in_most_likely_reading(tag)
+                           for tag in tags)]
+        assert ALL['_filter_toks'](doc, has_tag=has_tag) == expected
+    assert index['ms_feats']['POS'] == [i for i, t in enumerate(toks)
+                                        if t.readings]
+
+
+def test_token_stats_columns():
+    doc = udar.Document(text, depparse=True)
+    stats = ALL['_token_stats'](doc)
+    toks = list(doc)
+    assert len(stats) == len(toks) and stats.tokens == toks
+    assert list(stats.num_chars) == [len(t.text) for t in toks]
+    assert list(stats.num_sylls) == [len(re.findall(vowel_re, t.text,
+                                                    flags=re.I))
+                                     for t in toks]
+    assert stats.lemmas == [t.most_likely_lemmas(method=MOST_LIKELY)
+                            for t in toks]
+    for tag in ('N', 'Anim', 'Inan', 'AnIn', 'CC'):
+        expected = int(any(tag in r for t in toks for r in t.readings))
+        assert ALL[f'{tag}_present'](doc) == expected
+    assert (ALL['sylls_per_word'](doc)
+            == mean(len(re.findall(vowel_re, t.text, flags=re.I))
+                    for t in ALL['_filter_toks'](doc, rmv_punc=True)))
+
+
+def test_schedule():
+    feat_names = ['type_token_ratio_N', 'num_tokens_N', 'num_sents']
+    order, frees = ALL._schedule(feat_names)
+    assert sorted(order) == sorted(feat_names)
+    assert order.index('num_tokens_N') < order.index('type_token_ratio_N')
+    assert ALL['tag_ms_feat_ratio_Anim'].depends_on == ['num_tokens_Anim',
+                                                        'num_tokens_ms_feat_ANIMACY']  # noqa: E501
+    assert ALL['N_present'].depends_on == ['_token_stats']
+    assert ALL['chars_per_content_word'].depends_on == ['chars_per_word']
+    assert {'_token_stats', '_tag_index'} <= frees['type_token_ratio_N']
+    assert not any(frees.get(name) for name in order[2:])
+
+    def a(doc) -> int:
+        """Depends on b."""
+        return 0
+    extractor = FeatureExtractor(features={
+        'a': Feature('a', a, depends_on=['b']),
+        'b': Feature('b', a, depends_on=['a'])})
+    with pytest.raises(ValueError):
+        extractor._schedule(['a'])
+
+
+def test_registry_is_up_to_date():
+    from udar.features import _registry
+    from udar.features.registry import make_registry
+    with open(_registry.__file__) as f:
+        assert f.read() == make_registry(ALL.values()), \
+            'Run `python3 dev/make_feature_registry.py`'
+
+
+def test_registry_without_source(monkeypatch):
+    def getsource(obj):
+        raise OSError('could not get source code')
+    monkeypatch.setattr(inspect, 'getsource', getsource)
+    for name, feat in ALL.items():
+        new_feat = Feature(name, feat.func, category=feat.category)
+        assert new_feat.depends_on == feat.depends_on
+        assert repr(new_feat.default_kwargs) == repr(feat.default_kwargs)
+
+    def num_chars(doc) -> int:
+        """Not the function in the registry."""
+        return 0
+    with pytest.raises(OSError):
+        Feature('num_chars', num_chars).depends_on
+
+
+def test_registry_source_digest(monkeypatch):
+    from udar.features import registry
+    orig = ALL['chars_per_content_word'].func
+    module_name = orig.__module__
+    assert re.fullmatch('[0-9a-f]{16}', registry.source_digest(module_name))
+    assert registry.lookup('chars_per_content_word', orig) is not None
+    # The module was edited after the registry was generated
+    monkeypatch.setitem(registry._source_digests, module_name, 'edited')
+    assert registry.lookup('chars_per_content_word', orig) is None
+    feat = Feature('chars_per_content_word', orig)
+    assert feat.depends_on == ['chars_per_word']
+    # The source cannot be read (e.g. in a zipapp), so the entry is trusted
+    monkeypatch.setitem(registry._source_digests, module_name, None)
+    assert registry.lookup('chars_per_content_word', orig) is not None
+
+
+def test_mmap_dict_resources():
+    import pickle
+    from udar.features.features import _load_resource
+    from udar.features.mmap_dict import MmapDict
+    for name in ('kelly_dict', 'lexmin_dict', 'Sharoff_lem_freq_rank_dict',
+                 'Tix_morph_count_dict'):
+        mdict = _load_resource(name)
+        assert isinstance(mdict, MmapDict)
+        with open(f'{RSRC_PATH}{name}.pkl', 'rb') as f:
+            dct = pickle.load(f)
+        assert len(mdict) == len(dct)
+        assert all(mdict[key] == val and type(mdict[key]) is type(val)
+                   for key, val in dct.items())
+        assert mdict.get('не слово') is None and 'не слово' not in mdict
+        key = next(iter(dct))
+        assert pickle.loads(pickle.dumps(mdict))[key] == dct[key]
+    # The file is closed as soon as it is mapped
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        mdict = MmapDict(f'{RSRC_PATH}kelly_dict.mdict')
+        del mdict
+        gc.collect()
+    assert not [w for w in caught
+                if issubclass(w.category, ResourceWarning)]
+
+
+def test_lemma_records():
+    from udar.features.features import _get_kelly_dict
+    from udar.features.features import _get_lemma_record
+    from udar.features.features import _get_Sharoff_lem_freq_dict
+    record = _get_lemma_record('говорить')
+    assert record.freq == _get_Sharoff_lem_freq_dict()['говорить']
+    assert record.kelly_level == _get_kelly_dict()['говорить']
+    assert _get_lemma_record('не слово') == (0, 0, None, None, None)
+    doc = udar.Document(text, depparse=True)
+    records = ALL['_lemma_records'](doc)
+    assert set(records) == {lem for tok in doc
+                            for lem in tok.most_likely_lemmas(method=MOST_LIKELY)}  # noqa: E501
+    assert all(rec == _get_lemma_record(lem) for lem, rec in records.items())
+
+
+def test_feature_cache(tmp_path):
+    from udar.features.feature_cache import FeatureCache
+    cache = FeatureCache(tmp_path / 'features.sqlite', depparse=True)
+    subset = ALL.new_extractor_from_subset(['type_token_ratio',
+                                            'sylls_per_word'])
+    docs = [udar.Document(text, **cache.doc_kwargs)]
+    rows = subset(docs, cache=cache)
+    assert len(cache) == 2
+    param_keys = [ALL[name].param_key() for name in subset]
+    assert cache.get(cache.doc_key(text), param_keys) == list(rows[1])
+    assert subset.extract_texts([text], cache) == rows
+    assert subset(docs, cache=cache, rmv_punc=False) != rows
+    assert len(cache) == 3  # type_token_ratio has rmv_punc=False anyway
+    other = FeatureCache(tmp_path / 'features.sqlite', depparse=False)
+    assert other.doc_key(text) != cache.doc_key(text)
+    assert other.get(other.doc_key(text), param_keys) is None
+    texts = [f'{text} {i}' for i in range(5)]
+    assert (subset.extract_texts(texts, cache, n_jobs=2, header=False)
+            == subset([udar.Document(t, **cache.doc_kwargs) for t in texts],
+                      header=False))
+    with pytest.raises(TypeError):
+        FeatureCache(tmp_path / 'features.sqlite', tokenizer=object())
+    path_cache = FeatureCache(tmp_path / 'f.sqlite', gram_path=tmp_path)
+    str_cache = FeatureCache(tmp_path / 'f.sqlite', gram_path=str(tmp_path))
+    assert path_cache.pipeline_key == str_cache.pipeline_key
+
+
+def test_feature_cache_key_includes_source(tmp_path, monkeypatch):
+    from udar.features import feature_cache
+    from udar.features.feature_cache import FeatureCache
+    assert feature_cache.__file__ in feature_cache._source_paths()
+    source = tmp_path / 'feature.py'
+    monkeypatch.setattr(feature_cache, '_source_paths', lambda: [str(source)])
+    source.write_text('def feature(doc):\n    return 1\n')
+    key = FeatureCache(tmp_path / 'f.sqlite').pipeline_key
+    source.write_text('def feature(doc):\n    return 2.0\n')
+    assert FeatureCache(tmp_path / 'f.sqlite').pipeline_key != key
+
+
+def test_cost_report_and_subset_by_cost():
+    categories = ['Normalized length', 'Readability formula']
+    subset = ALL.new_extractor_from_subset(category_names=categories)
+    subset.reset_costs()
+    assert all(row.calls == 0 for row in subset.cost_report())
+    with pytest.raises(ValueError):
+        subset.new_extractor_from_subset(max_cost=1.0)  # nothing measured
+    subset([udar.Document(text, depparse=True) for _ in range(2)])
+    report = subset.cost_report()
+    assert all(row.calls > 0 for row in report)
+    assert report == sorted(report, key=lambda row: -row.self_time)
+    by_cat = subset.cost_report(by_category=True)
+    assert {row.name for row in by_cat} == set(categories)
+    assert sum(row.calls for row in by_cat) == sum(row.calls
+                                                   for row in report)
+    total_cost = sum(ALL[name].cost
+                     for name in subset._dependency_graph(list(subset)))
+    everything = subset.new_extractor_from_subset(max_cost=total_cost * 1.01)
+    assert list(everything) == list(subset)
+    cheap = subset.new_extractor_from_subset(max_cost=total_cost / 2)
+    assert set(cheap) < set(subset)
+    assert {feat.category for feat in cheap.values()} == set(categories)
+    with pytest.raises(ValueError):
+        subset.new_extractor_from_subset(max_cost=0.0)
+
+
+def test_stream_document(tmp_path):
+    from math import isnan
+    from udar.features.stream import iter_cg3
+    from udar.features.stream import iter_hfst
+    from udar.features.stream import iter_stream_documents
+    from udar.features.stream import StreamDocument
+    doc = udar.Document(text)
+    for tok in doc:  # so that the most likely readings are not random
+        tok.readings = tok.readings[:1]
+    cg3_path = tmp_path / 'doc.cg3'
+    cg3_path.write_text(doc.cg3_str())
+    hfst_path = tmp_path / 'doc.hfst'
+    hfst_path.write_text(doc.hfst_str())
+    toks = list(iter_cg3(cg3_path))
+    assert [tok.text for tok in toks] == [tok.text for tok in doc]
+    assert ([[r.lemmas for r in tok.readings] for tok in toks]
+            == [[tuple(r.lemmas) for r in tok.readings] for tok in doc])
+    assert ([tok[:2] for tok in toks]
+            == [tok[:2] for tok in iter_hfst(hfst_path)])
+    # The full default feature set, compared to a Document made from the
+    # same stream
+    cg3_doc = udar.Document.from_cg3(doc.cg3_str())
+    stream_doc = StreamDocument.from_cg3(cg3_path)
+    assert stream_doc.text == cg3_doc.text
+    feat_names = ALL._get_cat_and_feat_names()
+    unsupported = ALL._depending_on(feat_names,
+                                    StreamDocument.unsupported_features)
+    assert {'avg_dependency_length', 'avg_dependency_depth'} <= unsupported
+    with pytest.warns(UserWarning):
+        values = dict(zip(feat_names, ALL(stream_doc, header=False)[0]))
+    assert all(isnan(values[name]) for name in unsupported)
+    supported = [name for name in feat_names if name not in unsupported]
+    expected = ALL(cg3_doc, feat_names=supported, header=False)[0]
+    assert repr([values[name] for name in supported]) == repr(list(expected))
+    with pytest.raises(TypeError):
+        ALL['avg_dependency_length'](stream_doc)
+    hfst_doc, = iter_stream_documents([hfst_path], fmt='hfst')
+    assert hfst_doc.token_stats.texts == stream_doc.token_stats.texts
+    assert hfst_doc.token_stats.lemmas == stream_doc.token_stats.lemmas
+    orig_doc = StreamDocument.from_hfst(hfst_path, text=text)
+    assert (ALL['num_dialog_punc'](orig_doc)
+            == ALL['num_dialog_punc'](udar.Document(text)))
+    with pytest.raises(ValueError):
+        next(iter_stream_documents([cg3_path], fmt='conll'))
@@ -15,3 +15,45 @@ def test_accented_generator():
 # def test_get_g2p():
 #     g2p = udar.get_g2p()
 #     assert g2p.lookup('сло́во')[0][0] == 'сло́въ'
+
+
+def test_analyzer_lru_cache():
+    ana = udar.get_analyzer(L2_errors=False)
+    assert ana.cache_info() is None
+    uncached = ana('сло́ва')
+    ana = udar.get_analyzer(cache_size=2, L2_errors=False)
+    assert ana is udar.get_analyzer(L2_errors=False)
+    assert ana('сло́ва') == uncached
+    assert ana('сло́ва') == uncached
+    ana('слово')
+    ana('слов')
+    info = ana.cache_info()
+    assert (info.hits, info.misses, info.evictions) == (1, 3, 1)
+    assert info.currsize == info.maxsize == 2
+    ana.cache_clear()
+    assert ana.cache_info().currsize == 0
+    ana.set_cache_size(0)
+    assert ana.cache_info() is None
+
+
+def test_lookup_many_and_generate_many():
+    ana = udar.get_analyzer(L2_errors=False)
+    toks = ['слова', 'и', 'слова', 'слово']
+    assert ana.lookup_many(toks) == [ana(t) for t in toks]
+    gen = udar.get_generator(stressed=True)
+    reads = ['слово+N+Neu+Inan+Sg+Gen', 'и+CC', 'слово+N+Neu+Inan+Sg+Gen']
+    assert gen.generate_many(reads) == ['сло́ва', 'и', 'сло́ва']
+    tok = udar.Token('слова', _analyzer=ana)
+    assert gen.generate_many(tok.readings) == [r.generate(_generator=gen)
+                                               for r in tok.readings]
+
+
+def test_generator_memo():
+    gen = udar.get_generator(stressed=True)
+    gen.cache_clear()
+    assert gen('слово+N+Neu+Inan+Sg+Gen') == 'сло́ва'
+    assert gen('слово+N+Neu+Inan+Sg+Gen') == 'сло́ва'
+    assert gen('слово+Foo') is None
+    assert gen('слово+Foo') is None
+    info = gen.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 2, 2)
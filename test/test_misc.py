@@ -1,4 +1,8 @@
 from pkg_resources import resource_filename
+import subprocess
+import sys
+
+import pytest
 
 import udar
 
@@ -27,3 +31,36 @@ def test_combine_stress():
     assert udar.misc.combine_stress(words) == 'сло́ва́'
     words = ['узна́ет', 'узнаёт']
     assert udar.misc.combine_stress(words) == 'узна́ёт'
+
+
+def test_RSRC_PATH():
+    assert udar.misc.RSRC_PATH == RSRC_PATH
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7),
+                    reason='-X importtime requires Python 3.7')
+def test_import_is_lazy():
+    """`import udar` should not import heavy dependencies or the features
+    package until they are used.
+    """
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                           'import udar'],
+                          stderr=subprocess.PIPE, universal_newlines=True,
+                          check=True)
+    # import time: self [us] | cumulative | imported package
+    imported = set()
+    for line in proc.stderr.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            imported.add(fields[2].strip())
+    assert 'udar' in imported
+    for module in ('hfst', 'nltk', 'pexpect', 'pkg_resources', 'stanza',
+                   'torch', 'udar.features'):
+        assert module not in imported
+
+
+def test_lazy_ALL():
+    assert len(udar.ALL) > 0 and udar.features.ALL is udar.ALL
+    from udar import ALL
+    assert ALL is udar.ALL
+    assert not hasattr(udar, 'NOT_A_FEATURE')
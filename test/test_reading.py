@@ -1,6 +1,8 @@
 import pickle
 from pkg_resources import resource_filename
 
+import pytest
+
 import udar
 
 
@@ -36,6 +38,28 @@ def test_replace_tag():
     assert r.subreadings[0].tags == ['N'] and r.subreadings[1].tags == ['N']
 
 
+def test_hfst_noL2_str_is_invalidated_by_replace_tag():
+    r = udar.reading.Reading(*('слово+N+Neu+Inan+Sg+Nom', '5.975586'))
+    assert r.hfst_noL2_str() == 'слово+N+Neu+Inan+Sg+Nom'
+    r.replace_tag('Nom', 'Gen')
+    assert r.hfst_noL2_str() == 'слово+N+Neu+Inan+Sg+Gen'
+    assert r.generate(stressed=True) == 'сло́ва'
+
+
+def test_subreadings_are_interned_with_copy_on_write():
+    r1 = udar.reading.Reading(*('слово+N+Neu+Inan+Sg+Nom', '5.975586'))
+    r2 = udar.reading.Reading(*('слово+N+Neu+Inan+Sg+Nom', '1.000000', 'X'))
+    assert r1.subreadings[0] is r2.subreadings[0]
+    assert r1.weight != r2.weight and r2.cg_rule == 'X'
+    with pytest.raises(TypeError):
+        r1.subreadings[0].replace_tag('Nom', 'Gen')
+    r1.replace_tag('Nom', 'Gen')
+    assert 'Gen' in r1 and 'Nom' in r2
+    assert r1.subreadings[0] is not r2.subreadings[0]
+    r3 = udar.reading.Reading(*('слово+N+Neu+Inan+Sg+Nom', '5.975586'))
+    assert r3.subreadings[0] is r2.subreadings[0]
+
+
 def test_contains():
     r = udar.reading.Reading(*('и т.д.+Abbr+AnIn#.+SENT', '0.000000'))
     assert 'Abbr' in r
@@ -3,6 +3,8 @@ from pkg_resources import resource_filename
 from pprint import pprint
 from sys import stderr
 
+import pytest
+
 import udar
 
 
@@ -44,6 +46,53 @@ def test_HFSTTokenizer():
     assert toks == ['Вы', 'нашли', 'все', 'проблемы', ',', 'и', 'т.д.']
 
 
+def test_PipeTokenizer():
+    tokenizer = udar.sentence.get_tokenizer(backend='pipe')
+    assert isinstance(tokenizer, udar.sentence.PipeTokenizer)
+    assert tokenizer is udar.sentence.get_tokenizer(backend='pipe')
+    pexpect_tokenizer = udar.sentence.HFSTTokenizer()
+    sents = ['Мы нашли все\xa0проблемы, и т.д.', 'Вы нашли.'] * 200
+    assert tokenizer('Вы нашли.') == pexpect_tokenizer('Вы нашли.')
+    assert (tokenizer.tokenize_many(sents)
+            == pexpect_tokenizer.tokenize_many(sents))
+    with pytest.raises(ValueError):
+        udar.sentence.get_tokenizer(backend='telepathy')
+
+
+def test_PipeTokenizer_without_stdbuf(monkeypatch):
+    real_which = udar.sentence.which
+    monkeypatch.setattr(udar.sentence, 'which',
+                        lambda cmd: None if cmd == 'stdbuf'
+                        else real_which(cmd))
+    with pytest.raises(FileNotFoundError):
+        udar.sentence.PipeTokenizer()
+    with pytest.warns(UserWarning):
+        tokenizer = udar.sentence.get_tokenizer(backend='pipe')
+    assert isinstance(tokenizer, udar.sentence.HFSTTokenizer)
+
+
+def test_TokenizerPool():
+    pool = udar.sentence.get_tokenizer(backend='pipe', n_procs=2)
+    assert isinstance(pool, udar.sentence.TokenizerPool) and len(pool) == 2
+    assert pool is udar.sentence.get_tokenizer(backend='pipe', n_procs=2)
+    single = udar.sentence.get_tokenizer(backend='pipe')
+    sents = [f'Мы нашли {i} проблем, и т.д.' for i in range(101)]
+    assert pool.tokenize_many(sents) == single.tokenize_many(sents)
+    assert pool(sents[0]) == single(sents[0])
+    sent = udar.Sentence(sents[0], tokenizer=pool)
+    assert sent == udar.Sentence(sents[0], tokenizer=single)
+
+
+def test_HFSTTokenizer_tokenize_many():
+    tokenizer = udar.sentence.HFSTTokenizer()
+    sents = ['Мы нашли все\xa0проблемы, и т.д.', 'Вы нашли.'] * 200
+    assert tokenizer.tokenize_many(sents) == [tokenizer(s) for s in sents]
+    assert tokenizer.tokenize_many([]) == []
+    doc = udar.Document(' '.join(sents[:2]))
+    sent = udar.Sentence(doc.sentences[0].text)
+    assert doc.sentences[0] == sent
+
+
 def test_stressed_selection_safe():
     sent1 = udar.Sentence('шепотом')
     sent2 = udar.Sentence('замок')
@@ -165,3 +214,22 @@ def test_sent_deepcopy():
             except ValueError:
                 print('could not iterate', sent, file=stderr)
                 pass
+
+
+def test_disambiguate_persistent_matches_subprocess():
+    sent1 = udar.Sentence(example_sent)
+    sent1.disambiguate(persistent=False)
+    sent2 = udar.Sentence(example_sent)
+    sent2.disambiguate(persistent=True)
+    assert sent1.cg3_str(traces=True) == sent2.cg3_str(traces=True)
+
+
+def test_cg3_worker_is_shared_and_restarts():
+    worker = udar.sentence.get_cg3_worker()
+    assert worker is udar.sentence.get_cg3_worker()
+    sent1 = udar.Sentence(example_sent, disambiguate=True)
+    worker.process.kill()
+    worker.process.wait()
+    sent2 = udar.Sentence(example_sent, disambiguate=True)
+    assert worker.is_alive()
+    assert sent1 == sent2
@@ -85,6 +85,18 @@ def test_tok_stressed():
     assert t.stressed(selection='all') == 'сло́ва́'
 
 
+def test_tok_stresses_are_lazy():
+    t = udar.Token('слова', _analyzer=anl)
+    assert t._stresses == {} and t._phon_transcriptions is None
+    assert t.stress_ambig == 2
+    stresses = t.stresses()
+    stresses.pop()
+    assert len(t.stresses()) == 2
+    t.force_disambiguate()
+    assert t._stresses == {}
+    assert t.stress_ambig == 1
+
+
 def test_tok_stressed_no_readings():
     t = udar.Token('слово')
     assert '\u0301' in t.stressed(guess=True)
@@ -1,5 +1,9 @@
 """Python wrapper of UDAR, a part-of-speech tagger for (accented) Russian"""
 
+from importlib import import_module as _import_module
+import sys as _sys
+from types import ModuleType as _ModuleType
+
 # NOTE: The order is hierarchical; do not alphabetize!
 
 from .tag import *  # noqa: F401, F403
@@ -14,4 +18,24 @@ from .convenience import *  # noqa: F401, F403
 from .misc import *  # noqa: F401, F403
 from .transliterate import *  # noqa: F401, F403
 
-from .features import *  # noqa: F401, F403
+# `from udar import *` still includes ALL, which is imported on demand
+__all__ = [name for name in dir() if not name.startswith('_')]
+__all__ += ['ALL']  # noqa: F405
+
+
+class _LazyModule(_ModuleType):
+    """Import the features package (which is slow to import, since it defines
+    hundreds of features) only when it is first used, e.g. ``udar.ALL``.
+
+    A module-level ``__getattr__`` (PEP 562) requires Python 3.7, so the
+    class of this module is replaced instead.
+    """
+    def __getattr__(self, name):
+        if name in ('ALL', 'features'):
+            features = _import_module('.features', self.__name__)
+            return features if name == 'features' else features.ALL
+        raise AttributeError(f'module {self.__name__!r} has no attribute '
+                             f'{name!r}')
+
+
+_sys.modules[__name__].__class__ = _LazyModule
@@ -2,16 +2,20 @@ import argparse
 import sys
 
 from .document import Document
+from .document import SENTENCE_SPLITTERS
 
 
 def parse_input(input_str: str, args: argparse.Namespace) -> Document:
     """Parse input string according to `args.input_type`."""
     if args.input_type == 'c':
-        return Document.from_cg3(input_str)
+        return Document.from_cg3(input_str,
+                                 sentence_splitter=args.sentence_splitter)
     elif args.input_type == 'f':
-        return Document.from_hfst(input_str)
+        return Document.from_hfst(input_str,
+                                  sentence_splitter=args.sentence_splitter)
     elif args.input_type == 'p':
-        return Document(input_str, disambiguate=args.disambiguate)
+        return Document(input_str, disambiguate=args.disambiguate,
+                        sentence_splitter=args.sentence_splitter)
     else:
         raise NotImplementedError
 
@@ -67,6 +71,10 @@ parser.add_argument('-s', '--stress', help='How to select between ambiguous '
                     'stress possibilities (Used in conjunction with -P)',
                     choices=['safe', 'freq', 'rand', 'all', 'none'],
                     default='safe')
+parser.add_argument('--sentence-splitter', help='How to split the input into '
+                    'sentences. The stanza model is the most accurate, but '
+                    'it takes several seconds to load. (default: stanza)',
+                    choices=SENTENCE_SPLITTERS, default='stanza')
 parser.add_argument('-v', '--verbose',
                     help='More extensive output (for debugging)',
                     action='count', default=0)
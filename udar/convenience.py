@@ -6,7 +6,6 @@ from typing import List
 from typing import Union
 
 from .document import Document
-from .features import ALL
 from .fsts import get_analyzer
 from .fsts import get_generator
 from .misc import destress
@@ -122,5 +121,6 @@ def stress_distractors(word: str):
 
 
 def readability_measures(input_text: Union[str, List[Sentence], Document]):
+    from .features import ALL  # importing all features is slow
     doc = Document(input_text)
     return ALL(doc, category_names=['Readability formula'])
@@ -1,7 +1,9 @@
 from collections import Counter
 from itertools import chain
+import pickle
 import re
 from sys import stderr
+from typing import Callable
 from typing import Dict
 from typing import Iterable
 from typing import Iterator
@@ -15,7 +17,11 @@ from warnings import warn
 # import nltk (this happens covertly by unpickling nltk_punkt_russian.pkl)
 
 from .fsts import get_analyzer
+from .misc import get_stanza_pretokenized_pipeline
 from .misc import get_stanza_sent_tokenizer
+from .misc import RSRC_PATH
+from .sentence import cg3_disambiguate
+from .sentence import get_tokenizer
 from .sentence import Sentence
 from .tok import Token
 
@@ -26,26 +32,250 @@ NEWLINE = '\n'  # for use in f-strings
 
 src = '''Мы все говорили кое о чем с тобой, но по-моему, все это ни к чему, как он сказал. Он стоял в парке и. Ленина.'''  # noqa: E501
 
-# Obsolete??
-# def get_sent_tokenizer():
-#     global nltk_sent_tokenizer
-#     try:
-#         return nltk_sent_tokenizer
-#     except NameError:
-#         with open(f'{RSRC_PATH}nltk_punkt_russian.pkl', 'rb') as f:
-#             nltk_sent_tokenizer = pickle.load(f)
-#         return nltk_sent_tokenizer
-
-
-def _str2Sentences(input_str, **kwargs) -> List[Sentence]:
+SentenceSplitter = Callable[[str], List[str]]
+SENTENCE_SPLITTERS = ('stanza', 'punkt', 'rule', 'tokens')
+_punkt_splitter = None
+
+# Abbreviations (lowercase, without the final period) that are usually not
+# the end of a sentence, even if the next word is capitalized
+abbreviations = {'акад', 'в', 'вв', 'г', 'гг', 'гл', 'др', 'доц', 'жен',
+                 'им', 'коп', 'кв', 'л', 'млн', 'млрд', 'муж', 'напр', 'о',
+                 'обл', 'п', 'пер', 'пос', 'пр', 'проф', 'просп', 'р', 'рис',
+                 'руб', 'с', 'см', 'ср', 'ст', 'стр', 'т', 'тыс', 'ул', 'ч'}
+# Sentence-final punctuation (and closing quotes/brackets), followed by
+# whitespace and something that can start a sentence
+sent_end_re = re.compile(r"""([.!?…]+)["'»”)\]]*
+                             (?=\s+["'«„“(\[–—-]*\s*[А-ЯЁA-Z0-9])""",
+                         flags=re.X)
+paragraph_re = re.compile(r'\n\s*\n')
+sent_final_tok_re = re.compile(r'[.!?…]+')
+closing_toks = {'"', "'", '»', '”', ')', ']'}
+# Maximum number of characters sent to the tokenizer in one line. A pty (used
+# by the 'pexpect' tokenizer) cuts off lines longer than 4096 bytes, and a
+# Cyrillic character takes 2 bytes in UTF-8.
+MAX_TOKENIZER_LINE = 1000
+
+
+def rule_sent_split(text: str) -> List[str]:
+    """Split ``text`` into sentences using regular expressions.
+
+    Sentences end at paragraph breaks, and at sentence-final punctuation
+    that is followed by a capitalized word, unless the punctuation is a
+    period after an initial or a common abbreviation (e.g. *А. С. Пушкин*,
+    *ул. Ленина*).
+    """
+    sents = []
+    for paragraph in paragraph_re.split(text):
+        start = 0
+        for match in sent_end_re.finditer(paragraph):
+            if match.group(1) == '.':
+                prev_word = re.split(r'\W+', paragraph[:match.start()])[-1]
+                if ((len(prev_word) == 1 and prev_word.isalpha())
+                        or prev_word.lower() in abbreviations):
+                    continue
+            sents.append(paragraph[start:match.end()])
+            start = match.end()
+        sents.append(paragraph[start:])
+    return [sent.strip() for sent in sents if sent.strip()]
+
+
+def _tokenizer_lines(text: str) -> Iterator[Tuple[str, bool]]:
+    """Split ``text`` into lines of at most ``MAX_TOKENIZER_LINE`` characters
+    for the tokenizer, skipping blank lines. Lines that are too long are
+    split at a space. Yield (line, whether the line begins a paragraph)
+    pairs.
+    """
+    new_paragraph = True
+    for line in text.splitlines():
+        if not line.strip():
+            new_paragraph = True
+            continue
+        while len(line) > MAX_TOKENIZER_LINE:
+            cut = line.rfind(' ', 1, MAX_TOKENIZER_LINE)
+            if cut < 0:
+                cut = MAX_TOKENIZER_LINE
+            yield line[:cut], new_paragraph
+            new_paragraph = False
+            line = line[cut:]
+        if line.strip():
+            yield line, new_paragraph
+            new_paragraph = False
+
+
+def tokenize_and_split(text: str, tokenizer=None,
+                       _analyzer=None) -> List[Tuple[str, List[str]]]:
+    """Tokenize ``text`` in a single pass, and then split the token stream
+    into sentences. Return a list of (sentence text, sentence tokens) pairs.
+
+    A sentence ends at a paragraph break (blank line), and after a token that
+    is sentence-final punctuation (or is analyzed as ``SENT`` by
+    ``_analyzer``, if given), plus any closing quotes/brackets after it,
+    unless the next token begins with a lowercase letter.
+
+    The text is sent to the tokenizer line by line (see
+    ``MAX_TOKENIZER_LINE``), in a single exchange if the tokenizer has a
+    ``tokenize_many`` method.
+
+    Parameters
+    ----------
+
+    text
+        Text to tokenize and split
+    tokenizer
+        (Optional) Tokenizer to use. (default: :py:func:`get_tokenizer`)
+    _analyzer
+        (Optional) :py:class:`Analyzer` (or a callable that returns the
+        readings of a token, as for :py:class:`Sentence`) used to look up
+        the tags of punctuation tokens
+    """
+    if tokenizer is None:
+        tokenizer = get_tokenizer()
+    lines = list(_tokenizer_lines(text))
+    if hasattr(tokenizer, 'tokenize_many'):
+        line_toks = tokenizer.tokenize_many([line for line, _ in lines])
+    else:
+        line_toks = [tokenizer(line) for line, _ in lines]
+    toks: List[str] = []
+    paragraph_starts = set()  # indices of the first token of each paragraph
+    for (line, new_paragraph), line_tok in zip(lines, line_toks):
+        if new_paragraph:
+            paragraph_starts.add(len(toks))
+        toks.extend(tok for tok in line_tok if tok)
+    final = [bool(sent_final_tok_re.fullmatch(tok)) for tok in toks]
+    if _analyzer is not None:
+        punc_toks = list(dict.fromkeys(tok for tok in toks
+                                       if not re.search(r'\w', tok)))
+        try:
+            lookup_many = _analyzer.lookup_many
+        except AttributeError:  # custom analyzer
+            analyses = [_analyzer(t) for t in punc_toks]
+        else:
+            analyses = lookup_many(punc_toks)
+        sent_toks = {tok for tok, readings in zip(punc_toks, analyses)
+                     if any(re.search(r'\+SENT(?:\+|$)', reading[0])
+                            for reading in readings)}
+        final = [is_final or tok in sent_toks
+                 for tok, is_final in zip(toks, final)]
+    # character offset of the end of each token in `text`
+    ends: List[int] = []
+    pos = 0
+    for tok in toks:
+        start = text.find(tok, pos)
+        if start < 0:  # the tokenizer changed the token
+            ends = []
+            break
+        pos = start + len(tok)
+        ends.append(pos)
+    sents = []
+    start = 0
+    i = 0
+    while i < len(toks):
+        if final[i]:
+            while (i + 1 < len(toks) and toks[i + 1] in closing_toks
+                   and i + 1 not in paragraph_starts):
+                i += 1
+            if i + 1 == len(toks) or not toks[i + 1][:1].islower():
+                sents.append((start, i + 1))
+                start = i + 1
+        if start <= i and i + 1 in paragraph_starts:
+            sents.append((start, i + 1))
+            start = i + 1
+        i += 1
+    if start < len(toks):
+        sents.append((start, len(toks)))
+    if ends:
+        text_starts = [0] + [ends[end - 1] for start, end in sents[:-1]]
+        return [(text[text_start:ends[end - 1]].strip(), toks[start:end])
+                for text_start, (start, end) in zip(text_starts, sents)]
+    return [(' '.join(toks[start:end]), toks[start:end])
+            for start, end in sents]
+
+
+def token_sent_split(text: str) -> List[str]:
+    """Split ``text`` into sentences using :py:func:`tokenize_and_split`."""
+    return [sent for sent, toks in tokenize_and_split(text)]
+
+
+def stanza_sent_split(text: str) -> List[str]:
+    """Split ``text`` into sentences using :py:mod:`stanza` 's tokenizer."""
     stanza_sent = get_stanza_sent_tokenizer()
+    return [sent.text for sent in stanza_sent(text).sentences]
+
+
+def get_punkt_sent_split() -> SentenceSplitter:
+    """Return the ``tokenize`` method of :py:mod:`nltk` 's Punkt sentence
+    tokenizer, trained for Russian (bundled with udar).
+    """
+    global _punkt_splitter
+    if _punkt_splitter is None:
+        try:
+            with open(f'{RSRC_PATH}nltk_punkt_russian.pkl', 'rb') as f:
+                _punkt_splitter = pickle.load(f)
+        except ModuleNotFoundError as e:
+            raise ModuleNotFoundError('nltk must be installed to use the '
+                                      "'punkt' sentence splitter. Try "
+                                      '`pip install nltk`.') from e
+    return _punkt_splitter.tokenize  # type: ignore
+
+
+def get_sentence_splitter(sentence_splitter: Union[str, SentenceSplitter] = 'stanza') -> SentenceSplitter:  # noqa: E501
+    """Return a function that splits a text into a list of sentences.
+
+    Parameters
+    ----------
+
+    sentence_splitter
+        One of the following, or a callable that takes a :obj:`str` and
+        returns a list of sentence strings:
+
+        * 'stanza' -- :py:mod:`stanza` 's neural tokenizer (most accurate,
+          but takes seconds to load)
+        * 'punkt' -- :py:mod:`nltk` 's Punkt tokenizer, trained for Russian
+        * 'rule' -- fast rule-based splitter, see :py:func:`rule_sent_split`
+        * 'tokens' -- tokenize the whole text once, and split the token
+          stream, see :py:func:`tokenize_and_split`. When a
+          :py:class:`Document` is split this way, its sentences are not
+          tokenized again.
+    """
+    if callable(sentence_splitter):
+        return sentence_splitter
+    elif sentence_splitter == 'stanza':
+        return stanza_sent_split
+    elif sentence_splitter == 'punkt':
+        return get_punkt_sent_split()
+    elif sentence_splitter == 'rule':
+        return rule_sent_split
+    elif sentence_splitter == 'tokens':
+        return token_sent_split
+    else:
+        raise ValueError('sentence_splitter must be a callable or one of '
+                         f'{SENTENCE_SPLITTERS}; got {sentence_splitter!r}.')
+
+
+def _str2Sentences(input_str,
+                   sentence_splitter: Union[str, SentenceSplitter] = 'stanza',
+                   **kwargs) -> List[Sentence]:
+    split_sentences = get_sentence_splitter(sentence_splitter)
     # TODO should the following 2 lines be solved in tokenizer's pmscript?
     input_str = input_str.replace('#', ' ')  # The `#` char is ignored by udar
     input_str = re.sub(r'([^аэоуыяеёюи])[\u0300\u0301]', r'\1', input_str,
                        flags=re.I)
-    stanza_doc = stanza_sent(input_str)
-    return [Sentence(sent.text, id=i, **kwargs)
-            for i, sent in enumerate(stanza_doc.sentences)]
+    tokenizer = kwargs.get('tokenizer')
+    if tokenizer is None:
+        tokenizer = get_tokenizer()
+    if sentence_splitter == 'tokens' and kwargs.get('tokenize', True):
+        # Tokenize the whole text once, and reuse the tokens of each sentence
+        sents = tokenize_and_split(input_str, tokenizer=tokenizer,
+                                   _analyzer=kwargs.get('_analyzer'))
+        return [Sentence(text, id=i, _toks=toks, **kwargs)
+                for i, (text, toks) in enumerate(sents)]
+    texts = split_sentences(input_str)
+    if kwargs.get('tokenize', True) and hasattr(tokenizer, 'tokenize_many'):
+        # Tokenize all sentences in a single exchange with the tokenizer
+        all_toks = tokenizer.tokenize_many(texts)  # type: ignore
+        return [Sentence(text, id=i, _toks=toks, **kwargs)
+                for i, (text, toks) in enumerate(zip(texts, all_toks))]
+    return [Sentence(text, id=i, **kwargs) for i, text in enumerate(texts)]
 
 
 class Document:
@@ -69,6 +299,10 @@ class Document:
 
         input_text
             Text to be processed (typically a :obj:`str` )
+        sentence_splitter
+            (Optional) How to split a :obj:`str` into sentences: 'stanza'
+            (default), 'punkt', 'rule', 'tokens', or a callable. See
+            :py:func:`get_sentence_splitter`.
         \*\*kwargs
             All the same keyword arguments accepted by :py:class:`Sentence`
         """
@@ -80,7 +314,16 @@ class Document:
             if kwargs.get('analyze', True) and kwargs.get('_analyzer') is None:
                 kwargs['_analyzer'] = get_analyzer(L2_errors=kwargs.get('analyze_L2_errors', False))  # noqa: E501
             self.text = input_text
+            # Disambiguate the whole document at once, instead of sentence
+            # by sentence
+            disambiguate = kwargs.pop('disambiguate', False)
+            # Likewise, parse all sentences in batches
+            depparse = kwargs.pop('depparse', False)
             self.sentences = _str2Sentences(input_text, doc=self, **kwargs)
+            if disambiguate:
+                self.disambiguate(gram_path=kwargs.get('gram_path', ''))
+            if depparse:
+                self.depparse()
         elif ((hasattr(input_text, '__getitem__')
                or hasattr(input_text, '__iter__'))
               and isinstance(next(iter(input_text)), Sentence)):
@@ -151,7 +394,9 @@ class Document:
     #     raise NotImplementedError()
 
     @classmethod
-    def from_cg3(cls, input_stream: str, **kwargs):
+    def from_cg3(cls, input_stream: str,
+                 sentence_splitter: Union[str, SentenceSplitter] = 'stanza',
+                 **kwargs):
         r"""Construct Document from CG3 stream.
 
         Parameters
@@ -159,6 +404,9 @@ class Document:
 
         input_stream
             CG3-style analysis stream
+        sentence_splitter
+            (Optional) How to split the stream into sentences, if it has no
+            sentence annotations. See :py:func:`get_sentence_splitter`.
         \*\*kwargs
             All the same keyword arguments accepted by
             :py:class:`Sentence`
@@ -175,7 +423,9 @@ class Document:
             return cls(sentences, **kwargs)
         else:
             super_sentence = Sentence.from_cg3(input_stream, **kwargs)
-            sentences = _str2Sentences(super_sentence.text, **kwargs)
+            sentences = _str2Sentences(super_sentence.text,
+                                       sentence_splitter=sentence_splitter,
+                                       **kwargs)
             lengths = [len(s) for s in sentences]
             sents_from_cg3 = []
             base = 0
@@ -188,7 +438,9 @@ class Document:
             return cls(sents_from_cg3, **kwargs)
 
     @classmethod
-    def from_hfst(cls, input_stream: str, **kwargs):
+    def from_hfst(cls, input_stream: str,
+                  sentence_splitter: Union[str, SentenceSplitter] = 'stanza',
+                  **kwargs):
         r"""Construct Document from CG3 stream.
 
         Parameters
@@ -196,11 +448,16 @@ class Document:
 
         input_stream
             HFST-/XFST-style analysis stream
+        sentence_splitter
+            (Optional) How to split the stream into sentences. See
+            :py:func:`get_sentence_splitter`.
         \*\*kwargs
             All the same keyword arguments accepted by :py:class:`Sentence`
         """
         super_sentence = Sentence.from_hfst(input_stream, **kwargs)
-        sentences = _str2Sentences(super_sentence.text, **kwargs)
+        sentences = _str2Sentences(super_sentence.text,
+                                   sentence_splitter=sentence_splitter,
+                                   **kwargs)
         lengths = [len(s) for s in sentences]
         sents_from_cg3 = []
         base = 0
@@ -212,19 +469,88 @@ class Document:
             base += length
         return cls(sents_from_cg3, **kwargs)
 
-    def disambiguate(self, **kwargs):
-        r"""Use Constraint Grammar to remove as many ambiguous readings as
+    def disambiguate(self, gram_path: str = '', traces: bool = True,
+                     force: str = None, persistent: bool = True,
+                     batch_size: Optional[int] = None):
+        """Use Constraint Grammar to remove as many ambiguous readings as
         possible.
 
+        Sentences are sent to ``vislcg3`` in batches, each batch in a single
+        round trip. If the output for any sentence does not match its number
+        of tokens, the remaining sentences are still disambiguated, and then
+        an :py:exc:`AssertionError` is raised that lists each mismatched
+        sentence.
+
         Parameters
         ----------
 
-        \*\*kwargs
-            All the same keyword arguments accepted by
-            :py:meth:`Sentence.disambiguate`
+        gram_path
+            Path to Constraint Grammar file. (default: the bundled grammar)
+        traces
+            Whether to keep track of readings that are *removed* by the
+            Constraint Grammar. (default: True)
+        force
+            See :py:meth:`Sentence.disambiguate`
+        persistent
+            See :py:meth:`Sentence.disambiguate`
+        batch_size
+            Number of sentences per round trip to ``vislcg3``. If ``None``,
+            the whole document is sent at once. (default: None)
+        """
+        if batch_size is None:
+            batch_size = max(len(self.sentences), 1)
+        elif batch_size < 1:
+            raise ValueError(f'batch_size must be positive, got {batch_size}')
+        errors = []
+        for base in range(0, len(self.sentences), batch_size):
+            batch = self.sentences[base:base + batch_size]
+            outputs = cg3_disambiguate([sent.cg3_str() for sent in batch],
+                                       gram_path=gram_path, traces=traces,
+                                       persistent=persistent)
+            for i, (sent, output) in enumerate(zip(batch, outputs),
+                                               start=base):
+                try:
+                    sent._apply_cg3(output, force=force)
+                except AssertionError as e:
+                    errors.append(f'Sentence {i} ({sent.id!r}): {e}')
+        if errors:
+            raise AssertionError(f'{len(errors)} sentence(s) could not be '
+                                 'disambiguated:\n\n' + '\n\n'.join(errors))
+
+    def depparse(self, batch_size: Optional[int] = None):
+        """Get dependency parse of every sentence using :py:mod:`stanza`.
+
+        The tokens of all sentences that have not been parsed yet are sent to
+        the pretokenized stanza pipeline in batches, each batch in a single
+        call, and the resulting stanza sentences are distributed back to each
+        :py:class:`Sentence`. This avoids stanza's per-call overhead, which
+        dominates when parsing short sentences one at a time.
+
+        Parameters
+        ----------
+
+        batch_size
+            Number of sentences per call to :py:mod:`stanza`. If ``None``,
+            the whole document is parsed at once. (default: None)
         """
+        if batch_size is None:
+            batch_size = max(len(self.sentences), 1)
+        elif batch_size < 1:
+            raise ValueError(f'batch_size must be positive, got {batch_size}')
+        unparsed = [sent for sent in self.sentences
+                    if sent._stanza_sent is None and sent.tokens]
+        if unparsed:
+            stanza_pipeline = get_stanza_pretokenized_pipeline()
+        for base in range(0, len(unparsed), batch_size):
+            batch = unparsed[base:base + batch_size]
+            stanza_doc = stanza_pipeline([[tok.text for tok in sent.tokens]
+                                          for sent in batch])
+            assert len(stanza_doc.sentences) == len(batch), f'sentence count mismatch: {len(batch)} {len(stanza_doc.sentences)}'  # noqa: E501
+            for sent, stanza_sent in zip(batch, stanza_doc.sentences):
+                sent._stanza_sent = stanza_sent
         for sent in self.sentences:
-            sent.disambiguate(**kwargs)
+            if sent._stanza_sent is not None:
+                sent.depparse()  # link each Token to its stanza token
 
     def phonetic(self, **kwargs) -> str:
         r"""Return original text converted to phonetic transcription (Russian
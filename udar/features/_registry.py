@@ -0,0 +1,5889 @@
+# flake8: noqa
+# Generated by `python3 dev/make_feature_registry.py`. Do not edit!
+# name: (category, func, default_kwargs, depends_on, unresolved_deps)
+
+from typing import Any
+from typing import Dict
+from typing import Tuple
+
+nan = float('nan')
+
+VERSION = 3
+
+FEATURES: Dict[str, Tuple[Any, ...]] = {
+    'A_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Abbr_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Acc_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Adv_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'All_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'AnIn_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Anim_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Att_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'CC_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'CLB_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'COMMA_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'CS_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Cmpar_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Cmpnd_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Coll_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Count_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'DASH_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Dat_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Def_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Dem_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Der_PrsAct_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Der_PrsPss_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Der_PstAct_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Der_PstPss_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Der_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Det_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Elid_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Epenth_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Err_L2_FV_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Err_L2_NoFV_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Err_L2_Pal_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Err_L2_SRo_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Err_L2_SRy_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Err_L2_ii_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Err_Orth_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Fac_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Fem_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Flesch_Kincaid_Grade_rus': ('Readability formula',
+        'udar.features.readability.Flesch_Kincaid_Grade_rus',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['words_per_sent', 'sylls_per_word'],
+        []),
+    'Flesch_Kincaid_rus': ('Readability formula',
+        'udar.features.readability.Flesch_Kincaid_rus',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['words_per_sent', 'sylls_per_word'],
+        []),
+    'Fut_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Gen2_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Gen_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'IV_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Imp_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Impf_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Imprs_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Inan_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Indef_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Inf_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Ins_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Interj_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Interr_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'LEFT_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'LPAR_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'LQUOT_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Leng_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Loc2_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Loc_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Lxc_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'MFN_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Msc_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'N_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Neg_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Neu_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Nom_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Num_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Ord_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'PObj_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'PUNCT_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Paren_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Pass_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Pcle_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Perf_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Pers_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Pl1_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Pl2_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Pl3_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Pl_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Po_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Pos_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Pr_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Prb_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Prcnt_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Pred_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Pron_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Prop_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'PrsAct_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'PrsPss_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Prs_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'PstAct_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'PstPss_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Pst_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'QUOT_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'RIGHT_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'RPAR_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'RQUOT_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Recip_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Refl_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Rel_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'SENT_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Sem_Alt_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Sem_Ant_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Sem_Pat_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Sem_Sur_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Sg1_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Sg2_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Sg3_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Sg_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Sint_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Symbol_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'TV_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Aff_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Agr_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Anat_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Anc_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Ant_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Aug_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Bio_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Bot_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Chem_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Dia_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Dim_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Flk_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Geo_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Gram_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Hist_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Law_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Lit_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Mari_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Math_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Med_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Mus_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_NG_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Obs_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Old_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Poet_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Prof_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Relig_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Tech_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Use_Zoo_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'V_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    'Voc_present': ('Morphology',
+        'udar.features.morphology.Tag_present',
+        {},
+        ['_token_stats'],
+        []),
+    '_dependency_lengths': ('_prior',
+        'udar.features.priors._dependency_lengths',
+        {'has_tag': '', 'rmv_punc': True},
+        ['_filter_toks'],
+        []),
+    '_filter_positions': ('_prior',
+        'udar.features.priors._filter_positions',
+        {'has_tag': '', 'rmv_punc': False},
+        ['_token_stats', '_tag_index'],
+        []),
+    '_filter_str': ('_prior',
+        'udar.features.priors._filter_str',
+        {'lower': False, 'rmv_punc': False, 'rmv_whitespace': False, 'uniq': False},
+        [],
+        []),
+    '_filter_surface_strs': ('_prior',
+        'udar.features.priors._filter_surface_strs',
+        {'lower': False, 'rmv_punc': False},
+        ['_token_stats'],
+        []),
+    '_filter_toks': ('_prior',
+        'udar.features.priors._filter_toks',
+        {'has_tag': '', 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    '_lemma_frequencies': ('_prior',
+        'udar.features.priors._lemma_frequencies',
+        {'has_tag': '', 'rmv_punc': True},
+        ['_token_stats', '_filter_positions', '_lemma_records'],
+        []),
+    '_lemma_frequency_ranks': ('_prior',
+        'udar.features.priors._lemma_frequency_ranks',
+        {'has_tag': '', 'rmv_punc': True},
+        ['_token_stats', '_filter_positions', '_lemma_records'],
+        []),
+    '_lemma_records': ('_prior',
+        'udar.features.priors._lemma_records',
+        {},
+        ['_token_stats'],
+        []),
+    '_sentence_dependency_path_lengths': ('_prior',
+        'udar.features.priors._sentence_dependency_path_lengths',
+        {},
+        ['_sentence_dependency_paths'],
+        []),
+    '_sentence_dependency_paths': ('_prior',
+        'udar.features.priors._sentence_dependency_paths',
+        {},
+        [],
+        []),
+    '_tag_index': ('_prior',
+        'udar.features.priors._tag_index',
+        {},
+        ['_token_stats'],
+        []),
+    '_token_frequencies': ('_prior',
+        'udar.features.priors._token_frequencies',
+        {'has_tag': '', 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    '_token_frequency_ranks': ('_prior',
+        'udar.features.priors._token_frequency_ranks',
+        {'has_tag': '', 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    '_token_stats': ('_prior',
+        'udar.features.priors._token_stats',
+        {},
+        [],
+        []),
+    'avg_dependency_depth': ('Syntax',
+        'udar.features.syntax.avg_dependency_depth',
+        {'zero_div_val': nan},
+        ['_sentence_dependency_path_lengths'],
+        []),
+    'avg_dependency_length': ('Syntax',
+        'udar.features.syntax.avg_dependency_length',
+        {'has_tag': '', 'rmv_punc': False, 'zero_div_val': nan},
+        ['_dependency_lengths'],
+        []),
+    'avg_dependency_length_A': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Abbr': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Acc': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Adv': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_All': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_AnIn': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Anim': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Att': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_CC': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_CLB': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_COMMA': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_CS': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Cmpar': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Cmpnd': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Coll': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Count': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_DASH': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Dat': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Def': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Dem': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Der': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Der_PrsAct': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Der_PrsPss': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Der_PstAct': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Der_PstPss': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Det': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Elid': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Epenth': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Err_L2_FV': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Err_L2_NoFV': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Err_L2_Pal': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Err_L2_SRo': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Err_L2_SRy': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Err_L2_ii': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Err_Orth': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Fac': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Fem': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Fut': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Gen': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Gen2': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_IV': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Imp': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Impf': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Imprs': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Inan': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Indef': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Inf': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Ins': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Interj': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Interr': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_LEFT': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_LPAR': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_LQUOT': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Leng': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Loc': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Loc2': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Lxc': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_MFN': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Msc': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_N': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Neg': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Neu': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Nom': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Num': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Ord': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_PObj': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_PUNCT': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Paren': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Pass': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Pcle': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Perf': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Pers': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Pl': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Pl1': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Pl2': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Pl3': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Po': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Pos': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Pr': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Prb': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Prcnt': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Pred': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Pron': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Prop': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Prs': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_PrsAct': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_PrsPss': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Pst': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_PstAct': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_PstPss': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_QUOT': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_RIGHT': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_RPAR': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_RQUOT': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Recip': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Refl': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Rel': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_SENT': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Sem_Alt': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Sem_Ant': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Sem_Pat': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Sem_Sur': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Sg': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Sg1': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Sg2': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Sg3': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Sint': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Symbol': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_TV': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Aff': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Agr': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Anat': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Anc': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Ant': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Aug': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Bio': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Bot': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Chem': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Dia': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Dim': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Flk': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Geo': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Gram': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Hist': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Law': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Lit': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Mari': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Math': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Med': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Mus': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_NG': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Obs': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Old': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Poet': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Prof': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Relig': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Tech': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Use_Zoo': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_V': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_dependency_length_Voc': ('Syntax',
+        'udar.features.syntax.avg_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['avg_dependency_length'],
+        []),
+    'avg_of_max_dependency_depths': ('Syntax',
+        'udar.features.syntax.avg_of_max_dependency_depths',
+        {'zero_div_val': nan},
+        ['_sentence_dependency_path_lengths'],
+        []),
+    'bilog_type_token_ratio': ('Lexical variation',
+        'udar.features.lexical_variability.bilog_type_token_ratio',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types', 'num_tokens'],
+        []),
+    'chars_per_content_word': ('Normalized length',
+        'udar.features.normalized_length.chars_per_content_word',
+        {'rmv_punc': True, 'uniq': False, 'zero_div_val': nan},
+        ['chars_per_word'],
+        []),
+    'chars_per_sent': ('Sentence',
+        'udar.features.sentence.chars_per_sent',
+        {'lower': False, 'rmv_punc': False, 'rmv_whitespace': True, 'uniq': False, 'zero_div_val': nan},
+        ['num_chars', 'num_sents'],
+        []),
+    'chars_per_word': ('Normalized length',
+        'udar.features.normalized_length.chars_per_word',
+        {'has_tag': '', 'rmv_punc': True, 'uniq': False, 'zero_div_val': nan},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'content_lemma_type_token_ratio': ('Lexical variation',
+        'udar.features.lexical_variability.content_lemma_type_token_ratio',
+        {'has_tag': '', 'lower': False, 'rmv_punc': False, 'zero_div_val': nan},
+        ['lemma_type_token_ratio'],
+        []),
+    'coord_conj_per_sent': ('Sentence',
+        'udar.features.sentence.coord_conj_per_sent',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_CC', 'num_sents'],
+        []),
+    'corrected_type_token_ratio': ('Lexical variation',
+        'udar.features.lexical_variability.corrected_type_token_ratio',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types', 'num_tokens'],
+        []),
+    'definitions_per_sent': ('Discourse',
+        'udar.features.discourse.definitions_per_sent',
+        {'zero_div_val': nan},
+        ['num_definitions', 'num_sents'],
+        []),
+    'definitions_per_token': ('Discourse',
+        'udar.features.discourse.definitions_per_token',
+        {'lower': False, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_definitions', 'num_tokens'],
+        []),
+    'dialog_punc_per_token': ('Discourse',
+        'udar.features.discourse.dialog_punc_per_token',
+        {'lower': False, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_dialog_punc', 'num_tokens'],
+        []),
+    'lemma_type_token_ratio': ('Lexical variation',
+        'udar.features.lexical_variability.lemma_type_token_ratio',
+        {'has_tag': '', 'lower': False, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_lemma_types', 'num_tokens'],
+        []),
+    'matskovskij': ('Readability formula',
+        'udar.features.readability.matskovskij',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['words_per_sent', 'prcnt_words_over_3_sylls'],
+        []),
+    'max_chars_per_content_word': ('Normalized length',
+        'udar.features.normalized_length.max_chars_per_content_word',
+        {'rmv_punc': True, 'zero_div_val': nan},
+        ['max_chars_per_word'],
+        []),
+    'max_chars_per_word': ('Normalized length',
+        'udar.features.normalized_length.max_chars_per_word',
+        {'has_tag': '', 'rmv_punc': True, 'zero_div_val': nan},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'max_dependency_depth': ('Syntax',
+        'udar.features.syntax.max_dependency_depth',
+        {'zero_div_val': nan},
+        ['_sentence_dependency_path_lengths'],
+        []),
+    'max_dependency_length': ('Syntax',
+        'udar.features.syntax.max_dependency_length',
+        {'has_tag': '', 'rmv_punc': False, 'zero_div_val': nan},
+        ['_dependency_lengths'],
+        []),
+    'max_dependency_length_A': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Abbr': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Acc': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Adv': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_All': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_AnIn': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Anim': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Att': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_CC': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_CLB': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_COMMA': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_CS': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Cmpar': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Cmpnd': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Coll': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Count': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_DASH': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Dat': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Def': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Dem': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Der': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Der_PrsAct': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Der_PrsPss': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Der_PstAct': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Der_PstPss': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Det': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Elid': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Epenth': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Err_L2_FV': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Err_L2_NoFV': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Err_L2_Pal': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Err_L2_SRo': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Err_L2_SRy': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Err_L2_ii': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Err_Orth': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Fac': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Fem': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Fut': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Gen': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Gen2': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_IV': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Imp': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Impf': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Imprs': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Inan': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Indef': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Inf': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Ins': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Interj': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Interr': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_LEFT': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_LPAR': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_LQUOT': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Leng': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Loc': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Loc2': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Lxc': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_MFN': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Msc': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_N': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Neg': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Neu': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Nom': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Num': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Ord': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_PObj': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_PUNCT': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Paren': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Pass': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Pcle': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Perf': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Pers': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Pl': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Pl1': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Pl2': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Pl3': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Po': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Pos': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Pr': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Prb': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Prcnt': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Pred': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Pron': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Prop': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Prs': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_PrsAct': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_PrsPss': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Pst': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_PstAct': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_PstPss': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_QUOT': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_RIGHT': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_RPAR': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_RQUOT': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Recip': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Refl': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Rel': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_SENT': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Sem_Alt': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Sem_Ant': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Sem_Pat': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Sem_Sur': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Sg': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Sg1': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Sg2': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Sg3': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Sint': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Symbol': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_TV': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Aff': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Agr': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Anat': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Anc': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Ant': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Aug': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Bio': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Bot': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Chem': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Dia': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Dim': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Flk': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Geo': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Gram': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Hist': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Law': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Lit': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Mari': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Math': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Med': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Mus': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_NG': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Obs': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Old': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Poet': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Prof': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Relig': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Tech': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Use_Zoo': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_V': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_dependency_length_Voc': ('Syntax',
+        'udar.features.syntax.max_dependency_length_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['max_dependency_length'],
+        []),
+    'max_morphs_per_content_word': ('Normalized length',
+        'udar.features.normalized_length.max_morphs_per_content_word',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'max_morphs_per_word': ('Normalized length',
+        'udar.features.normalized_length.max_morphs_per_word',
+        {'has_tag': '', 'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['_token_stats', '_filter_positions', '_lemma_records'],
+        []),
+    'max_of_avg_dependency_depths': ('Syntax',
+        'udar.features.syntax.max_of_avg_dependency_depths',
+        {'zero_div_val': nan},
+        ['_sentence_dependency_path_lengths'],
+        []),
+    'max_sylls_per_content_word': ('Normalized length',
+        'udar.features.normalized_length.max_sylls_per_content_word',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'max_sylls_per_word': ('Normalized length',
+        'udar.features.normalized_length.max_sylls_per_word',
+        {'has_tag': '', 'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'mean_content_lemma_frequency': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.mean_content_lemma_frequency',
+        {'rmv_punc': True, 'zero_div_val': nan},
+        [],
+        []),
+    'mean_content_lemma_frequency_rank': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.mean_content_lemma_frequency_rank',
+        {'rmv_punc': True, 'zero_div_val': nan},
+        [],
+        []),
+    'mean_lemma_frequency': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.mean_lemma_frequency',
+        {'has_tag': '', 'rmv_punc': True, 'zero_div_val': nan},
+        ['_lemma_frequencies'],
+        []),
+    'mean_lemma_frequency_rank': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.mean_lemma_frequency_rank',
+        {'has_tag': '', 'rmv_punc': True, 'zero_div_val': nan},
+        ['_lemma_frequency_ranks'],
+        []),
+    'mean_token_frequency': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.mean_token_frequency',
+        {'has_tag': '', 'rmv_punc': True, 'zero_div_val': nan},
+        ['_token_frequencies'],
+        []),
+    'mean_token_frequency_rank': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.mean_token_frequency_rank',
+        {'has_tag': '', 'rmv_punc': True, 'zero_div_val': nan},
+        ['_token_frequency_ranks'],
+        []),
+    'med_content_lemma_frequency': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.med_content_lemma_frequency',
+        {'rmv_punc': True, 'zero_div_val': nan},
+        [],
+        []),
+    'med_lemma_frequency': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.med_lemma_frequency',
+        {'has_tag': '', 'rmv_punc': True, 'zero_div_val': nan},
+        ['_lemma_frequencies'],
+        []),
+    'med_token_frequency': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.med_token_frequency',
+        {'has_tag': '', 'rmv_punc': True, 'zero_div_val': nan},
+        ['_token_frequencies'],
+        []),
+    'min_content_lemma_frequency': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.min_content_lemma_frequency',
+        {'rmv_punc': True, 'zero_div_val': nan},
+        [],
+        []),
+    'min_lemma_frequency': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.min_lemma_frequency',
+        {'has_tag': '', 'rmv_punc': True, 'zero_div_val': nan},
+        ['_lemma_frequencies'],
+        []),
+    'min_token_frequency': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.min_token_frequency',
+        {'has_tag': '', 'rmv_punc': True, 'zero_div_val': nan},
+        ['_token_frequencies'],
+        []),
+    'morphs_per_content_word': ('Normalized length',
+        'udar.features.normalized_length.morphs_per_content_word',
+        {'rmv_punc': True, 'zero_div_val': nan},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'morphs_per_word': ('Normalized length',
+        'udar.features.normalized_length.morphs_per_word',
+        {'has_tag': '', 'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['_token_stats', '_filter_positions', '_lemma_records'],
+        []),
+    'nominal_verb_lemma_ratio': ('Lexical variation',
+        'udar.features.lexical_variability.nominal_verb_lemma_ratio',
+        {'lower': False, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_lemma_types'],
+        []),
+    'nominal_verb_ratio': ('Lexical variation',
+        'udar.features.lexical_variability.nominal_verb_ratio',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['_filter_toks'],
+        []),
+    'nominal_verb_type_ratio': ('Lexical variation',
+        'udar.features.lexical_variability.nominal_verb_type_ratio',
+        {'lower': False, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_N', 'num_types_A', 'num_types_V'],
+        []),
+    'nominal_verb_type_token_ratio': ('Lexical variation',
+        'udar.features.lexical_variability.nominal_verb_type_token_ratio',
+        {'lower': False, 'rmv_punc': False, 'zero_div_val': nan},
+        ['type_token_ratio_N', 'type_token_ratio_A', 'type_token_ratio_V'],
+        []),
+    'num_abstract_nouns': ('Morphology',
+        'udar.features.morphology.num_abstract_nouns',
+        {'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_chars': ('Absolute length',
+        'udar.features.absolute_length.num_chars',
+        {'lower': False, 'rmv_punc': False, 'rmv_whitespace': True, 'uniq': False},
+        ['_filter_str'],
+        []),
+    'num_content_tokens_over_1_chars': ('Absolute length',
+        'udar.features.absolute_length.num_content_tokens_over_n_chars',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_content_tokens_over_1_sylls': ('Absolute length',
+        'udar.features.absolute_length.num_content_tokens_over_n_sylls',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_content_tokens_over_2_chars': ('Absolute length',
+        'udar.features.absolute_length.num_content_tokens_over_n_chars',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_content_tokens_over_2_sylls': ('Absolute length',
+        'udar.features.absolute_length.num_content_tokens_over_n_sylls',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_content_tokens_over_3_chars': ('Absolute length',
+        'udar.features.absolute_length.num_content_tokens_over_n_chars',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_content_tokens_over_3_sylls': ('Absolute length',
+        'udar.features.absolute_length.num_content_tokens_over_n_sylls',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_content_tokens_over_4_chars': ('Absolute length',
+        'udar.features.absolute_length.num_content_tokens_over_n_chars',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_content_tokens_over_4_sylls': ('Absolute length',
+        'udar.features.absolute_length.num_content_tokens_over_n_sylls',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_content_tokens_over_5_chars': ('Absolute length',
+        'udar.features.absolute_length.num_content_tokens_over_n_chars',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_content_tokens_over_5_sylls': ('Absolute length',
+        'udar.features.absolute_length.num_content_tokens_over_n_sylls',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_content_tokens_over_6_chars': ('Absolute length',
+        'udar.features.absolute_length.num_content_tokens_over_n_chars',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_content_tokens_over_6_sylls': ('Absolute length',
+        'udar.features.absolute_length.num_content_tokens_over_n_sylls',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_content_tokens_over_7_chars': ('Absolute length',
+        'udar.features.absolute_length.num_content_tokens_over_n_chars',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_content_tokens_over_7_sylls': ('Absolute length',
+        'udar.features.absolute_length.num_content_tokens_over_n_sylls',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_definitions': ('Absolute length',
+        'udar.features.absolute_length.num_definitions',
+        {},
+        [],
+        []),
+    'num_dialog_punc': ('Absolute length',
+        'udar.features.absolute_length.num_dialog_punc',
+        {},
+        [],
+        []),
+    'num_lemma_types': ('Absolute length',
+        'udar.features.absolute_length.num_lemma_types',
+        {'has_tag': '', 'lower': False, 'method': 'stanza', 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_propositions': ('Absolute length',
+        'udar.features.absolute_length.num_propositions',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_sents': ('Absolute length',
+        'udar.features.absolute_length.num_sents',
+        {},
+        [],
+        []),
+    'num_sylls': ('Absolute length',
+        'udar.features.absolute_length.num_sylls',
+        {},
+        [],
+        []),
+    'num_tokens': ('Absolute length',
+        'udar.features.absolute_length.num_tokens',
+        {'lower': False, 'rmv_punc': False},
+        ['_filter_surface_strs'],
+        []),
+    'num_tokens_A': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Abbr': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Acc': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Adv': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_All': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_AnIn': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Anim': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Att': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_CC': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_CLB': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_COMMA': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_CS': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Cmpar': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Cmpnd': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Coll': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Count': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_DASH': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Dat': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Def': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Dem': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Der': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Der_PrsAct': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Der_PrsPss': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Der_PstAct': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Der_PstPss': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Det': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Elid': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Epenth': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Err_L2_FV': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Err_L2_NoFV': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Err_L2_Pal': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Err_L2_SRo': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Err_L2_SRy': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Err_L2_ii': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Err_Orth': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Fac': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Fem': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Fut': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Gen': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Gen2': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_IV': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Imp': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Impf': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Imprs': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Inan': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Indef': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Inf': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Ins': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Interj': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Interr': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_LEFT': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_LPAR': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_LQUOT': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Leng': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Loc': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Loc2': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Lxc': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_MFN': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Msc': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_N': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Neg': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Neu': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Nom': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Num': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Ord': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_PObj': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_PUNCT': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Paren': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Pass': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Pcle': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Perf': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Pers': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Pl': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Pl1': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Pl2': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Pl3': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Po': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Pos': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Pr': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Prb': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Prcnt': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Pred': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Pron': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Prop': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Prs': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_PrsAct': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_PrsPss': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Pst': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_PstAct': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_PstPss': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_QUOT': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_RIGHT': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_RPAR': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_RQUOT': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Recip': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Refl': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Rel': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_SENT': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Sem_Alt': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Sem_Ant': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Sem_Pat': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Sem_Sur': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Sg': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Sg1': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Sg2': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Sg3': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Sint': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Symbol': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_TV': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Aff': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Agr': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Anat': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Anc': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Ant': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Aug': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Bio': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Bot': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Chem': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Dia': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Dim': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Flk': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Geo': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Gram': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Hist': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Law': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Lit': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Mari': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Math': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Med': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Mus': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_NG': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Obs': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Old': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Poet': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Prof': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Relig': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Tech': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Use_Zoo': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_V': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_Voc': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_Tag',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_ANIMACY': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_ASPECT': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_CASE': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_CONFIDENCE': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_DERIVATION': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_ERROR': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_GENDER': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_L2ERROR': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_MOOD': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_NUMBER': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_NUMBERPERSON': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_PARTICIPLE': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_PHON': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_PUNCT': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_SEMANTIC': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_SYNTACTIC': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_SYNTAX': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_TENSE': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_TRANSITIVITY': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_USE': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_VOICE': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat____': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_ms_feat_subPOS': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_ms_feat',
+        {'rmv_punc': False},
+        ['_filter_positions'],
+        []),
+    'num_tokens_over_1_chars': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_over_n_chars',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_tokens_over_1_sylls': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_over_n_sylls',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_tokens_over_2_chars': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_over_n_chars',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_tokens_over_2_sylls': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_over_n_sylls',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_tokens_over_3_chars': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_over_n_chars',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_tokens_over_3_sylls': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_over_n_sylls',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_tokens_over_4_chars': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_over_n_chars',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_tokens_over_4_sylls': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_over_n_sylls',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_tokens_over_5_chars': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_over_n_chars',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_tokens_over_5_sylls': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_over_n_sylls',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_tokens_over_6_chars': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_over_n_chars',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_tokens_over_6_sylls': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_over_n_sylls',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_tokens_over_7_chars': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_over_n_chars',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_tokens_over_7_sylls': ('Absolute length',
+        'udar.features.absolute_length.num_tokens_over_n_sylls',
+        {'lower': False, 'rmv_punc': True},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types': ('Absolute length',
+        'udar.features.absolute_length.num_types',
+        {'lower': True, 'rmv_punc': False},
+        ['_filter_surface_strs'],
+        []),
+    'num_types_A': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Abbr': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Acc': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Adv': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_All': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_AnIn': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Anim': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Att': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_CC': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_CLB': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_COMMA': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_CS': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Cmpar': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Cmpnd': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Coll': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Count': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_DASH': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Dat': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Def': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Dem': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Der': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Der_PrsAct': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Der_PrsPss': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Der_PstAct': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Der_PstPss': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Det': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Elid': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Epenth': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Err_L2_FV': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Err_L2_NoFV': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Err_L2_Pal': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Err_L2_SRo': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Err_L2_SRy': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Err_L2_ii': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Err_Orth': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Fac': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Fem': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Fut': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Gen': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Gen2': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_IV': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Imp': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Impf': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Imprs': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Inan': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Indef': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Inf': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Ins': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Interj': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Interr': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_LEFT': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_LPAR': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_LQUOT': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Leng': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Loc': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Loc2': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Lxc': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_MFN': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Msc': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_N': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Neg': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Neu': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Nom': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Num': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Ord': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_PObj': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_PUNCT': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Paren': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Pass': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Pcle': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Perf': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Pers': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Pl': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Pl1': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Pl2': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Pl3': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Po': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Pos': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Pr': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Prb': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Prcnt': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Pred': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Pron': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Prop': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Prs': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_PrsAct': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_PrsPss': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Pst': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_PstAct': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_PstPss': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_QUOT': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_RIGHT': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_RPAR': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_RQUOT': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Recip': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Refl': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Rel': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_SENT': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Sem_Alt': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Sem_Ant': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Sem_Pat': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Sem_Sur': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Sg': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Sg1': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Sg2': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Sg3': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Sint': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Symbol': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_TV': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Aff': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Agr': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Anat': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Anc': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Ant': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Aug': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Bio': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Bot': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Chem': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Dia': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Dim': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Flk': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Geo': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Gram': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Hist': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Law': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Lit': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Mari': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Math': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Med': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Mus': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_NG': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Obs': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Old': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Poet': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Prof': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Relig': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Tech': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Use_Zoo': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_V': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_Voc': ('Absolute length',
+        'udar.features.absolute_length.num_types_Tag',
+        {'lower': True, 'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_ANIMACY': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_ASPECT': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_CASE': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_CONFIDENCE': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_DERIVATION': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_ERROR': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_GENDER': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_L2ERROR': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_MOOD': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_NUMBER': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_NUMBERPERSON': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_PARTICIPLE': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_PHON': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_PUNCT': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_SEMANTIC': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_SYNTACTIC': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_SYNTAX': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_TENSE': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_TRANSITIVITY': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_USE': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_VOICE': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat____': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_types_ms_feat_subPOS': ('Morphology',
+        'udar.features.morphology.num_types_ms_feat',
+        {'rmv_punc': False},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'num_words_at_kelly_A1': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.num_words_at_kelly_level',
+        {},
+        ['_token_stats', '_lemma_records'],
+        []),
+    'num_words_at_kelly_A2': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.num_words_at_kelly_level',
+        {},
+        ['_token_stats', '_lemma_records'],
+        []),
+    'num_words_at_kelly_B1': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.num_words_at_kelly_level',
+        {},
+        ['_token_stats', '_lemma_records'],
+        []),
+    'num_words_at_kelly_B2': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.num_words_at_kelly_level',
+        {},
+        ['_token_stats', '_lemma_records'],
+        []),
+    'num_words_at_kelly_C1': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.num_words_at_kelly_level',
+        {},
+        ['_token_stats', '_lemma_records'],
+        []),
+    'num_words_at_kelly_C2': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.num_words_at_kelly_level',
+        {},
+        ['_token_stats', '_lemma_records'],
+        []),
+    'num_words_at_lexmin_A1': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.num_words_at_lexmin_level',
+        {},
+        ['_token_stats', '_lemma_records'],
+        []),
+    'num_words_at_lexmin_A2': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.num_words_at_lexmin_level',
+        {},
+        ['_token_stats', '_lemma_records'],
+        []),
+    'num_words_at_lexmin_B1': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.num_words_at_lexmin_level',
+        {},
+        ['_token_stats', '_lemma_records'],
+        []),
+    'num_words_at_lexmin_B2': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.num_words_at_lexmin_level',
+        {},
+        ['_token_stats', '_lemma_records'],
+        []),
+    'oborneva': ('Readability formula',
+        'udar.features.readability.oborneva',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['words_per_sent', 'sylls_per_word'],
+        []),
+    'prcnt_abstract_nouns': ('Normalized length',
+        'udar.features.normalized_length.prcnt_abstract_nouns',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_abstract_nouns'],
+        []),
+    'prcnt_content_words_over_1_chars': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_content_words_over_n_chars',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_content_tokens_over_1_chars'],
+        []),
+    'prcnt_content_words_over_1_sylls': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_content_words_over_n_sylls',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_content_tokens_over_1_sylls'],
+        []),
+    'prcnt_content_words_over_2_chars': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_content_words_over_n_chars',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_content_tokens_over_2_chars'],
+        []),
+    'prcnt_content_words_over_2_sylls': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_content_words_over_n_sylls',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_content_tokens_over_2_sylls'],
+        []),
+    'prcnt_content_words_over_3_chars': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_content_words_over_n_chars',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_content_tokens_over_3_chars'],
+        []),
+    'prcnt_content_words_over_3_sylls': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_content_words_over_n_sylls',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_content_tokens_over_3_sylls'],
+        []),
+    'prcnt_content_words_over_4_chars': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_content_words_over_n_chars',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_content_tokens_over_4_chars'],
+        []),
+    'prcnt_content_words_over_4_sylls': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_content_words_over_n_sylls',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_content_tokens_over_4_sylls'],
+        []),
+    'prcnt_content_words_over_5_chars': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_content_words_over_n_chars',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_content_tokens_over_5_chars'],
+        []),
+    'prcnt_content_words_over_5_sylls': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_content_words_over_n_sylls',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_content_tokens_over_5_sylls'],
+        []),
+    'prcnt_content_words_over_6_chars': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_content_words_over_n_chars',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_content_tokens_over_6_chars'],
+        []),
+    'prcnt_content_words_over_6_sylls': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_content_words_over_n_sylls',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_content_tokens_over_6_sylls'],
+        []),
+    'prcnt_content_words_over_7_chars': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_content_words_over_n_chars',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_content_tokens_over_7_chars'],
+        []),
+    'prcnt_content_words_over_7_sylls': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_content_words_over_n_sylls',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_content_tokens_over_7_sylls'],
+        []),
+    'prcnt_words_over_1_chars': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_words_over_n_chars',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_tokens_over_1_chars'],
+        []),
+    'prcnt_words_over_1_sylls': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_words_over_n_sylls',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_tokens_over_1_sylls'],
+        []),
+    'prcnt_words_over_2_chars': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_words_over_n_chars',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_tokens_over_2_chars'],
+        []),
+    'prcnt_words_over_2_sylls': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_words_over_n_sylls',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_tokens_over_2_sylls'],
+        []),
+    'prcnt_words_over_3_chars': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_words_over_n_chars',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_tokens_over_3_chars'],
+        []),
+    'prcnt_words_over_3_sylls': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_words_over_n_sylls',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_tokens_over_3_sylls'],
+        []),
+    'prcnt_words_over_4_chars': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_words_over_n_chars',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_tokens_over_4_chars'],
+        []),
+    'prcnt_words_over_4_sylls': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_words_over_n_sylls',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_tokens_over_4_sylls'],
+        []),
+    'prcnt_words_over_5_chars': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_words_over_n_chars',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_tokens_over_5_chars'],
+        []),
+    'prcnt_words_over_5_sylls': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_words_over_n_sylls',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_tokens_over_5_sylls'],
+        []),
+    'prcnt_words_over_6_chars': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_words_over_n_chars',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_tokens_over_6_chars'],
+        []),
+    'prcnt_words_over_6_sylls': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_words_over_n_sylls',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_tokens_over_6_sylls'],
+        []),
+    'prcnt_words_over_7_chars': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_words_over_n_chars',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_tokens_over_7_chars'],
+        []),
+    'prcnt_words_over_7_sylls': ('Lexical complexity',
+        'udar.features.lexical_complexity.prcnt_words_over_n_sylls',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_tokens_over_7_sylls'],
+        []),
+    'prcnt_words_over_kelly_A1': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.prcnt_words_over_kelly_level',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_words_at_kelly_A1'],
+        []),
+    'prcnt_words_over_kelly_A2': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.prcnt_words_over_kelly_level',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_words_at_kelly_A2'],
+        []),
+    'prcnt_words_over_kelly_B1': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.prcnt_words_over_kelly_level',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_words_at_kelly_B1'],
+        []),
+    'prcnt_words_over_kelly_B2': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.prcnt_words_over_kelly_level',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_words_at_kelly_B2'],
+        []),
+    'prcnt_words_over_kelly_C1': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.prcnt_words_over_kelly_level',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_words_at_kelly_C1'],
+        []),
+    'prcnt_words_over_kelly_C2': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.prcnt_words_over_kelly_level',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_words_at_kelly_C2'],
+        []),
+    'prcnt_words_over_lexmin_A1': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.prcnt_words_over_lexmin_level',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_words_at_lexmin_A1'],
+        []),
+    'prcnt_words_over_lexmin_A2': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.prcnt_words_over_lexmin_level',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_words_at_lexmin_A2'],
+        []),
+    'prcnt_words_over_lexmin_B1': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.prcnt_words_over_lexmin_level',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_words_at_lexmin_B1'],
+        []),
+    'prcnt_words_over_lexmin_B2': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.prcnt_words_over_lexmin_level',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_words_at_lexmin_B2'],
+        []),
+    'propositions_per_sent': ('Discourse',
+        'udar.features.discourse.propositions_per_sent',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_propositions', 'num_sents'],
+        []),
+    'propositions_per_token': ('Discourse',
+        'udar.features.discourse.propositions_per_token',
+        {'lower': False, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_propositions', 'num_tokens'],
+        []),
+    'root_type_token_ratio': ('Lexical variation',
+        'udar.features.lexical_variability.root_type_token_ratio',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types', 'num_tokens'],
+        []),
+    'solnyshkina_M3': ('Readability formula',
+        'udar.features.readability.solnyshkina_M3',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['words_per_sent', 'sylls_per_word', 'nominal_verb_type_ratio'],
+        []),
+    'solnyshkina_Q': ('Readability formula',
+        'udar.features.readability.solnyshkina_Q',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['words_per_sent', 'sylls_per_word', 'nominal_verb_type_token_ratio', 'nominal_verb_type_ratio'],
+        []),
+    'stdev_content_lemma_frequency': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.stdev_content_lemma_frequency',
+        {'rmv_punc': True, 'zero_div_val': nan},
+        [],
+        []),
+    'stdev_lemma_frequency': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.stdev_lemma_frequency',
+        {'has_tag': '', 'rmv_punc': True, 'zero_div_val': nan},
+        ['_lemma_frequencies'],
+        []),
+    'stdev_token_frequency': ('Lexical familiarity',
+        'udar.features.lexical_familiarity.stdev_token_frequency',
+        {'has_tag': '', 'rmv_punc': True, 'zero_div_val': nan},
+        ['_token_frequencies'],
+        []),
+    'subord_conj_per_sent': ('Sentence',
+        'udar.features.sentence.subord_conj_per_sent',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_CS', 'num_sents'],
+        []),
+    'sylls_per_content_word': ('Normalized length',
+        'udar.features.normalized_length.sylls_per_content_word',
+        {'rmv_punc': True, 'zero_div_val': nan},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'sylls_per_sent': ('Sentence',
+        'udar.features.sentence.sylls_per_sent',
+        {'zero_div_val': nan},
+        ['num_sylls', 'num_sents'],
+        []),
+    'sylls_per_word': ('Normalized length',
+        'udar.features.normalized_length.sylls_per_word',
+        {'has_tag': '', 'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['_token_stats', '_filter_positions'],
+        []),
+    'tag_ms_feat_ratio_Acc': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Acc', 'num_tokens_ms_feat_CASE'],
+        []),
+    'tag_ms_feat_ratio_All': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_All', 'num_tokens_ms_feat_subPOS'],
+        []),
+    'tag_ms_feat_ratio_AnIn': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_AnIn', 'num_tokens_ms_feat_ANIMACY'],
+        []),
+    'tag_ms_feat_ratio_Anim': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Anim', 'num_tokens_ms_feat_ANIMACY'],
+        []),
+    'tag_ms_feat_ratio_Att': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Att', 'num_tokens_ms_feat_subPOS'],
+        []),
+    'tag_ms_feat_ratio_CLB': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_CLB', 'num_tokens_ms_feat_SYNTAX'],
+        []),
+    'tag_ms_feat_ratio_COMMA': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_COMMA', 'num_tokens_ms_feat_PUNCT'],
+        []),
+    'tag_ms_feat_ratio_Cmpar': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Cmpar', 'num_tokens_ms_feat_subPOS'],
+        []),
+    'tag_ms_feat_ratio_Cmpnd': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Cmpnd', 'num_tokens_ms_feat_SYNTACTIC'],
+        []),
+    'tag_ms_feat_ratio_Coll': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Coll', 'num_tokens_ms_feat_subPOS'],
+        []),
+    'tag_ms_feat_ratio_Count': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Count', 'num_tokens_ms_feat____'],
+        []),
+    'tag_ms_feat_ratio_DASH': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_DASH', 'num_tokens_ms_feat_PUNCT'],
+        []),
+    'tag_ms_feat_ratio_Dat': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Dat', 'num_tokens_ms_feat_CASE'],
+        []),
+    'tag_ms_feat_ratio_Def': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Def', 'num_tokens_ms_feat_subPOS'],
+        []),
+    'tag_ms_feat_ratio_Dem': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Dem', 'num_tokens_ms_feat_subPOS'],
+        []),
+    'tag_ms_feat_ratio_Der': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Der', 'num_tokens_ms_feat_DERIVATION'],
+        []),
+    'tag_ms_feat_ratio_Der_PrsAct': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Der_PrsAct', 'num_tokens_ms_feat_DERIVATION'],
+        []),
+    'tag_ms_feat_ratio_Der_PrsPss': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Der_PrsPss', 'num_tokens_ms_feat_DERIVATION'],
+        []),
+    'tag_ms_feat_ratio_Der_PstAct': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Der_PstAct', 'num_tokens_ms_feat_DERIVATION'],
+        []),
+    'tag_ms_feat_ratio_Der_PstPss': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Der_PstPss', 'num_tokens_ms_feat_DERIVATION'],
+        []),
+    'tag_ms_feat_ratio_Elid': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Elid', 'num_tokens_ms_feat_PHON'],
+        []),
+    'tag_ms_feat_ratio_Epenth': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Epenth', 'num_tokens_ms_feat_PHON'],
+        []),
+    'tag_ms_feat_ratio_Err_L2_FV': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Err_L2_FV', 'num_tokens_ms_feat_L2ERROR'],
+        []),
+    'tag_ms_feat_ratio_Err_L2_NoFV': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Err_L2_NoFV', 'num_tokens_ms_feat_L2ERROR'],
+        []),
+    'tag_ms_feat_ratio_Err_L2_Pal': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Err_L2_Pal', 'num_tokens_ms_feat_L2ERROR'],
+        []),
+    'tag_ms_feat_ratio_Err_L2_SRo': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Err_L2_SRo', 'num_tokens_ms_feat_L2ERROR'],
+        []),
+    'tag_ms_feat_ratio_Err_L2_SRy': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Err_L2_SRy', 'num_tokens_ms_feat_L2ERROR'],
+        []),
+    'tag_ms_feat_ratio_Err_L2_ii': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Err_L2_ii', 'num_tokens_ms_feat_L2ERROR'],
+        []),
+    'tag_ms_feat_ratio_Err_Orth': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Err_Orth', 'num_tokens_ms_feat_ERROR'],
+        []),
+    'tag_ms_feat_ratio_Fac': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Fac', 'num_tokens_ms_feat_CONFIDENCE'],
+        []),
+    'tag_ms_feat_ratio_Fem': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Fem', 'num_tokens_ms_feat_GENDER'],
+        []),
+    'tag_ms_feat_ratio_Fut': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Fut', 'num_tokens_ms_feat_TENSE'],
+        []),
+    'tag_ms_feat_ratio_Gen': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Gen', 'num_tokens_ms_feat_CASE'],
+        []),
+    'tag_ms_feat_ratio_Gen2': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Gen2', 'num_tokens_ms_feat_CASE'],
+        []),
+    'tag_ms_feat_ratio_IV': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_IV', 'num_tokens_ms_feat_TRANSITIVITY'],
+        []),
+    'tag_ms_feat_ratio_Imp': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Imp', 'num_tokens_ms_feat_MOOD'],
+        []),
+    'tag_ms_feat_ratio_Impf': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Impf', 'num_tokens_ms_feat_ASPECT'],
+        []),
+    'tag_ms_feat_ratio_Imprs': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Imprs', 'num_tokens_ms_feat____'],
+        []),
+    'tag_ms_feat_ratio_Inan': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Inan', 'num_tokens_ms_feat_ANIMACY'],
+        []),
+    'tag_ms_feat_ratio_Indef': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Indef', 'num_tokens_ms_feat_subPOS'],
+        []),
+    'tag_ms_feat_ratio_Inf': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Inf', 'num_tokens_ms_feat_MOOD'],
+        []),
+    'tag_ms_feat_ratio_Ins': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Ins', 'num_tokens_ms_feat_CASE'],
+        []),
+    'tag_ms_feat_ratio_Interr': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Interr', 'num_tokens_ms_feat_subPOS'],
+        []),
+    'tag_ms_feat_ratio_LEFT': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_LEFT', 'num_tokens_ms_feat_PUNCT'],
+        []),
+    'tag_ms_feat_ratio_LPAR': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_LPAR', 'num_tokens_ms_feat_PUNCT'],
+        []),
+    'tag_ms_feat_ratio_LQUOT': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_LQUOT', 'num_tokens_ms_feat_PUNCT'],
+        []),
+    'tag_ms_feat_ratio_Leng': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Leng', 'num_tokens_ms_feat_PHON'],
+        []),
+    'tag_ms_feat_ratio_Loc': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Loc', 'num_tokens_ms_feat_CASE'],
+        []),
+    'tag_ms_feat_ratio_Loc2': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Loc2', 'num_tokens_ms_feat_CASE'],
+        []),
+    'tag_ms_feat_ratio_Lxc': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Lxc', 'num_tokens_ms_feat____'],
+        []),
+    'tag_ms_feat_ratio_MFN': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_MFN', 'num_tokens_ms_feat_GENDER'],
+        []),
+    'tag_ms_feat_ratio_Msc': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Msc', 'num_tokens_ms_feat_GENDER'],
+        []),
+    'tag_ms_feat_ratio_Neg': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Neg', 'num_tokens_ms_feat_subPOS'],
+        []),
+    'tag_ms_feat_ratio_Neu': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Neu', 'num_tokens_ms_feat_GENDER'],
+        []),
+    'tag_ms_feat_ratio_Nom': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Nom', 'num_tokens_ms_feat_CASE'],
+        []),
+    'tag_ms_feat_ratio_Ord': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Ord', 'num_tokens_ms_feat_subPOS'],
+        []),
+    'tag_ms_feat_ratio_PObj': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_PObj', 'num_tokens_ms_feat_SYNTACTIC'],
+        []),
+    'tag_ms_feat_ratio_PUNCT': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_PUNCT', 'num_tokens_ms_feat_PUNCT'],
+        []),
+    'tag_ms_feat_ratio_Pass': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Pass', 'num_tokens_ms_feat_VOICE'],
+        []),
+    'tag_ms_feat_ratio_Perf': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Perf', 'num_tokens_ms_feat_ASPECT'],
+        []),
+    'tag_ms_feat_ratio_Pers': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Pers', 'num_tokens_ms_feat_subPOS'],
+        []),
+    'tag_ms_feat_ratio_Pl': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Pl', 'num_tokens_ms_feat_NUMBER'],
+        []),
+    'tag_ms_feat_ratio_Pl1': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Pl1', 'num_tokens_ms_feat_NUMBERPERSON'],
+        []),
+    'tag_ms_feat_ratio_Pl2': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Pl2', 'num_tokens_ms_feat_NUMBERPERSON'],
+        []),
+    'tag_ms_feat_ratio_Pl3': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Pl3', 'num_tokens_ms_feat_NUMBERPERSON'],
+        []),
+    'tag_ms_feat_ratio_Pos': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Pos', 'num_tokens_ms_feat_subPOS'],
+        []),
+    'tag_ms_feat_ratio_Prb': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Prb', 'num_tokens_ms_feat_CONFIDENCE'],
+        []),
+    'tag_ms_feat_ratio_Prcnt': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Prcnt', 'num_tokens_ms_feat_subPOS'],
+        []),
+    'tag_ms_feat_ratio_Pred': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Pred', 'num_tokens_ms_feat_SYNTACTIC'],
+        []),
+    'tag_ms_feat_ratio_Prop': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Prop', 'num_tokens_ms_feat_subPOS'],
+        []),
+    'tag_ms_feat_ratio_Prs': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Prs', 'num_tokens_ms_feat_TENSE'],
+        []),
+    'tag_ms_feat_ratio_PrsAct': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_PrsAct', 'num_tokens_ms_feat_PARTICIPLE'],
+        []),
+    'tag_ms_feat_ratio_PrsPss': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_PrsPss', 'num_tokens_ms_feat_PARTICIPLE'],
+        []),
+    'tag_ms_feat_ratio_Pst': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Pst', 'num_tokens_ms_feat_TENSE'],
+        []),
+    'tag_ms_feat_ratio_PstAct': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_PstAct', 'num_tokens_ms_feat_PARTICIPLE'],
+        []),
+    'tag_ms_feat_ratio_PstPss': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_PstPss', 'num_tokens_ms_feat_PARTICIPLE'],
+        []),
+    'tag_ms_feat_ratio_QUOT': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_QUOT', 'num_tokens_ms_feat_PUNCT'],
+        []),
+    'tag_ms_feat_ratio_RIGHT': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_RIGHT', 'num_tokens_ms_feat_PUNCT'],
+        []),
+    'tag_ms_feat_ratio_RPAR': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_RPAR', 'num_tokens_ms_feat_PUNCT'],
+        []),
+    'tag_ms_feat_ratio_RQUOT': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_RQUOT', 'num_tokens_ms_feat_PUNCT'],
+        []),
+    'tag_ms_feat_ratio_Recip': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Recip', 'num_tokens_ms_feat_subPOS'],
+        []),
+    'tag_ms_feat_ratio_Refl': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Refl', 'num_tokens_ms_feat_subPOS'],
+        []),
+    'tag_ms_feat_ratio_Rel': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Rel', 'num_tokens_ms_feat_subPOS'],
+        []),
+    'tag_ms_feat_ratio_SENT': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_SENT', 'num_tokens_ms_feat_PUNCT'],
+        []),
+    'tag_ms_feat_ratio_Sem_Alt': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Sem_Alt', 'num_tokens_ms_feat_SEMANTIC'],
+        []),
+    'tag_ms_feat_ratio_Sem_Ant': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Sem_Ant', 'num_tokens_ms_feat_SEMANTIC'],
+        []),
+    'tag_ms_feat_ratio_Sem_Pat': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Sem_Pat', 'num_tokens_ms_feat_SEMANTIC'],
+        []),
+    'tag_ms_feat_ratio_Sem_Sur': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Sem_Sur', 'num_tokens_ms_feat_SEMANTIC'],
+        []),
+    'tag_ms_feat_ratio_Sg': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Sg', 'num_tokens_ms_feat_NUMBER'],
+        []),
+    'tag_ms_feat_ratio_Sg1': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Sg1', 'num_tokens_ms_feat_NUMBERPERSON'],
+        []),
+    'tag_ms_feat_ratio_Sg2': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Sg2', 'num_tokens_ms_feat_NUMBERPERSON'],
+        []),
+    'tag_ms_feat_ratio_Sg3': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Sg3', 'num_tokens_ms_feat_NUMBERPERSON'],
+        []),
+    'tag_ms_feat_ratio_Sint': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Sint', 'num_tokens_ms_feat_SYNTACTIC'],
+        []),
+    'tag_ms_feat_ratio_Symbol': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Symbol', 'num_tokens_ms_feat_PUNCT'],
+        []),
+    'tag_ms_feat_ratio_TV': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_TV', 'num_tokens_ms_feat_TRANSITIVITY'],
+        []),
+    'tag_ms_feat_ratio_Use_Aff': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Aff', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Agr': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Agr', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Anat': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Anat', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Anc': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Anc', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Ant': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Ant', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Aug': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Aug', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Bio': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Bio', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Bot': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Bot', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Chem': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Chem', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Dia': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Dia', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Dim': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Dim', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Flk': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Flk', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Geo': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Geo', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Gram': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Gram', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Hist': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Hist', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Law': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Law', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Lit': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Lit', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Mari': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Mari', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Math': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Math', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Med': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Med', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Mus': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Mus', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_NG': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_NG', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Obs': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Obs', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Old': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Old', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Poet': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Poet', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Prof': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Prof', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Relig': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Relig', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Tech': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Tech', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Use_Zoo': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Use_Zoo', 'num_tokens_ms_feat_USE'],
+        []),
+    'tag_ms_feat_ratio_Voc': ('Morphology',
+        'udar.features.morphology.tag_ms_feat_ratio_Tag',
+        {'rmv_punc': False, 'zero_div_val': nan},
+        ['num_tokens_Voc', 'num_tokens_ms_feat_CASE'],
+        []),
+    'type_token_ratio': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types', 'num_tokens'],
+        []),
+    'type_token_ratio_A': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_A', 'num_tokens_A'],
+        []),
+    'type_token_ratio_Abbr': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Abbr', 'num_tokens_Abbr'],
+        []),
+    'type_token_ratio_Acc': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Acc', 'num_tokens_Acc'],
+        []),
+    'type_token_ratio_Adv': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Adv', 'num_tokens_Adv'],
+        []),
+    'type_token_ratio_All': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_All', 'num_tokens_All'],
+        []),
+    'type_token_ratio_AnIn': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_AnIn', 'num_tokens_AnIn'],
+        []),
+    'type_token_ratio_Anim': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Anim', 'num_tokens_Anim'],
+        []),
+    'type_token_ratio_Att': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Att', 'num_tokens_Att'],
+        []),
+    'type_token_ratio_CC': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_CC', 'num_tokens_CC'],
+        []),
+    'type_token_ratio_CLB': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_CLB', 'num_tokens_CLB'],
+        []),
+    'type_token_ratio_COMMA': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_COMMA', 'num_tokens_COMMA'],
+        []),
+    'type_token_ratio_CS': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_CS', 'num_tokens_CS'],
+        []),
+    'type_token_ratio_Cmpar': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Cmpar', 'num_tokens_Cmpar'],
+        []),
+    'type_token_ratio_Cmpnd': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Cmpnd', 'num_tokens_Cmpnd'],
+        []),
+    'type_token_ratio_Coll': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Coll', 'num_tokens_Coll'],
+        []),
+    'type_token_ratio_Count': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Count', 'num_tokens_Count'],
+        []),
+    'type_token_ratio_DASH': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_DASH', 'num_tokens_DASH'],
+        []),
+    'type_token_ratio_Dat': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Dat', 'num_tokens_Dat'],
+        []),
+    'type_token_ratio_Def': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Def', 'num_tokens_Def'],
+        []),
+    'type_token_ratio_Dem': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Dem', 'num_tokens_Dem'],
+        []),
+    'type_token_ratio_Der': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Der', 'num_tokens_Der'],
+        []),
+    'type_token_ratio_Der_PrsAct': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Der_PrsAct', 'num_tokens_Der_PrsAct'],
+        []),
+    'type_token_ratio_Der_PrsPss': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Der_PrsPss', 'num_tokens_Der_PrsPss'],
+        []),
+    'type_token_ratio_Der_PstAct': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Der_PstAct', 'num_tokens_Der_PstAct'],
+        []),
+    'type_token_ratio_Der_PstPss': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Der_PstPss', 'num_tokens_Der_PstPss'],
+        []),
+    'type_token_ratio_Det': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Det', 'num_tokens_Det'],
+        []),
+    'type_token_ratio_Elid': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Elid', 'num_tokens_Elid'],
+        []),
+    'type_token_ratio_Epenth': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Epenth', 'num_tokens_Epenth'],
+        []),
+    'type_token_ratio_Err_L2_FV': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Err_L2_FV', 'num_tokens_Err_L2_FV'],
+        []),
+    'type_token_ratio_Err_L2_NoFV': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Err_L2_NoFV', 'num_tokens_Err_L2_NoFV'],
+        []),
+    'type_token_ratio_Err_L2_Pal': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Err_L2_Pal', 'num_tokens_Err_L2_Pal'],
+        []),
+    'type_token_ratio_Err_L2_SRo': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Err_L2_SRo', 'num_tokens_Err_L2_SRo'],
+        []),
+    'type_token_ratio_Err_L2_SRy': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Err_L2_SRy', 'num_tokens_Err_L2_SRy'],
+        []),
+    'type_token_ratio_Err_L2_ii': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Err_L2_ii', 'num_tokens_Err_L2_ii'],
+        []),
+    'type_token_ratio_Err_Orth': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Err_Orth', 'num_tokens_Err_Orth'],
+        []),
+    'type_token_ratio_Fac': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Fac', 'num_tokens_Fac'],
+        []),
+    'type_token_ratio_Fem': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Fem', 'num_tokens_Fem'],
+        []),
+    'type_token_ratio_Fut': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Fut', 'num_tokens_Fut'],
+        []),
+    'type_token_ratio_Gen': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Gen', 'num_tokens_Gen'],
+        []),
+    'type_token_ratio_Gen2': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Gen2', 'num_tokens_Gen2'],
+        []),
+    'type_token_ratio_IV': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_IV', 'num_tokens_IV'],
+        []),
+    'type_token_ratio_Imp': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Imp', 'num_tokens_Imp'],
+        []),
+    'type_token_ratio_Impf': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Impf', 'num_tokens_Impf'],
+        []),
+    'type_token_ratio_Imprs': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Imprs', 'num_tokens_Imprs'],
+        []),
+    'type_token_ratio_Inan': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Inan', 'num_tokens_Inan'],
+        []),
+    'type_token_ratio_Indef': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Indef', 'num_tokens_Indef'],
+        []),
+    'type_token_ratio_Inf': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Inf', 'num_tokens_Inf'],
+        []),
+    'type_token_ratio_Ins': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Ins', 'num_tokens_Ins'],
+        []),
+    'type_token_ratio_Interj': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Interj', 'num_tokens_Interj'],
+        []),
+    'type_token_ratio_Interr': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Interr', 'num_tokens_Interr'],
+        []),
+    'type_token_ratio_LEFT': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_LEFT', 'num_tokens_LEFT'],
+        []),
+    'type_token_ratio_LPAR': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_LPAR', 'num_tokens_LPAR'],
+        []),
+    'type_token_ratio_LQUOT': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_LQUOT', 'num_tokens_LQUOT'],
+        []),
+    'type_token_ratio_Leng': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Leng', 'num_tokens_Leng'],
+        []),
+    'type_token_ratio_Loc': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Loc', 'num_tokens_Loc'],
+        []),
+    'type_token_ratio_Loc2': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Loc2', 'num_tokens_Loc2'],
+        []),
+    'type_token_ratio_Lxc': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Lxc', 'num_tokens_Lxc'],
+        []),
+    'type_token_ratio_MFN': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_MFN', 'num_tokens_MFN'],
+        []),
+    'type_token_ratio_Msc': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Msc', 'num_tokens_Msc'],
+        []),
+    'type_token_ratio_N': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_N', 'num_tokens_N'],
+        []),
+    'type_token_ratio_Neg': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Neg', 'num_tokens_Neg'],
+        []),
+    'type_token_ratio_Neu': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Neu', 'num_tokens_Neu'],
+        []),
+    'type_token_ratio_Nom': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Nom', 'num_tokens_Nom'],
+        []),
+    'type_token_ratio_Num': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Num', 'num_tokens_Num'],
+        []),
+    'type_token_ratio_Ord': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Ord', 'num_tokens_Ord'],
+        []),
+    'type_token_ratio_PObj': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_PObj', 'num_tokens_PObj'],
+        []),
+    'type_token_ratio_PUNCT': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_PUNCT', 'num_tokens_PUNCT'],
+        []),
+    'type_token_ratio_Paren': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Paren', 'num_tokens_Paren'],
+        []),
+    'type_token_ratio_Pass': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Pass', 'num_tokens_Pass'],
+        []),
+    'type_token_ratio_Pcle': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Pcle', 'num_tokens_Pcle'],
+        []),
+    'type_token_ratio_Perf': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Perf', 'num_tokens_Perf'],
+        []),
+    'type_token_ratio_Pers': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Pers', 'num_tokens_Pers'],
+        []),
+    'type_token_ratio_Pl': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Pl', 'num_tokens_Pl'],
+        []),
+    'type_token_ratio_Pl1': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Pl1', 'num_tokens_Pl1'],
+        []),
+    'type_token_ratio_Pl2': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Pl2', 'num_tokens_Pl2'],
+        []),
+    'type_token_ratio_Pl3': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Pl3', 'num_tokens_Pl3'],
+        []),
+    'type_token_ratio_Po': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Po', 'num_tokens_Po'],
+        []),
+    'type_token_ratio_Pos': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Pos', 'num_tokens_Pos'],
+        []),
+    'type_token_ratio_Pr': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Pr', 'num_tokens_Pr'],
+        []),
+    'type_token_ratio_Prb': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Prb', 'num_tokens_Prb'],
+        []),
+    'type_token_ratio_Prcnt': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Prcnt', 'num_tokens_Prcnt'],
+        []),
+    'type_token_ratio_Pred': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Pred', 'num_tokens_Pred'],
+        []),
+    'type_token_ratio_Pron': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Pron', 'num_tokens_Pron'],
+        []),
+    'type_token_ratio_Prop': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Prop', 'num_tokens_Prop'],
+        []),
+    'type_token_ratio_Prs': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Prs', 'num_tokens_Prs'],
+        []),
+    'type_token_ratio_PrsAct': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_PrsAct', 'num_tokens_PrsAct'],
+        []),
+    'type_token_ratio_PrsPss': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_PrsPss', 'num_tokens_PrsPss'],
+        []),
+    'type_token_ratio_Pst': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Pst', 'num_tokens_Pst'],
+        []),
+    'type_token_ratio_PstAct': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_PstAct', 'num_tokens_PstAct'],
+        []),
+    'type_token_ratio_PstPss': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_PstPss', 'num_tokens_PstPss'],
+        []),
+    'type_token_ratio_QUOT': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_QUOT', 'num_tokens_QUOT'],
+        []),
+    'type_token_ratio_RIGHT': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_RIGHT', 'num_tokens_RIGHT'],
+        []),
+    'type_token_ratio_RPAR': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_RPAR', 'num_tokens_RPAR'],
+        []),
+    'type_token_ratio_RQUOT': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_RQUOT', 'num_tokens_RQUOT'],
+        []),
+    'type_token_ratio_Recip': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Recip', 'num_tokens_Recip'],
+        []),
+    'type_token_ratio_Refl': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Refl', 'num_tokens_Refl'],
+        []),
+    'type_token_ratio_Rel': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Rel', 'num_tokens_Rel'],
+        []),
+    'type_token_ratio_SENT': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_SENT', 'num_tokens_SENT'],
+        []),
+    'type_token_ratio_Sem_Alt': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Sem_Alt', 'num_tokens_Sem_Alt'],
+        []),
+    'type_token_ratio_Sem_Ant': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Sem_Ant', 'num_tokens_Sem_Ant'],
+        []),
+    'type_token_ratio_Sem_Pat': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Sem_Pat', 'num_tokens_Sem_Pat'],
+        []),
+    'type_token_ratio_Sem_Sur': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Sem_Sur', 'num_tokens_Sem_Sur'],
+        []),
+    'type_token_ratio_Sg': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Sg', 'num_tokens_Sg'],
+        []),
+    'type_token_ratio_Sg1': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Sg1', 'num_tokens_Sg1'],
+        []),
+    'type_token_ratio_Sg2': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Sg2', 'num_tokens_Sg2'],
+        []),
+    'type_token_ratio_Sg3': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Sg3', 'num_tokens_Sg3'],
+        []),
+    'type_token_ratio_Sint': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Sint', 'num_tokens_Sint'],
+        []),
+    'type_token_ratio_Symbol': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Symbol', 'num_tokens_Symbol'],
+        []),
+    'type_token_ratio_TV': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_TV', 'num_tokens_TV'],
+        []),
+    'type_token_ratio_Use_Aff': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Aff', 'num_tokens_Use_Aff'],
+        []),
+    'type_token_ratio_Use_Agr': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Agr', 'num_tokens_Use_Agr'],
+        []),
+    'type_token_ratio_Use_Anat': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Anat', 'num_tokens_Use_Anat'],
+        []),
+    'type_token_ratio_Use_Anc': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Anc', 'num_tokens_Use_Anc'],
+        []),
+    'type_token_ratio_Use_Ant': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Ant', 'num_tokens_Use_Ant'],
+        []),
+    'type_token_ratio_Use_Aug': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Aug', 'num_tokens_Use_Aug'],
+        []),
+    'type_token_ratio_Use_Bio': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Bio', 'num_tokens_Use_Bio'],
+        []),
+    'type_token_ratio_Use_Bot': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Bot', 'num_tokens_Use_Bot'],
+        []),
+    'type_token_ratio_Use_Chem': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Chem', 'num_tokens_Use_Chem'],
+        []),
+    'type_token_ratio_Use_Dia': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Dia', 'num_tokens_Use_Dia'],
+        []),
+    'type_token_ratio_Use_Dim': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Dim', 'num_tokens_Use_Dim'],
+        []),
+    'type_token_ratio_Use_Flk': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Flk', 'num_tokens_Use_Flk'],
+        []),
+    'type_token_ratio_Use_Geo': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Geo', 'num_tokens_Use_Geo'],
+        []),
+    'type_token_ratio_Use_Gram': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Gram', 'num_tokens_Use_Gram'],
+        []),
+    'type_token_ratio_Use_Hist': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Hist', 'num_tokens_Use_Hist'],
+        []),
+    'type_token_ratio_Use_Law': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Law', 'num_tokens_Use_Law'],
+        []),
+    'type_token_ratio_Use_Lit': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Lit', 'num_tokens_Use_Lit'],
+        []),
+    'type_token_ratio_Use_Mari': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Mari', 'num_tokens_Use_Mari'],
+        []),
+    'type_token_ratio_Use_Math': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Math', 'num_tokens_Use_Math'],
+        []),
+    'type_token_ratio_Use_Med': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Med', 'num_tokens_Use_Med'],
+        []),
+    'type_token_ratio_Use_Mus': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Mus', 'num_tokens_Use_Mus'],
+        []),
+    'type_token_ratio_Use_NG': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_NG', 'num_tokens_Use_NG'],
+        []),
+    'type_token_ratio_Use_Obs': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Obs', 'num_tokens_Use_Obs'],
+        []),
+    'type_token_ratio_Use_Old': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Old', 'num_tokens_Use_Old'],
+        []),
+    'type_token_ratio_Use_Poet': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Poet', 'num_tokens_Use_Poet'],
+        []),
+    'type_token_ratio_Use_Prof': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Prof', 'num_tokens_Use_Prof'],
+        []),
+    'type_token_ratio_Use_Relig': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Relig', 'num_tokens_Use_Relig'],
+        []),
+    'type_token_ratio_Use_Tech': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Tech', 'num_tokens_Use_Tech'],
+        []),
+    'type_token_ratio_Use_Zoo': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Use_Zoo', 'num_tokens_Use_Zoo'],
+        []),
+    'type_token_ratio_V': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_V', 'num_tokens_V'],
+        []),
+    'type_token_ratio_Voc': ('Lexical variation',
+        'udar.features.lexical_variability.type_token_ratio_Tag',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types_Voc', 'num_tokens_Voc'],
+        []),
+    'uber_index': ('Lexical variation',
+        'udar.features.lexical_variability.uber_index',
+        {'lower': True, 'rmv_punc': False, 'zero_div_val': nan},
+        ['num_types', 'num_tokens'],
+        []),
+    'words_per_sent': ('Normalized length',
+        'udar.features.normalized_length.words_per_sent',
+        {'lower': False, 'rmv_punc': True, 'zero_div_val': nan},
+        ['num_tokens', 'num_sents'],
+        []),
+}
+
+# module: digest of its source
+SOURCES: Dict[str, str] = {
+    'udar.features.absolute_length': '1355ba1ec071213e',
+    'udar.features.discourse': 'f0c28e61eccfd566',
+    'udar.features.lexical_complexity': '917007afae9dd797',
+    'udar.features.lexical_familiarity': '3c6b58825012167e',
+    'udar.features.lexical_variability': 'dec99ef87d2586df',
+    'udar.features.morphology': '8f6925d608ef941a',
+    'udar.features.normalized_length': '0c8fb946d8ffe8ca',
+    'udar.features.priors': '21018f26b61132a0',
+    'udar.features.readability': '9f37cc6fc16cdb77',
+    'udar.features.sentence': '3535161b3048c423',
+    'udar.features.syntax': 'ac75b484f67412c1',
+}
@@ -1,5 +1,6 @@
 from functools import partial
 import re
+from typing import Union
 
 from ..document import Document
 from ..tag import tag_dict
@@ -14,6 +15,7 @@ from .features import safe_tag_name
 from .features import tags_by_ms_feat
 from .features import vowel_re
 from .features import warn_about_irrelevant_argument
+from .stream import StreamDocument
 
 side_effects = None  # import this and get all the side effects for free!
 
@@ -45,8 +47,9 @@ def num_tokens(doc: Document, lower=False, rmv_punc=False) -> int:
 
 def num_tokens_Tag(has_tag: str, doc: Document, rmv_punc=False) -> int:
     """Count number of tokens with a given tag."""
-    toks = ALL['_filter_toks'](doc, has_tag=has_tag, rmv_punc=rmv_punc)
-    return len(toks)
+    positions = ALL['_filter_positions'](doc, has_tag=has_tag,
+                                         rmv_punc=rmv_punc)
+    return len(positions)
 for tag in tag_dict:  # noqa: E305
     name = f'num_tokens_{safe_tag_name(tag)}'
     this_partial = partial(num_tokens_Tag, tag)
@@ -59,8 +62,9 @@ for tag in tag_dict:  # noqa: E305
 def num_tokens_ms_feat(ms_feat: str, doc: Document, rmv_punc=False) -> int:
     """Count number of tokens with a given morphosyntactic category marked."""
     has_tag = tags_by_ms_feat[ms_feat]
-    toks = ALL['_filter_toks'](doc, has_tag=has_tag, rmv_punc=rmv_punc)
-    return len(toks)
+    positions = ALL['_filter_positions'](doc, has_tag=has_tag,
+                                         rmv_punc=rmv_punc)
+    return len(positions)
 for ms_feat in ms_feats - {'POS'}:  # noqa: E305
     name = f'num_tokens_ms_feat_{safe_ms_feat_name(ms_feat)}'
     this_partial = partial(num_tokens_ms_feat, ms_feat)
@@ -89,8 +93,9 @@ def num_tokens_over_n_sylls(n, doc: Document, lower=False,
     # `lower` is irrelevant here, but included for hierarchical consistency
     if lower:
         warn_about_irrelevant_argument('num_tokens_over_n_sylls', 'lower')
-    toks = ALL['_filter_surface_strs'](doc, lower=lower, rmv_punc=rmv_punc)
-    return len([t for t in toks if len(re.findall(vowel_re, t, re.I)) > n])
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag='', rmv_punc=rmv_punc)
+    return len([i for i in positions if stats.num_sylls[i] > n])
 for n in range(1, MAX_SYLL):  # noqa: E305
     name = f'num_tokens_over_{n}_sylls'
     this_partial = partial(num_tokens_over_n_sylls, n)
@@ -106,8 +111,9 @@ def num_tokens_over_n_chars(n, doc: Document, lower=False,
     # `lower` is irrelevant here, but included for hierarchical consistency
     if lower:
         warn_about_irrelevant_argument('num_tokens_over_n_chars', 'lower')
-    toks = ALL['_filter_surface_strs'](doc, lower=lower, rmv_punc=rmv_punc)
-    return len([t for t in toks if len(t) > n])
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag='', rmv_punc=rmv_punc)
+    return len([i for i in positions if stats.num_chars[i] > n])
 for n in range(1, MAX_SYLL):  # noqa: E305
     name = f'num_tokens_over_{n}_chars'
     this_partial = partial(num_tokens_over_n_chars, n)
@@ -124,10 +130,10 @@ def num_content_tokens_over_n_sylls(n, doc: Document, lower=False,
     if lower:
         warn_about_irrelevant_argument('num_content_tokens_over_n_sylls',
                                        'lower')
-    toks = ALL['_filter_toks'](doc, has_tag=('A', 'Adv', 'N', 'V'),
-                               rmv_punc=rmv_punc)
-    return len([t for t in toks
-                if len(re.findall(vowel_re, t.text, re.I)) > n])
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag=('A', 'Adv', 'N', 'V'),
+                                         rmv_punc=rmv_punc)
+    return len([i for i in positions if stats.num_sylls[i] > n])
 for n in range(1, MAX_SYLL):  # noqa: E305
     name = f'num_content_tokens_over_{n}_sylls'
     this_partial = partial(num_content_tokens_over_n_sylls, n)
@@ -144,9 +150,10 @@ def num_content_tokens_over_n_chars(n, doc: Document, lower=False,
     if lower:
         warn_about_irrelevant_argument('num_content_tokens_over_n_chars',
                                        'lower')
-    toks = ALL['_filter_toks'](doc, has_tag=('A', 'Adv', 'N', 'V'),
-                               rmv_punc=rmv_punc)
-    return len([t for t in toks if len(t.text) > n])
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag=('A', 'Adv', 'N', 'V'),
+                                         rmv_punc=rmv_punc)
+    return len([i for i in positions if stats.num_chars[i] > n])
 for n in range(1, MAX_SYLL):  # noqa: E305
     name = f'num_content_tokens_over_{n}_chars'
     this_partial = partial(num_content_tokens_over_n_chars, n)
@@ -167,24 +174,28 @@ def num_types(doc: Document, lower=True, rmv_punc=False) -> int:
 def num_lemma_types(doc: Document, has_tag='', lower=False,
                     method=MOST_LIKELY, rmv_punc=False) -> int:
     """Count number of unique lemmas in a Document."""
-    toks = ALL['_filter_toks'](doc, has_tag=has_tag, rmv_punc=rmv_punc)
+    # `method` is ignored; lemmas are always from MOST_LIKELY readings
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag=has_tag,
+                                         rmv_punc=rmv_punc)
     if lower:
         return len(set([lem.lower()
-                        for t in toks
-                        for lem in t.most_likely_lemmas(method=MOST_LIKELY)]))  # noqa: E501
+                        for i in positions
+                        for lem in stats.lemmas[i]]))
     else:
         return len(set([lem
-                        for t in toks
-                        for lem in t.most_likely_lemmas(method=MOST_LIKELY)]))  # noqa: E501
+                        for i in positions
+                        for lem in stats.lemmas[i]]))
 
 
 def num_types_Tag(tag: str, doc: Document, lower=True, rmv_punc=False) -> int:
     """Count number of unique tokens with a given tag in a Document."""
-    toks = ALL['_filter_toks'](doc, has_tag=tag, rmv_punc=rmv_punc)
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag=tag, rmv_punc=rmv_punc)
     if lower:
-        return len(set([t.text.lower() for t in toks]))
+        return len(set([stats.texts[i].lower() for i in positions]))
     else:
-        return len(set([t.text for t in toks]))
+        return len(set([stats.texts[i] for i in positions]))
 for tag in tag_dict:  # noqa: E305
     name = f'num_types_{safe_tag_name(tag)}'
     this_partial = partial(num_types_Tag, tag)
@@ -195,8 +206,10 @@ for tag in tag_dict:  # noqa: E305
 
 
 @add_to_ALL('num_sents', category='Absolute length')
-def num_sents(doc: Document) -> int:
+def num_sents(doc: Union[Document, StreamDocument]) -> int:
     """Count number of sentences in a Document."""
+    if isinstance(doc, StreamDocument):  # only counted while streaming
+        return doc.num_sents
     return len(doc.sentences)
 
 
@@ -205,10 +218,11 @@ def num_propositions(doc: Document, rmv_punc=False) -> int:
     """Count number of propositions, as estimated by part-of-speech
     (a la Brown et al. 2007; 2008).
     """
-    prop_toks = ALL['_filter_toks'](doc, has_tag=('A', 'Adv', 'CC', 'CS', 'Pr',
-                                                  'Det', 'V'),
-                                    rmv_punc=rmv_punc)
-    return len(prop_toks)
+    prop_positions = ALL['_filter_positions'](doc, has_tag=('A', 'Adv', 'CC',
+                                                            'CS', 'Pr', 'Det',
+                                                            'V'),
+                                              rmv_punc=rmv_punc)
+    return len(prop_positions)
 
 
 @add_to_ALL('num_dialog_punc', category='Absolute length')
@@ -1,24 +1,39 @@
+import ast
 from functools import partial
 import inspect
 import re
+from time import perf_counter
 from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import List
-from typing import Mapping
+from typing import Optional
+from typing import Tuple
 
 from ..document import Document
+from .registry import lookup
 
 __all__ = ['Feature']
 
+# Time spent in the dependencies of each Feature call in progress, used to
+# compute the time spent in each Feature itself
+_child_times: List[float] = []
+
 
 class Feature:
     name: str
     func: Callable
     doc: str
-    default_kwargs: Mapping
     category: str
-    depends_on: List[str]
+    calls: int  # number of calls
+    hits: int  # number of calls answered from the Document's cache
+    total_time: float  # seconds spent computing values, incl. dependencies
+    self_time: float  # seconds spent computing values, excl. dependencies
+    _declared_deps: bool  # whether `depends_on` was passed to __init__
+    # Determined on first access, from the registry if possible
+    _default_kwargs: Optional[Dict[str, Any]]
+    _depends_on: Optional[List[str]]
+    _unresolved_deps: Optional[List[str]]
 
     def __init__(self, name, func, doc=None, default_kwargs=None,
                  category=None, depends_on=None):
@@ -30,39 +45,140 @@ class Feature:
                                         else func.__doc__)
         else:
             self.doc = inspect.cleandoc(doc)
-        self.set_default_kwargs(default_kwargs=default_kwargs)
         self.category = category
-        if depends_on is None:
-            src = inspect.getsource(func.func if isinstance(func, partial)
-                                    else func)
-            self.depends_on = re.findall(r''' = ALL\[['"](.+?)['"]\]\(''', src)
+        self.reset_costs()
+        self._default_kwargs = None
+        if default_kwargs is not None:
+            self.set_default_kwargs(default_kwargs=default_kwargs)
+        self._declared_deps = depends_on is not None
+        self._depends_on = depends_on
+        self._unresolved_deps = None if depends_on is None else []
+
+    @property
+    def default_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments used in __call__() by default."""
+        if self._default_kwargs is None:
+            self._default_kwargs = self._get_orig_kwargs()
+        return self._default_kwargs
+
+    @property
+    def depends_on(self) -> List[str]:
+        """Names of the features that this feature calls."""
+        if self._depends_on is None:
+            self._set_depends_on()
+        return self._depends_on  # type: ignore
+
+    @property
+    def unresolved_deps(self) -> List[str]:
+        """Dependencies (f-string templates) that could not be determined."""
+        if self._unresolved_deps is None:
+            self._set_depends_on()
+        return self._unresolved_deps  # type: ignore
+
+    def _set_depends_on(self):
+        entry = lookup(self.name, self.func)
+        if entry is None:
+            depends_on, unresolved_deps = self._inspect_depends_on()
         else:
-            self.depends_on = depends_on
+            depends_on = list(entry.depends_on)
+            unresolved_deps = list(entry.unresolved_deps)
+        if self._depends_on is None:
+            self._depends_on = depends_on
+        self._unresolved_deps = unresolved_deps
+
+    def _inspect_depends_on(self) -> Tuple[List[str], List[str]]:
+        """Determine the dependencies of this feature from the source code of
+        its function, i.e. the names of all features that it calls as
+        ``ALL['name'](...)``, whether the result is assigned or used inline.
+        Return a tuple of the list of dependencies, and the list of f-string
+        templates that could not be resolved.
+        """
+        func = self.func
+        src = inspect.getsource(func.func if isinstance(func, partial)
+                                else func)
+        depends_on: List[str] = []
+        for dep in re.findall(r'''ALL\[['"](.+?)['"]\]\(''', src):
+            if dep not in depends_on:
+                depends_on.append(dep)
+        unresolved_deps: List[str] = []
+        fstring_deps = re.findall(r'''ALL\[f(['"].+?['"])\]\(''', src)
+        for template in fstring_deps:
+            dep = self._resolve_fstring_dep(func, template)
+            if dep is None:
+                unresolved_deps.append(template)
+            elif dep not in depends_on:
+                depends_on.append(dep)
+        return depends_on, unresolved_deps
 
     @staticmethod
-    def _get_orig_kwargs(func) -> Dict[str, Any]:
-        """Get kwargs defaults as declared in the original function."""
-        sig = inspect.signature(func)
+    def _resolve_fstring_dep(func, template: str) -> Optional[str]:
+        """Determine the name of a dependency that is given as an f-string,
+        e.g. ``ALL[f'num_tokens_{safe_tag_name(tag)}']``.
+
+        The f-string can only be resolved if every variable in it is either
+        an argument bound by :py:class:`functools.partial` or a global of the
+        function's module (such as ``safe_tag_name``). Otherwise, return None.
+        """
+        bound: Dict[str, Any] = {}
+        if isinstance(func, partial):
+            params = list(inspect.signature(func.func).parameters)
+            bound.update(zip(params, func.args))
+            bound.update(func.keywords)
+            func = func.func
+        try:
+            expr = ast.parse(f'f{template}', mode='eval')
+        except SyntaxError:  # pragma: no cover
+            return None
+        local_names = func.__code__.co_varnames
+        for node in ast.walk(expr):
+            if isinstance(node, ast.Name) and node.id not in bound:
+                if (node.id in local_names
+                        or node.id not in func.__globals__):
+                    return None
+        try:
+            return eval(compile(expr, '<depends_on>', 'eval'),
+                        func.__globals__, bound)
+        except Exception:  # pragma: no cover
+            return None
+
+    def _inspect_default_kwargs(self) -> Dict[str, Any]:
+        """Get kwargs defaults from the original function's signature."""
+        sig = inspect.signature(self.func)
         return {name: param.default
                 for name, param in sig.parameters.items()
                 if param.default != inspect._empty}  # type: ignore
 
+    def _get_orig_kwargs(self) -> Dict[str, Any]:
+        """Get kwargs defaults as declared in the original function."""
+        entry = lookup(self.name, self.func)
+        if entry is None:
+            return self._inspect_default_kwargs()
+        return dict(entry.default_kwargs)
+
     def set_default_kwargs(self, default_kwargs=None):
         """Set kwargs to be used in __call__() by default.
 
         If `default_kwargs` is None, reset self.default_kwargs to original
         default values declared in the original function's signature.
         """
-        auto_kwargs = self._get_orig_kwargs(self.func)
+        auto_kwargs = self._get_orig_kwargs()
         if default_kwargs is None:
-            self.default_kwargs = auto_kwargs
+            self._default_kwargs = auto_kwargs
         else:
             assert all(k in auto_kwargs for k in default_kwargs), \
                 "default_kwargs do not match the function's signature:\n" \
                 f"signature: {auto_kwargs}\n" \
                 f"passed kwargs: {default_kwargs}."
             auto_kwargs.update(default_kwargs)
-            self.default_kwargs = auto_kwargs
+            self._default_kwargs = auto_kwargs
+
+    def param_key(self, **kwargs) -> Tuple[str, Tuple[Tuple[str, Any], ...]]:
+        """Return hashable key of this feature called with `kwargs` (after
+        filling in default kwargs), used to cache its values.
+        """
+        default_kwargs = dict(self.default_kwargs)  # temporary copy
+        default_kwargs.update(kwargs)  # override defaults
+        return (self.name, tuple(default_kwargs.items()))
 
     def __call__(self, doc: Document, **kwargs):
         """Call the feature extraction function.
@@ -71,16 +187,44 @@ class Feature:
         argument, but all arguments and keyword arguments are passed to the
         function.
         """
-        default_kwargs = dict(self.default_kwargs)  # temporary copy
-        default_kwargs.update(kwargs)  # override defaults
-        param_key = (self.name, tuple(default_kwargs.items()))
+        param_key = self.param_key(**kwargs)
+        self.calls += 1
         try:
-            return doc._feat_cache[param_key]
+            value = doc._feat_cache[param_key]
+            self.hits += 1
+            return value
         except KeyError:
-            value = self.func(doc, **default_kwargs)
+            start = perf_counter()
+            _child_times.append(0.0)
+            try:
+                value = self.func(doc, **dict(param_key[1]))
+            finally:
+                elapsed = perf_counter() - start
+                self.total_time += elapsed
+                self.self_time += elapsed - _child_times.pop()
+                if _child_times:
+                    _child_times[-1] += elapsed
             doc._feat_cache[param_key] = value
             return value
 
+    @property
+    def cost(self) -> float:
+        """Average number of seconds spent computing this feature itself
+        (excluding its dependencies) per computed value, or NaN if it has not
+        been computed.
+        """
+        try:
+            return self.self_time / (self.calls - self.hits)
+        except ZeroDivisionError:
+            return float('nan')
+
+    def reset_costs(self):
+        """Reset call count, cache hits, and timings."""
+        self.calls = 0
+        self.hits = 0
+        self.total_time = 0.0
+        self.self_time = 0.0
+
     def __repr__(self):
         return f'Feature(name={self.name}, func={self.func}, def_kwargs={self.default_kwargs}, category={self.category})'  # noqa: E501
 
@@ -92,4 +236,6 @@ class Feature:
                           f'About: {self.doc}',
                           f'Default keyword arguments: {self.default_kwargs}',
                           f'Category: {self.category}',
-                          f'Depends on: {self.depends_on}'])
+                          f'Depends on: {self.depends_on}',
+                          f'Calls: {self.calls} ({self.hits} cache hits)',
+                          f'Average cost: {self.cost:.6f} s'])
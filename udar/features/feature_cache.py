@@ -0,0 +1,180 @@
+"""Persistent on-disk cache of extracted features."""
+
+import hashlib
+import os
+from pathlib import PurePath
+import pickle
+import sqlite3
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from ..misc import RSRC_PATH
+
+__all__ = ['FeatureCache']
+
+PKG_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_file_digests: Dict[Tuple[str, float, int], str] = {}
+
+
+def _file_digest(path: str) -> str:
+    """Return sha256 hex digest of the file at ``path`` (memoized by path,
+    modification time and size).
+    """
+    stat = os.stat(path)
+    key = (path, stat.st_mtime, stat.st_size)
+    try:
+        return _file_digests[key]
+    except KeyError:
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(2 ** 20), b''):
+                sha.update(block)
+        _file_digests[key] = sha.hexdigest()
+        return _file_digests[key]
+
+
+def _source_paths() -> List[str]:
+    """Return the paths of udar's Python source files (including the
+    features), sorted.
+    """
+    paths: List[str] = []
+    for dirpath, dirnames, fnames in os.walk(PKG_PATH):
+        paths.extend(os.path.join(dirpath, fname) for fname in fnames
+                     if fname.endswith('.py'))
+    return sorted(paths)
+
+
+def _normalize_kwarg(name: str, value: Any) -> Any:
+    """Return a value of a Document keyword argument that has a stable
+    ``repr()``, for the pipeline key. Paths are converted to strs. Raise
+    TypeError for other objects (e.g. ``_analyzer`` or ``tokenizer``), whose
+    ``repr()`` can change between processes without their output changing,
+    or vice versa.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    elif isinstance(value, PurePath):
+        return str(value)
+    elif isinstance(value, (list, tuple)):
+        return tuple(_normalize_kwarg(name, item) for item in value)
+    raise TypeError(f'FeatureCache cannot include the Document keyword '
+                    f'argument {name}={value!r} in its key. Only Nones, '
+                    'bools, numbers, strs, paths, and lists/tuples of them '
+                    'are supported.')
+
+
+class FeatureCache:
+    """SQLite database of feature values, keyed by a hash of each
+    Document's text and the options of the pipeline that produced it, and by
+    the name and keyword arguments of each feature.
+
+    The pipeline key also includes checksums of udar's source code (the
+    pipeline and the features), of the CG3 grammar, and of every file in
+    udar's resources directory (analyzers, lexical resources, etc.), so
+    cached values are ignored automatically when any of them change, e.g.
+    after upgrading udar.
+    """
+    __slots__ = ['_conn', 'doc_kwargs', 'path', 'pipeline_key']
+    _conn: sqlite3.Connection
+    doc_kwargs: Dict[str, Any]
+    path: str
+    pipeline_key: str
+
+    def __init__(self, path: str, **doc_kwargs):
+        r"""
+        Parameters
+        ----------
+
+        path
+            Path to the SQLite database file. It is created if it does not
+            exist.
+        \*\*doc_kwargs
+            Keyword arguments used to construct Documents (e.g.
+            ``disambiguate=True``, ``depparse=True``, ``analyze_L2_errors``,
+            ``gram_path``). Documents passed to :py:class:`FeatureExtractor`
+            with this cache must have been created with the same arguments.
+            Objects (such as ``_analyzer`` or ``tokenizer``) are not
+            supported, and raise TypeError.
+        """
+        self.path = str(path)
+        self.doc_kwargs = doc_kwargs
+        self.pipeline_key = self._pipeline_key(doc_kwargs)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute('CREATE TABLE IF NOT EXISTS features '
+                           '(doc_key TEXT, param_key TEXT, value BLOB, '
+                           'PRIMARY KEY (doc_key, param_key))')
+        self._conn.commit()
+
+    @staticmethod
+    def _pipeline_key(doc_kwargs: Dict[str, Any]) -> str:
+        sha = hashlib.sha256()
+        normalized = sorted((name, _normalize_kwarg(name, value))
+                            for name, value in doc_kwargs.items())
+        sha.update(repr(normalized).encode('utf-8'))
+        paths = [os.path.join(RSRC_PATH, fname)
+                 for fname in sorted(os.listdir(RSRC_PATH))]
+        gram_path = doc_kwargs.get('gram_path')
+        if gram_path:
+            paths.append(str(gram_path))
+        for path in paths:
+            if os.path.isfile(path):
+                sha.update(f'{os.path.basename(path)}:'
+                           f'{_file_digest(path)}'.encode('utf-8'))
+        for path in _source_paths():
+            sha.update(f'{os.path.relpath(path, PKG_PATH)}:'
+                       f'{_file_digest(path)}'.encode('utf-8'))
+        return sha.hexdigest()
+
+    def doc_key(self, text: str) -> str:
+        """Return key of the Document made from ``text`` with this cache's
+        pipeline.
+        """
+        sha = hashlib.sha256(self.pipeline_key.encode('utf-8'))
+        sha.update(text.encode('utf-8'))
+        return sha.hexdigest()
+
+    @staticmethod
+    def _param_key_str(param_key: Tuple) -> str:
+        return repr(param_key)
+
+    def get(self, doc_key: str,
+            param_keys: Sequence[Tuple]) -> Optional[List[Any]]:
+        """Return cached values for all of ``param_keys``, or None if any of
+        them are not cached.
+        """
+        cur = self._conn.execute('SELECT param_key, value FROM features '
+                                 'WHERE doc_key = ?', (doc_key,))
+        cached = dict(cur.fetchall())
+        try:
+            return [pickle.loads(cached[self._param_key_str(param_key)])
+                    for param_key in param_keys]
+        except KeyError:
+            return None
+
+    def put(self, doc_key: str, param_keys: Sequence[Tuple],
+            values: Sequence[Any]):
+        """Store ``values`` of ``param_keys`` for a Document."""
+        self._conn.executemany('INSERT OR REPLACE INTO features '
+                               'VALUES (?, ?, ?)',
+                               [(doc_key, self._param_key_str(param_key),
+                                 pickle.dumps(value))
+                                for param_key, value in zip(param_keys,
+                                                            values)])
+        self._conn.commit()
+
+    def __len__(self):
+        """Number of cached feature values."""
+        return self._conn.execute('SELECT COUNT(*) FROM features').fetchone()[0]  # noqa: E501
+
+    def clear(self):
+        """Delete all cached values."""
+        self._conn.execute('DELETE FROM features')
+        self._conn.commit()
+
+    def close(self):
+        self._conn.close()
@@ -1,19 +1,37 @@
 from collections import OrderedDict
 from collections import namedtuple
 from datetime import datetime
+import heapq
+from itertools import islice
+from math import isnan
+from multiprocessing.pool import Pool
+from pathlib import Path
 import sys
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Set
 from typing import Tuple
 from typing import Union
+from warnings import warn
 
 from ..document import Document
 from .feature import Feature
+from .feature_cache import FeatureCache
+from .stream import StreamDocument
 
 __all__ = ['FeatureExtractor']
 
+FeatureCost = namedtuple('FeatureCost', ['name', 'category', 'calls', 'hits',
+                                         'hit_rate', 'total_time',
+                                         'self_time'])
+NaN = float('nan')
+
 
 class FeatureExtractor(OrderedDict):
     name: str
@@ -48,73 +66,638 @@ class FeatureExtractor(OrderedDict):
 
     def new_extractor_from_subset(self, feat_names: List[str] = None,
                                   category_names: List[str] = None,
-                                  extractor_name=None):
+                                  extractor_name=None, max_cost: float = None):
         """Make new FeatureExtractor with a subset of the feature_names in
         `extractor`.
 
         `feature_names` is a list of tuples. The first item is a Feature, and
         the second item is the kwargs to pass to the feature.
+
+        If `max_cost` (seconds per Document) is given, then only a subset of
+        those features is kept, based on the costs measured while extracting
+        features (see :py:meth:`cost_report`). The cheapest feature of each
+        category is always kept, and then the cheapest remaining features are
+        added as long as the total cost stays within `max_cost`. The cost of
+        a feature includes the cost of the dependencies that it does not
+        share with features that have already been kept. Features that have
+        never been computed are not kept.
         """
         feat_names = self._get_cat_and_feat_names(feat_names=feat_names,
                                                   category_names=category_names)  # noqa: E501
+        if max_cost is not None:
+            feat_names = self._select_by_cost(feat_names, max_cost)
         cls = type(self)
         if extractor_name is None:
             extractor_name = datetime.now().strftime('%Y-%m-%d, %H:%M:%S')
         return cls(extractor_name=extractor_name,
                    features={name: self[name] for name in feat_names})
 
+    def _select_by_cost(self, feat_names: List[str],
+                        max_cost: float) -> List[str]:
+        """Choose the cheapest features among `feat_names` that cover all of
+        their categories, and then add other features, cheapest first, up to
+        a total cost of `max_cost`.
+        """
+        def node_cost(name):
+            cost = self._get_feature(name).cost
+            return float('inf') if isnan(cost) else cost  # not measured
+
+        closures = {name: set(self._dependency_graph([name]))
+                    for name in feat_names}
+        chosen: Set[str] = set()
+        covered: Set[str] = set()  # chosen features and their dependencies
+
+        def marginal_cost(name):
+            return sum(node_cost(node) for node in closures[name] - covered)
+
+        total = 0.0
+        by_category: Dict[str, List[str]] = {}
+        for name in feat_names:
+            by_category.setdefault(self[name].category, []).append(name)
+        for category, names in by_category.items():
+            cheapest = min(names, key=marginal_cost)
+            cost = marginal_cost(cheapest)
+            if cost == float('inf'):
+                raise ValueError(f'No costs have been measured for category '
+                                 f'{category!r}.')
+            total += cost
+            chosen.add(cheapest)
+            covered.update(closures[cheapest])
+        if total > max_cost:
+            raise ValueError(f'The cheapest features covering all categories '
+                             f'cost {total:.6f} s, which exceeds max_cost.')
+        # Marginal costs can only decrease as more features are chosen, so a
+        # feature whose updated cost is still the lowest in the heap is the
+        # cheapest one.
+        heap = [(marginal_cost(name), name)
+                for name in feat_names if name not in chosen]
+        heapq.heapify(heap)
+        while heap:
+            cost, name = heapq.heappop(heap)
+            new_cost = marginal_cost(name)
+            if new_cost < cost and heap and new_cost > heap[0][0]:
+                heapq.heappush(heap, (new_cost, name))
+                continue
+            if total + new_cost > max_cost:
+                break
+            total += new_cost
+            chosen.add(name)
+            covered.update(closures[name])
+        return [name for name in feat_names if name in chosen]
+
+    def cost_report(self, by_category=False) -> List[FeatureCost]:
+        """Return the measured costs of the features in this extractor, most
+        expensive first. Costs are measured every time a feature is called
+        (in this process, so only with ``n_jobs=1``).
+
+        Parameters
+        ----------
+
+        by_category
+            Whether to sum the costs of each category, instead of listing
+            each feature
+        """
+        if by_category:
+            groups: Dict[str, List[Feature]] = {}
+            for feat in self.values():
+                groups.setdefault(feat.category, []).append(feat)
+        else:
+            groups = {name: [feat] for name, feat in self.items()}
+        report = []
+        for name, feats in groups.items():
+            calls = sum(feat.calls for feat in feats)
+            hits = sum(feat.hits for feat in feats)
+            report.append(FeatureCost(name, feats[0].category, calls, hits,
+                                      hits / calls if calls else NaN,
+                                      sum(feat.total_time for feat in feats),
+                                      sum(feat.self_time for feat in feats)))
+        return sorted(report, key=lambda row: row.self_time, reverse=True)
+
+    def reset_costs(self):
+        """Reset the measured costs of all features in this extractor."""
+        for feat in self.values():
+            feat.reset_costs()
+
     def __call__(self, docs: Union[List[Document], Document], feat_names=None,
                  category_names: List[str] = None, header=True,
-                 return_named_tuples=True, tsv=False,
+                 return_named_tuples=True, tsv=False, n_jobs=1, chunksize=1,
+                 progress: Callable[[int, int], Any] = None,
+                 cache: FeatureCache = None,
                  **kwargs) -> Union[List[Tuple[Any, ...]], str]:
+        r"""Extract features from one or more Documents.
+
+        Parameters
+        ----------
+
+        docs
+            Document or list of Documents (or :py:class:`StreamDocument` s)
+        feat_names
+            Names of features to extract
+        category_names
+            Names of categories of features to extract
+        header
+            Whether the first row of the output should be the feature names
+        return_named_tuples
+            Whether rows should be namedtuples, rather than tuples
+        tsv
+            Whether to return the output as a tab-separated string
+        n_jobs
+            Number of worker processes to distribute the Documents over. Rows
+            are always returned in the same order as `docs`.
+        chunksize
+            Number of Documents sent to a worker process at a time (only used
+            when ``n_jobs > 1``)
+        progress
+            Function to call as ``progress(n_done, n_total)`` each time a
+            Document is finished
+        cache
+            :py:class:`FeatureCache` to look up rows in before computing
+            them, and to store newly computed rows in
+        \*\*kwargs
+            Keyword arguments passed to every feature
+        """
+        _check_n_jobs(n_jobs)
         feat_names = self._get_cat_and_feat_names(feat_names=feat_names,
                                                   category_names=category_names)  # noqa: E501
-        if return_named_tuples:
-            if sys.version_info < (3, 7) and len(feat_names) > 255:
-                tuple_constructor = tuple
-            else:
-                tuple_constructor = namedtuple('Features', feat_names)  # type: ignore  # noqa: E501
-        else:
-            tuple_constructor = tuple
+        tuple_constructor = _tuple_constructor(feat_names,
+                                               return_named_tuples)
+        docs = self._as_doc_list(docs)
+        schedule = self._schedule(feat_names)
         output = []
         if header:
             output.append(feat_names)
-        if ((hasattr(docs, '__iter__') or hasattr(docs, '__getitem__'))
-                and isinstance(next(iter(docs)), Document)):
-            for doc in docs:
-                doc.features = self._call_features(doc,  # type: ignore
-                                                   feat_names=feat_names,
-                                                   tuple_constructor=tuple_constructor,  # noqa: E501
-                                                   **kwargs)
-                output.append(doc.features)
-        elif isinstance(docs, Document):
-            docs.features = self._call_features(docs,
-                                                feat_names=feat_names,
-                                                tuple_constructor=tuple_constructor,  # noqa: E501
-                                                **kwargs)
-            output.append(docs.features)
+        if cache is None:
+            rows = self._iter_rows(docs, feat_names=feat_names,
+                                   schedule=schedule, n_jobs=n_jobs,
+                                   chunksize=chunksize, **kwargs)
         else:
-            raise TypeError('Expected Document or list of Documents; got '
-                            f'{type(docs)}.')
+            rows = self._iter_cached_rows(docs, cache, feat_names=feat_names,
+                                          schedule=schedule, n_jobs=n_jobs,
+                                          chunksize=chunksize, **kwargs)
+        for i, (doc, row) in enumerate(zip(docs, rows), start=1):
+            doc.features = self._construct_row(tuple_constructor, row)
+            output.append(doc.features)
+            if progress is not None:
+                progress(i, len(docs))
         if tsv:
-            return '\n'.join('\t'.join(row) for row in output)
+            return '\n'.join('\t'.join(str(val) for val in row)
+                             for row in output)
         else:
             return output
 
-    def _call_features(self, doc: Document, feat_names=(),
-                       tuple_constructor=tuple, **kwargs):
-        row = []
+    def extract_texts(self, texts: List[str], cache: FeatureCache,
+                      feat_names=None, category_names: List[str] = None,
+                      header=True, return_named_tuples=True, n_jobs=1,
+                      chunksize=1, **kwargs) -> List[Tuple[Any, ...]]:
+        r"""Extract features from texts, using a :py:class:`FeatureCache`.
+
+        Texts whose rows are already cached are not tokenized, analyzed, etc.
+        at all. Other texts are made into Documents with the keyword
+        arguments of `cache` (``Document(text, **cache.doc_kwargs)``).
+
+        Parameters
+        ----------
+
+        texts
+            List of texts
+        cache
+            Cache to look up rows in, and to store newly computed rows in
+        feat_names
+            Names of features to extract
+        category_names
+            Names of categories of features to extract
+        header
+            Whether the first row of the output should be the feature names
+        return_named_tuples
+            Whether rows should be namedtuples, rather than tuples
+        n_jobs
+            Number of worker processes to distribute the Documents over
+        chunksize
+            Number of Documents sent to a worker process at a time
+        \*\*kwargs
+            Keyword arguments passed to every feature
+        """
+        _check_n_jobs(n_jobs)
+        feat_names = self._get_cat_and_feat_names(feat_names=feat_names,
+                                                  category_names=category_names)  # noqa: E501
+        tuple_constructor = _tuple_constructor(feat_names,
+                                               return_named_tuples)
+        output: List[Any] = [feat_names] if header else []
+        rows = self._iter_cached_rows(texts, cache, feat_names=feat_names,
+                                      schedule=self._schedule(feat_names),
+                                      n_jobs=n_jobs, chunksize=chunksize,
+                                      **kwargs)
+        output.extend(self._construct_row(tuple_constructor, row)
+                      for row in rows)
+        return output
+
+    def to_array(self, docs: Union[List[Document], Document],
+                 feat_names=None, category_names: List[str] = None,
+                 out=None, mmap_path: Union[str, Path] = None, n_jobs=1,
+                 chunksize=1, progress: Callable[[int, int], Any] = None,
+                 **kwargs) -> Tuple[Any, List[str]]:
+        r"""Extract features directly into a 2-dimensional float64
+        :py:mod:`numpy` array, with one row per Document. This avoids
+        creating a Python object for every value. Requires :py:mod:`numpy`.
+
+        ``NaN`` (e.g. from ``zero_div_val``) and ``None`` are both stored as
+        ``nan``. Return a tuple of the array and the list of column (feature)
+        names.
+
+        Parameters
+        ----------
+
+        docs
+            Document or list of Documents
+        feat_names
+            Names of features to extract
+        category_names
+            Names of categories of features to extract
+        out
+            Preallocated array to write to. Its shape must be (number of
+            Documents, number of features).
+        mmap_path
+            If given (and `out` is not), write to a new memory-mapped
+            ``.npy`` file at this path, instead of an array in memory.
+        n_jobs
+            Number of worker processes to distribute the Documents over
+        chunksize
+            Number of Documents sent to a worker process at a time
+        progress
+            Function to call as ``progress(n_done, n_total)`` each time a
+            Document is finished
+        \*\*kwargs
+            Keyword arguments passed to every feature
+        """
+        np = _import_numpy()
+        _check_n_jobs(n_jobs)
+        docs = self._as_doc_list(docs)
+        feat_names = self._get_cat_and_feat_names(feat_names=feat_names,
+                                                  category_names=category_names)  # noqa: E501
+        shape = (len(docs), len(feat_names))
+        if out is None:
+            if mmap_path is None:
+                out = np.empty(shape, dtype=np.float64)
+            else:
+                out = np.lib.format.open_memmap(mmap_path, mode='w+',
+                                                dtype=np.float64, shape=shape)
+        elif out.shape != shape:
+            raise ValueError(f'out must have shape {shape}; got {out.shape}.')
+        rows = self._iter_rows(docs, feat_names=feat_names,
+                               schedule=self._schedule(feat_names),
+                               n_jobs=n_jobs, chunksize=chunksize, **kwargs)
+        for i, row in enumerate(rows):
+            out[i] = row
+            if progress is not None:
+                progress(i + 1, len(docs))
+        return out, feat_names
+
+    def to_npy(self, docs: Iterable[Document], path: Union[str, Path],
+               n_docs: int = None, feat_names=None,
+               category_names: List[str] = None, chunk_size=1024, n_jobs=1,
+               progress: Callable[[int, int], Any] = None,
+               **kwargs) -> List[str]:
+        r"""Extract features into a float64 ``.npy`` file, one chunk of
+        Documents at a time, so that neither the Documents nor the feature
+        matrix need to fit in memory. Requires :py:mod:`numpy`.
+
+        Return the list of column (feature) names. The file can be loaded with
+        ``numpy.load(path, mmap_mode='r')``.
+
+        Parameters
+        ----------
+
+        docs
+            Iterable of Documents, e.g. a generator that reads and parses
+            them one at a time
+        path
+            Path of the ``.npy`` file to write
+        n_docs
+            Number of Documents in `docs`. Required if `docs` has no
+            ``len()``.
+        feat_names
+            Names of features to extract
+        category_names
+            Names of categories of features to extract
+        chunk_size
+            Number of Documents to process before flushing to disk
+        n_jobs
+            Number of worker processes to distribute each chunk over
+        progress
+            Function to call as ``progress(n_done, n_total)`` each time a
+            Document is finished
+        \*\*kwargs
+            Keyword arguments passed to every feature
+        """
+        np = _import_numpy()
+        if n_docs is None:
+            try:
+                n_docs = len(docs)  # type: ignore
+            except TypeError as e:
+                raise TypeError('n_docs must be given when docs has no '
+                                'len().') from e
+        if chunk_size < 1:
+            raise ValueError(f'chunk_size must be at least 1; got '
+                             f'{chunk_size}.')
+        _check_n_jobs(n_jobs)
+        feat_names = self._get_cat_and_feat_names(feat_names=feat_names,
+                                                  category_names=category_names)  # noqa: E501
+        schedule = self._schedule(feat_names)
+        out = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64,
+                                        shape=(n_docs, len(feat_names)))
+        i = 0
+        docs = iter(docs)
+        # One pool for all chunks, so that workers load resources only once
+        pool = (self._make_pool(n_jobs, feat_names, schedule, kwargs)
+                if n_jobs > 1 else None)
+        try:
+            while True:
+                chunk = list(islice(docs, chunk_size))
+                if not chunk:
+                    break
+                if i + len(chunk) > n_docs:
+                    raise ValueError(f'Expected {n_docs} Documents; got '
+                                     'more.')
+                for row in self._iter_rows(chunk, feat_names=feat_names,
+                                           schedule=schedule, chunksize=1,
+                                           pool=pool, **kwargs):
+                    out[i] = row
+                    i += 1
+                    if progress is not None:
+                        progress(i, n_docs)
+                out.flush()
+        finally:
+            if pool is not None:
+                pool.terminate()
+        if i != n_docs:
+            raise ValueError(f'Expected {n_docs} Documents; got {i}.')
+        del out  # close the memory map
+        return feat_names
+
+    @staticmethod
+    def _as_doc_list(docs: Union[List[Document], Document]) -> List[Document]:  # noqa: E501
+        if isinstance(docs, (Document, StreamDocument)):
+            return [docs]
+        elif ((hasattr(docs, '__iter__') or hasattr(docs, '__getitem__'))
+                and isinstance(next(iter(docs)), (Document, StreamDocument))):
+            return list(docs)
+        else:
+            raise TypeError('Expected Document or list of Documents; got '
+                            f'{type(docs)}.')
+
+    def _make_pool(self, n_jobs: int, feat_names: List[str], schedule,
+                   kwargs: Dict) -> Pool:
+        """Start `n_jobs` worker processes that compute `feat_names`."""
+        return Pool(processes=n_jobs, initializer=_init_worker,
+                    initargs=(self, feat_names, schedule, kwargs))
+
+    def _iter_rows(self, docs: List[Document], feat_names: List[str],
+                   schedule, n_jobs=1, chunksize=1, pool: Pool = None,
+                   **kwargs) -> Iterator[Tuple[Any, ...]]:
+        """Yield a tuple of feature values for each Document, in order.
+
+        If `pool` (from :py:meth:`_make_pool`) is given, the Documents are
+        distributed over its workers, instead of over a new pool of `n_jobs`
+        workers.
+        """
+        if pool is None and (n_jobs == 1 or len(docs) < 2):
+            for doc in docs:
+                yield self._call_features(doc, feat_names=feat_names,
+                                          schedule=schedule, **kwargs)
+            return
+        old_features = [doc.features for doc in docs]
+        for doc in docs:  # old namedtuple rows cannot be pickled
+            doc.features = None
+        try:
+            if pool is None:
+                with self._make_pool(min(n_jobs, len(docs)), feat_names,
+                                     schedule, kwargs) as pool:
+                    yield from pool.imap(_worker_call_features, docs,
+                                         chunksize=chunksize)
+            else:
+                yield from pool.imap(_worker_call_features, docs,
+                                     chunksize=chunksize)
+        finally:
+            for doc, features in zip(docs, old_features):
+                if doc.features is None:  # not replaced with a new row
+                    doc.features = features
+
+    def _iter_cached_rows(self, docs: List[Union[Document, str]],
+                          cache: FeatureCache, feat_names: List[str],
+                          schedule, n_jobs=1, chunksize=1,
+                          **kwargs) -> Iterator[Tuple[Any, ...]]:
+        """Yield a tuple of feature values for each Document (or text), in
+        order. Rows are looked up in `cache` first. Only the remaining
+        Documents are processed (texts are first made into Documents), and
+        their rows are added to `cache`.
+
+        Documents are made and processed ``n_jobs * chunksize`` at a time,
+        so that a cold cache does not require all of them to be in memory at
+        once.
+        """
+        param_keys = [self._get_feature(name).param_key(**kwargs)
+                      for name in feat_names]
+        batch_size = n_jobs * chunksize
+        pool = None
+        try:
+            for start in range(0, len(docs), batch_size):
+                batch = docs[start:start + batch_size]
+                doc_keys = [cache.doc_key(doc if isinstance(doc, str)
+                                          else doc.text)
+                            for doc in batch]
+                cached = [cache.get(doc_key, param_keys)
+                          for doc_key in doc_keys]
+                misses = [Document(doc, **cache.doc_kwargs)
+                          if isinstance(doc, str) else doc
+                          for doc, row in zip(batch, cached) if row is None]
+                if misses and n_jobs > 1 and pool is None:
+                    pool = self._make_pool(n_jobs, feat_names, schedule,
+                                           kwargs)
+                computed = self._iter_rows(misses, feat_names=feat_names,
+                                           schedule=schedule,
+                                           chunksize=chunksize, pool=pool,
+                                           **kwargs)
+                for doc_key, row in zip(doc_keys, cached):
+                    if row is None:
+                        row = next(computed)
+                        cache.put(doc_key, param_keys, row)
+                    yield tuple(row)
+        finally:
+            if pool is not None:
+                pool.terminate()
+
+    def _get_feature(self, name: str) -> Feature:
+        """Look up a feature in this extractor, or else in ``ALL``."""
+        try:
+            return self[name]
+        except KeyError:
+            from .features import ALL  # avoid circular import
+            return ALL[name]
+
+    def _dependency_graph(self, feat_names: List[str]) -> Dict[str, List[str]]:  # noqa: E501
+        """Map each feature needed to compute `feat_names` (including
+        features that are only needed indirectly) to the names of the
+        features it depends on.
+        """
+        graph: Dict[str, List[str]] = {}
+        stack = list(feat_names)
+        while stack:
+            name = stack.pop()
+            if name not in graph:
+                graph[name] = list(self._get_feature(name).depends_on)
+                stack.extend(graph[name])
+        return graph
+
+    def _schedule(self, feat_names: List[str]) -> Tuple[List[str], Dict[str, Set[str]]]:  # noqa: E501
+        """Order `feat_names` so that every feature is computed after the
+        requested features that it depends on, and determine when the cached
+        values of priors (features whose names start with ``_``) are no
+        longer needed.
+
+        Return a list of the unique names in `feat_names`, in the order in
+        which they should be computed, and a dict mapping names from that
+        list to the set of priors that can be freed after computing them.
+        Raise ValueError if the dependencies are circular.
+        """
+        graph = self._dependency_graph(feat_names)
+        requested = set(feat_names)
+        order = []
+        closures: Dict[str, Set[str]] = {}
+        in_progress: List[str] = []
+
+        def visit(name):
+            if name in closures:
+                return
+            if name in in_progress:
+                cycle = in_progress[in_progress.index(name):] + [name]
+                raise ValueError('Circular feature dependencies: '
+                                 f'{" -> ".join(cycle)}')
+            in_progress.append(name)
+            closure = set()
+            for dep in graph[name]:
+                visit(dep)
+                closure.add(dep)
+                closure.update(closures[dep])
+            in_progress.pop()
+            closures[name] = closure
+            if name in requested:
+                order.append(name)
+
         for name in feat_names:
-            feature = self[name]
-            row.append(feature(doc, **kwargs))
+            visit(name)
+
+        priors = {name for name in graph if name.startswith('_')}
+        last_consumer: Dict[str, str] = {}
+        for name in order:
+            # Features that depend on unresolved names might need any prior
+            if any(self._get_feature(dep).unresolved_deps
+                   for dep in closures[name] | {name}):
+                needed = priors
+            else:
+                needed = closures[name] & priors
+            for prior in needed:
+                last_consumer[prior] = name
+        frees: Dict[str, Set[str]] = {}
+        for prior, name in last_consumer.items():
+            frees.setdefault(name, set()).add(prior)
+        return order, frees
+
+    def _depending_on(self, feat_names: List[str],
+                      deps: FrozenSet[str]) -> Set[str]:
+        """Return the names in `feat_names` that are in `deps`, or that
+        depend on any of them (directly or indirectly).
+        """
+        graph = self._dependency_graph(feat_names)
+        depending: Dict[str, bool] = {}
+
+        def visit(name):
+            if name not in depending:
+                depending[name] = False  # cycles are reported by _schedule
+                depending[name] = (name in deps
+                                   or any([visit(dep) for dep in graph[name]]))
+            return depending[name]
+
+        return {name for name in feat_names if visit(name)}
+
+    def _call_features(self, doc: Union[Document, StreamDocument],
+                       feat_names=(), tuple_constructor=tuple, schedule=None,
+                       **kwargs):
+        if schedule is None:
+            schedule = self._schedule(feat_names)
+        order, frees = schedule
+        values = {}
+        if isinstance(doc, StreamDocument):
+            for name in self._depending_on(order, doc.unsupported_features):
+                values[name] = NaN
+            if values:
+                warn(f'{len(values)} features cannot be computed from a '
+                     'StreamDocument, because it has no dependency parse. '
+                     'Their values are NaN.', stacklevel=2)
+        for name in order:
+            if name not in values:
+                values[name] = self[name](doc, **kwargs)
+            if name in frees:  # free priors that are no longer needed
+                to_free = frees[name]
+                for key in [key for key in doc._feat_cache
+                            if key[0] in to_free]:
+                    del doc._feat_cache[key]
+        row = [values[name] for name in feat_names]
         doc._feat_cache = {}  # delete cache to save memory
-        try:
-            return tuple_constructor(*row)
-        except TypeError:
-            return tuple_constructor(row)
+        return self._construct_row(tuple_constructor, row)
+
+    @staticmethod
+    def _construct_row(tuple_constructor, row):
+        if tuple_constructor is tuple:
+            return tuple(row)
+        return tuple_constructor(*row)
 
     def info(self):
         hline = '\n' + '=' * 79 + '\n'
         return hline.join([feat.info()
                            for _, feat in sorted(self.items(),
                                                  key=lambda x: x[1].category)])
+
+
+def _check_n_jobs(n_jobs: int):
+    if n_jobs < 1:
+        raise ValueError(f'n_jobs must be at least 1; got {n_jobs}.')
+
+
+def _tuple_constructor(feat_names: List[str],
+                       return_named_tuples: bool) -> Callable:
+    """Return the constructor of output rows: a namedtuple of `feat_names`,
+    or tuple if `return_named_tuples` is False, or if there are too many
+    names for a namedtuple (more than 255, before Python 3.7).
+    """
+    if (not return_named_tuples
+            or sys.version_info < (3, 7) and len(feat_names) > 255):
+        return tuple
+    return namedtuple('Features', feat_names)
+
+
+def _import_numpy():
+    try:
+        import numpy  # type: ignore
+    except ModuleNotFoundError as e:
+        raise ModuleNotFoundError('numpy is required for array output. Try '
+                                  '`python3 -m pip install --user numpy`.'
+                                  ) from e
+    return numpy
+
+
+# State of worker processes used by FeatureExtractor(..., n_jobs=N). Lexical
+# resources (frequency dicts, etc.) are loaded lazily by each worker, so they
+# are only loaded once per worker.
+_worker_args: Optional[Tuple[FeatureExtractor, List[str], Any, Dict]] = None
+
+
+def _init_worker(extractor: FeatureExtractor, feat_names: List[str],
+                 schedule, kwargs: Dict):
+    global _worker_args
+    _worker_args = (extractor, feat_names, schedule, kwargs)
+
+
+def _worker_call_features(doc: Document) -> Tuple[Any, ...]:
+    extractor, feat_names, schedule, kwargs = _worker_args  # type: ignore
+    return extractor._call_features(doc, feat_names=feat_names,
+                                    schedule=schedule, **kwargs)
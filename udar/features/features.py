@@ -1,14 +1,17 @@
+from collections import namedtuple
+import os
 import pickle
-from pkg_resources import resource_filename
-from typing import Dict
+from typing import Mapping
 from typing import Optional
 from typing import Union
 from warnings import warn
 
+from ..misc import RSRC_PATH
 from ..tag import Tag
 from ..tag import tag_dict
 from .feature import Feature
 from .feature_extractor import FeatureExtractor
+from .mmap_dict import MmapDict
 
 MAX_SYLL = 8
 MOST_LIKELY = 'stanza'  # `method` argument to Token.most_likely_reading()
@@ -22,17 +25,20 @@ tags_by_ms_feat = {ms_feat: tuple(tag_name
                                   if tag.ms_feat == ms_feat)
                    for ms_feat in ms_feats}
 
-RSRC_PATH = resource_filename('udar', 'resources/')
-kelly_dict: Optional[Dict] = None
-lexmin_dict: Optional[Dict] = None
-RNC_tok_freq_dict: Optional[Dict] = None
-RNC_tok_freq_rank_dict: Optional[Dict] = None
-Sharoff_lem_freq_dict: Optional[Dict] = None
-Sharoff_lem_freq_rank_dict: Optional[Dict] = None
-tix_morph_count_dict: Optional[Dict] = None
+kelly_dict: Optional[Mapping] = None
+lexmin_dict: Optional[Mapping] = None
+RNC_tok_freq_dict: Optional[Mapping] = None
+RNC_tok_freq_rank_dict: Optional[Mapping] = None
+Sharoff_lem_freq_dict: Optional[Mapping] = None
+Sharoff_lem_freq_rank_dict: Optional[Mapping] = None
+tix_morph_count_dict: Optional[Mapping] = None
 
 ALL = FeatureExtractor(extractor_name='All')
 
+# Everything the lemma-based lexical resources say about one lemma
+LemmaRecord = namedtuple('LemmaRecord', ['freq', 'freq_rank', 'kelly_level',
+                                         'lexmin_level', 'morph_count'])
+
 
 def add_to_ALL(name, category=None, depends_on=None):
     def decorator(func):
@@ -43,62 +49,81 @@ def add_to_ALL(name, category=None, depends_on=None):
     return decorator
 
 
+def _load_resource(name: str) -> Mapping:
+    """Load a lexical resource from its memory-mapped ``.mdict`` file, which
+    is much faster to open, and is shared between processes. If there is no
+    ``.mdict`` file, unpickle the ``.pkl`` file instead. Both are generated by
+    ``resources/src/make_pkls.py``.
+    """
+    mdict_path = f'{RSRC_PATH}{name}.mdict'
+    if os.path.exists(mdict_path):
+        return MmapDict(mdict_path)
+    with open(f'{RSRC_PATH}{name}.pkl', 'rb') as f:
+        return pickle.load(f)
+
+
 def _get_kelly_dict():
     global kelly_dict
     if kelly_dict is None:
-        with open(f'{RSRC_PATH}kelly_dict.pkl', 'rb') as f:
-            kelly_dict = pickle.load(f)
+        kelly_dict = _load_resource('kelly_dict')
     return kelly_dict
 
 
 def _get_lexmin_dict():
     global lexmin_dict
     if lexmin_dict is None:
-        with open(f'{RSRC_PATH}lexmin_dict.pkl', 'rb') as f:
-            lexmin_dict = pickle.load(f)
+        lexmin_dict = _load_resource('lexmin_dict')
     return lexmin_dict
 
 
 def _get_RNC_tok_freq_dict():
     global RNC_tok_freq_dict
     if RNC_tok_freq_dict is None:
-        with open(f'{RSRC_PATH}RNC_tok_freq_dict.pkl', 'rb') as f:
-            RNC_tok_freq_dict = pickle.load(f)
+        RNC_tok_freq_dict = _load_resource('RNC_tok_freq_dict')
     return RNC_tok_freq_dict
 
 
 def _get_RNC_tok_freq_rank_dict():
     global RNC_tok_freq_rank_dict
     if RNC_tok_freq_rank_dict is None:
-        with open(f'{RSRC_PATH}RNC_tok_freq_rank_dict.pkl', 'rb') as f:
-            RNC_tok_freq_rank_dict = pickle.load(f)
+        RNC_tok_freq_rank_dict = _load_resource('RNC_tok_freq_rank_dict')
     return RNC_tok_freq_rank_dict
 
 
 def _get_Sharoff_lem_freq_dict():
     global Sharoff_lem_freq_dict
     if Sharoff_lem_freq_dict is None:
-        with open(f'{RSRC_PATH}Sharoff_lem_freq_dict.pkl', 'rb') as f:
-            Sharoff_lem_freq_dict = pickle.load(f)
+        Sharoff_lem_freq_dict = _load_resource('Sharoff_lem_freq_dict')
     return Sharoff_lem_freq_dict
 
 
 def _get_Sharoff_lem_freq_rank_dict():
     global Sharoff_lem_freq_rank_dict
     if Sharoff_lem_freq_rank_dict is None:
-        with open(f'{RSRC_PATH}Sharoff_lem_freq_rank_dict.pkl', 'rb') as f:
-            Sharoff_lem_freq_rank_dict = pickle.load(f)
+        Sharoff_lem_freq_rank_dict = _load_resource('Sharoff_lem_freq_rank_dict')  # noqa: E501
     return Sharoff_lem_freq_rank_dict
 
 
 def _get_tix_morph_count_dict():
     global tix_morph_count_dict
     if tix_morph_count_dict is None:
-        with open(f'{RSRC_PATH}Tix_morph_count_dict.pkl', 'rb') as f:
-            tix_morph_count_dict = pickle.load(f)
+        tix_morph_count_dict = _load_resource('Tix_morph_count_dict')
     return tix_morph_count_dict
 
 
+def _get_lemma_record(lemma: str) -> LemmaRecord:
+    """Look up `lemma` in all of the lemma-based lexical resources at once.
+
+    Lemmas that are not in a resource get a frequency/rank of 0, or a level/
+    morph count of None, respectively.
+    """
+    freq = _get_Sharoff_lem_freq_dict().get(lemma, 0)
+    freq_rank = _get_Sharoff_lem_freq_rank_dict().get(lemma, 0)
+    return LemmaRecord(freq, freq_rank, _get_kelly_dict().get(lemma),
+                       _get_lexmin_dict().get(lemma),
+                       _get_tix_morph_count_dict().get(lemma))
+
+
 def safe_tag_name(tag: Union[str, Tag]) -> str:
     """Convert tag name to valid python variable name."""
     return str(tag).replace('/', '_')
@@ -9,11 +9,8 @@ from typing import Union
 from ..document import Document
 from ..tag import Tag
 from .feature import Feature
-from .features import _get_lexmin_dict
-from .features import _get_kelly_dict
 from .features import add_to_ALL
 from .features import ALL
-from .features import MOST_LIKELY
 from .features import NaN
 from .features import warn_about_irrelevant_argument
 
@@ -24,10 +21,10 @@ def num_words_at_lexmin_level(level, doc: Document) -> int:
     """Count number of words in a Document at LEVEL in the
     "lexical minimum" (лексический минимум) of the TORFL (ТРКИ) test.
     """
-    lexmin_dict = _get_lexmin_dict()
-    return len([1 for tok in doc
-                if any(lexmin_dict.get(lem) == level
-                       for lem in tok.most_likely_lemmas(method=MOST_LIKELY))])
+    stats = ALL['_token_stats'](doc)
+    records = ALL['_lemma_records'](doc)
+    return len([1 for lemmas in stats.lemmas
+                if any(records[lem].lexmin_level == level for lem in lemmas)])
 for level in ['A1', 'A2', 'B1', 'B2']:  # noqa: E305
     name = f'num_words_at_lexmin_{level}'
     this_partial = partial(num_words_at_lexmin_level, level)
@@ -67,10 +64,10 @@ def num_words_at_kelly_level(level, doc: Document) -> int:
     """Count number of words in a Document at LEVEL in the
     Kelly Project (Kilgarriff et al., 2014).
     """
-    kelly_dict = _get_kelly_dict()
-    return len([1 for tok in doc
-                if any(kelly_dict.get(lem) == level
-                       for lem in tok.most_likely_lemmas(method=MOST_LIKELY))])
+    stats = ALL['_token_stats'](doc)
+    records = ALL['_lemma_records'](doc)
+    return len([1 for lemmas in stats.lemmas
+                if any(records[lem].kelly_level == level for lem in lemmas)])
 for level in ['A1', 'A2', 'B1', 'B2', 'C1', 'C2']:  # noqa: E305
     name = f'num_words_at_kelly_{level}'
     this_partial = partial(num_words_at_kelly_level, level)
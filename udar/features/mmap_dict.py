@@ -0,0 +1,225 @@
+"""Read-only dict of lexical resources that is looked up directly from a
+memory-mapped file, without unpickling.
+
+File layout (all integers are little-endian, and every section is aligned to
+8 bytes)::
+
+    magic         8 bytes   b'UDARMD01'
+    value type    8 bytes   b'd' (float), b'q' (int), b'n' (mix of floats and
+                            ints), or b's' (str), padded
+    n             uint64    number of keys
+    key offsets   (n + 1) x uint64, into the key blob
+    key blob      utf-8 encoded keys, sorted by their utf-8 bytes
+    m             uint64    size of the hash table (a power of 2 >= 2n)
+    hash table    m x uint32, 1 + index of key (0 means empty)
+    values        n x float64 | n x int64 | n x float64 + n x uint8 (1 if the
+                  value is an int) | (n + 1) x uint64 offsets + blob
+
+Keys are looked up in the hash table (CRC32 with linear probing). The pages of
+the file are shared by every process that opens it (via the OS page cache),
+and opening it costs almost nothing.
+"""
+
+from array import array
+import mmap
+import struct
+import sys
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import Mapping
+from typing import Union
+from zlib import crc32
+
+__all__ = ['MmapDict', 'write_mmap_dict']
+
+MAGIC = b'UDARMD01'
+VALUE_TYPES = {float: b'd', int: b'q', str: b's'}
+MAX_EXACT_INT = 2 ** 53  # larger ints cannot be stored exactly as float64
+
+
+def _pad(n: int) -> bytes:
+    return b'\x00' * (-n % 8)
+
+
+def _cast(buf: memoryview, fmt: str):
+    """View the little-endian items in `buf` as a sequence of `fmt` items.
+    On big-endian machines, the items are copied and byte-swapped instead.
+    """
+    if sys.byteorder == 'big':  # pragma: no cover
+        items = array(fmt, bytes(buf))
+        items.byteswap()
+        return items
+    return buf.cast(fmt)  # type: ignore[call-overload]
+
+
+def write_mmap_dict(dct: Dict[str, Union[float, int, str]], path: str):
+    """Write a dict, whose values are all numbers (floats and/or ints), or
+    all strs, to ``path`` in the format read by :py:class:`MmapDict`. The
+    type of each value is preserved.
+    """
+    value_types = {type(v) for v in dct.values()}
+    if not value_types:
+        value_types = {float}
+    if value_types == {float, int}:
+        if any(abs(v) > MAX_EXACT_INT for v in dct.values()
+               if isinstance(v, int)):
+            raise TypeError('Ints mixed with floats must be at most 2 ** 53.')
+        value_type = b'n'
+    elif len(value_types) > 1 or not value_types <= set(VALUE_TYPES):
+        raise TypeError('Values must be all numbers, or all strs; got '
+                        f'{value_types}.')
+    else:
+        value_type = VALUE_TYPES[value_types.pop()]
+    items = sorted((k.encode('utf-8'), v) for k, v in dct.items())
+    n = len(items)
+    with open(path, 'wb') as f:
+        f.write(MAGIC + value_type + _pad(1) + struct.pack('<Q', n))
+        key_blob = b''.join(k for k, v in items)
+        offsets = [0]
+        for k, v in items:
+            offsets.append(offsets[-1] + len(k))
+        f.write(struct.pack(f'<{n + 1}Q', *offsets))
+        f.write(key_blob + _pad(len(key_blob)))
+        m = 1
+        while m < 2 * n:
+            m *= 2
+        table = [0] * m
+        for i, (k, v) in enumerate(items):
+            h = crc32(k) & (m - 1)
+            while table[h]:
+                h = (h + 1) & (m - 1)
+            table[h] = i + 1
+        f.write(struct.pack('<Q', m) + struct.pack(f'<{m}I', *table))
+        f.write(_pad(4 * m))
+        if value_type == b's':
+            encoded = [str(v).encode('utf-8') for k, v in items]  # all strs
+            offsets = [0]
+            for value in encoded:
+                offsets.append(offsets[-1] + len(value))
+            f.write(struct.pack(f'<{n + 1}Q', *offsets))
+            f.write(b''.join(encoded))
+        elif value_type == b'n':
+            f.write(struct.pack(f'<{n}d', *(v for k, v in items)))
+            f.write(bytes(isinstance(v, int) for k, v in items))
+        else:
+            f.write(struct.pack(f'<{n}{value_type.decode()}',
+                                *(v for k, v in items)))
+
+
+class MmapDict(Mapping):
+    """Read-only mapping from strs to floats, ints or strs, as written by
+    :py:func:`write_mmap_dict`.
+
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as tmpdir:
+    ...     write_mmap_dict({'б': 2, 'а': 1}, f'{tmpdir}/test.mdict')
+    ...     md = MmapDict(f'{tmpdir}/test.mdict')
+    ...     print(md['а'], md.get('в'), list(md), len(md))
+    ...     md.close()
+    ...     write_mmap_dict({'б': 2.5, 'а': 1}, f'{tmpdir}/test.mdict')
+    ...     md = MmapDict(f'{tmpdir}/test.mdict')
+    ...     print(md['а'], md['б'])
+    ...     md.close()
+    1 None ['а', 'б'] 2
+    1 2.5
+    """
+    __slots__ = ['_is_int', '_key_blob', '_key_offsets', '_len',
+                 '_mask', '_mmap', '_table', '_value_blob', '_value_offsets',
+                 '_values', 'path', 'value_type']
+    _len: int
+    _mask: int
+    path: str
+    value_type: str
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:  # the map stays valid after closing
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = memoryview(self._mmap)
+        if bytes(buf[:8]) != MAGIC:
+            self.close()
+            raise ValueError(f'{path} is not an MmapDict file.')
+        self.value_type = bytes(buf[8:9]).decode()
+        n, = struct.unpack('<Q', buf[16:24])
+        self._len = n
+        pos = 24
+        self._key_offsets = _cast(buf[pos:pos + 8 * (n + 1)], 'Q')
+        pos += 8 * (n + 1)
+        blob_len = self._key_offsets[n]
+        self._key_blob = buf[pos:pos + blob_len]
+        pos += blob_len + (-blob_len % 8)
+        m, = struct.unpack('<Q', buf[pos:pos + 8])
+        self._mask = m - 1
+        pos += 8
+        self._table = _cast(buf[pos:pos + 4 * m], 'I')
+        pos += 4 * m + (-4 * m % 8)
+        if self.value_type == 's':
+            self._value_offsets = _cast(buf[pos:pos + 8 * (n + 1)], 'Q')
+            pos += 8 * (n + 1)
+            self._value_blob = buf[pos:]
+        elif self.value_type == 'n':
+            self._values = _cast(buf[pos:pos + 8 * n], 'd')
+            self._is_int = buf[pos + 8 * n:pos + 9 * n]
+        else:
+            self._values = _cast(buf[pos:pos + 8 * n], self.value_type)
+
+    def _index(self, key: str) -> int:
+        """Return the index of ``key``, or -1 if it is not a key."""
+        try:
+            encoded = key.encode('utf-8')
+        except AttributeError:  # not a str
+            return -1
+        table = self._table
+        h = crc32(encoded) & self._mask
+        while table[h]:
+            i = table[h] - 1
+            if self._key(i) == encoded:
+                return i
+            h = (h + 1) & self._mask
+        return -1
+
+    def _key(self, i: int) -> bytes:
+        return bytes(self._key_blob[self._key_offsets[i]:
+                                    self._key_offsets[i + 1]])
+
+    def _value(self, i: int) -> Any:
+        if self.value_type == 's':
+            start = self._value_offsets[i]
+            end = self._value_offsets[i + 1]
+            return bytes(self._value_blob[start:end]).decode('utf-8')
+        elif self.value_type == 'n' and self._is_int[i]:
+            return int(self._values[i])
+        return self._values[i]
+
+    def __getitem__(self, key: str) -> Any:
+        i = self._index(key)
+        if i < 0:
+            raise KeyError(key)
+        return self._value(i)
+
+    def __contains__(self, key) -> bool:
+        return self._index(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._key(i).decode('utf-8') for i in range(len(self)))
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __repr__(self):
+        return f'MmapDict({self.path!r})'
+
+    def __reduce__(self):
+        """Pickle by path, so that each process maps the file itself."""
+        return (type(self), (self.path,))
+
+    def close(self):
+        """Release the memory map."""
+        for attr in ('_is_int', '_key_blob', '_key_offsets', '_table',
+                     '_values', '_value_offsets', '_value_blob'):
+            try:
+                delattr(self, attr)
+            except AttributeError:
+                pass
+        self._mmap.close()
@@ -7,7 +7,6 @@ from .feature import Feature
 from .features import add_to_ALL
 from .features import ALL
 from .features import ms_feats
-from .features import MOST_LIKELY
 from .features import NaN
 from .features import safe_ms_feat_name
 from .features import safe_tag_name
@@ -22,14 +21,10 @@ def num_types_ms_feat(ms_feat: str, doc: Document, rmv_punc=False) -> int:
     feature.
     """
     has_tag = tags_by_ms_feat[ms_feat]
-    toks = ALL['_filter_toks'](doc, has_tag=has_tag, rmv_punc=rmv_punc)
-    counter = 0
-    for tok in toks:
-        for tag in tok.most_likely_reading(method=MOST_LIKELY).grouped_tags:
-            if tag.ms_feat == ms_feat:
-                counter += 1
-                break
-    return counter
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag=has_tag,
+                                         rmv_punc=rmv_punc)
+    return len([1 for i in positions if ms_feat in stats.mlr_ms_feats[i]])
 for ms_feat in ms_feats - {'POS'}:  # noqa: E305
     name = f'num_types_ms_feat_{safe_ms_feat_name(ms_feat)}'
     this_partial = partial(num_types_ms_feat, ms_feat)
@@ -42,11 +37,12 @@ for ms_feat in ms_feats - {'POS'}:  # noqa: E305
 @add_to_ALL('num_abstract_nouns', category='Morphology')
 def num_abstract_nouns(doc: Document, rmv_punc=True) -> int:
     """Count the number of abstract tokens on the basis of endings."""
-    toks = ALL['_filter_toks'](doc, has_tag='N', rmv_punc=rmv_punc)
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag='N', rmv_punc=rmv_punc)
     abstract_re = r'(?:ье|ие|ство|ация|ость|изм|изна|ота|ина|ика|ива)[¹²³⁴⁵⁶⁷⁸⁹⁰⁻]*$'  # noqa: E501
-    return len([t for t in toks
+    return len([1 for i in positions
                 if any(re.search(abstract_re, lem)
-                       for lem in t.most_likely_lemmas(method=MOST_LIKELY))])
+                       for lem in stats.lemmas[i])])
 
 
 def tag_ms_feat_ratio_Tag(tag: str, doc: Document, rmv_punc=False,
@@ -69,15 +65,19 @@ for tag in tag_dict:  # noqa: E305
         this_partial = partial(tag_ms_feat_ratio_Tag, tag)  # type: ignore
         this_partial.__name__ = name  # type: ignore
         doc = this_partial.func.__doc__.replace('Tag', f'`{tag}`').replace('MS_FEAT', tag_dict[tag].ms_feat)  # type: ignore  # noqa: E501
+        # The name of the ms_feat dependency cannot be read from the source
+        ms_feat_name = safe_ms_feat_name(tag_dict[tag].ms_feat)
+        depends_on = [f'num_tokens_{safe_tag_name(tag)}',
+                      f'num_tokens_ms_feat_{ms_feat_name}']
         ALL[name] = Feature(name, this_partial, doc=doc,
-                            category='Morphology')
+                            category='Morphology', depends_on=depends_on)
 
 
 def Tag_present(tag: Tag, doc: Document) -> int:
     """Determine whether a given tag is in `doc`."""
-    return int(any(tag in reading
-                   for token in doc
-                   for reading in token.readings))
+    stats = ALL['_token_stats'](doc)
+    # `all_tags` also includes the tags that ambiguous tags stand for
+    return int(str(tag) in stats.all_tags)
 for tag in tag_dict:  # noqa: E305
     name = f'{safe_tag_name(tag)}_present'
     this_partial = partial(Tag_present, tag)
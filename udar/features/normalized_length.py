@@ -1,16 +1,12 @@
 # TODO At least some of these should probably be recategorized.
 
-import re
 from statistics import mean
 from statistics import StatisticsError
 
 from ..document import Document
-from .features import _get_tix_morph_count_dict
 from .features import add_to_ALL
 from .features import ALL
-from .features import MOST_LIKELY
 from .features import NaN
-from .features import vowel_re
 from .features import warn_about_irrelevant_argument
 
 side_effects = None  # import this and get all the side effects for free!
@@ -32,12 +28,15 @@ def prcnt_abstract_nouns(doc: Document, lower=False, rmv_punc=True,
 def chars_per_word(doc: Document, has_tag='', rmv_punc=True, uniq=False,
                    zero_div_val=NaN) -> float:
     """Calculate the average number of characters per word."""
-    toks = ALL['_filter_toks'](doc, has_tag=has_tag, rmv_punc=rmv_punc)
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag=has_tag,
+                                         rmv_punc=rmv_punc)
     try:
         if not uniq:
-            return mean(len(tok.text) for tok in toks)
+            return mean(stats.num_chars[i] for i in positions)
         else:
-            return mean(len(orig) for orig in set(tok.text for tok in toks))
+            return mean(len(orig)
+                        for orig in set(stats.texts[i] for i in positions))
     except StatisticsError:
         return zero_div_val
 
@@ -46,9 +45,11 @@ def chars_per_word(doc: Document, has_tag='', rmv_punc=True, uniq=False,
 def max_chars_per_word(doc: Document, has_tag='', rmv_punc=True,
                        zero_div_val=NaN) -> float:
     """Calculate the maximum number of characters per word."""
-    toks = ALL['_filter_toks'](doc, has_tag=has_tag, rmv_punc=rmv_punc)
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag=has_tag,
+                                         rmv_punc=rmv_punc)
     try:
-        return max(len(tok.text) for tok in toks)
+        return max(stats.num_chars[i] for i in positions)
     except ValueError:
         return zero_div_val
 
@@ -77,10 +78,11 @@ def sylls_per_word(doc: Document, has_tag='', lower=False, rmv_punc=True,
     # `lower` is irrelevant here, but included for hierarchical consistency
     if lower:
         warn_about_irrelevant_argument('sylls_per_word', 'lower')
-    toks = ALL['_filter_toks'](doc, has_tag=has_tag, rmv_punc=rmv_punc)
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag=has_tag,
+                                         rmv_punc=rmv_punc)
     try:
-        return mean(len(re.findall(vowel_re, tok.text, flags=re.I))
-                    for tok in toks)
+        return mean(stats.num_sylls[i] for i in positions)
     except StatisticsError:
         return zero_div_val
 
@@ -92,10 +94,11 @@ def max_sylls_per_word(doc: Document, has_tag='', lower=False, rmv_punc=True,
     # `lower` is irrelevant here, but included for hierarchical consistency
     if lower:
         warn_about_irrelevant_argument('sylls_per_word', 'lower')
-    toks = ALL['_filter_toks'](doc, has_tag=has_tag, rmv_punc=rmv_punc)
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag=has_tag,
+                                         rmv_punc=rmv_punc)
     try:
-        return max(len(re.findall(vowel_re, tok.text, flags=re.I))
-                   for tok in toks)
+        return max(stats.num_sylls[i] for i in positions)
     except ValueError:
         return zero_div_val
 
@@ -107,11 +110,11 @@ def max_sylls_per_content_word(doc: Document, lower=False, rmv_punc=True,
     # `lower` is irrelevant here, but included for hierarchical consistency
     if lower:
         warn_about_irrelevant_argument('sylls_per_word', 'lower')
-    toks = ALL['_filter_toks'](doc, has_tag=('A', 'Adv', 'N', 'V'),
-                               rmv_punc=rmv_punc)
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag=('A', 'Adv', 'N', 'V'),
+                                         rmv_punc=rmv_punc)
     try:
-        return max(len(re.findall(vowel_re, tok.text, flags=re.I))
-                   for tok in toks)
+        return max(stats.num_sylls[i] for i in positions)
     except ValueError:
         return zero_div_val
 
@@ -120,11 +123,11 @@ def max_sylls_per_content_word(doc: Document, lower=False, rmv_punc=True,
 def sylls_per_content_word(doc: Document, rmv_punc=True,
                            zero_div_val=NaN) -> float:
     """Calculate the average number of syllables per content word."""
-    toks = ALL['_filter_toks'](doc, has_tag=('A', 'Adv', 'N', 'V'),
-                               rmv_punc=rmv_punc)
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag=('A', 'Adv', 'N', 'V'),
+                                         rmv_punc=rmv_punc)
     try:
-        return mean(len(re.findall(vowel_re, tok.text, flags=re.I))
-                    for tok in toks)
+        return mean(stats.num_sylls[i] for i in positions)
     except StatisticsError:
         return zero_div_val
 
@@ -151,13 +154,15 @@ def morphs_per_word(doc: Document, has_tag='', lower=False, rmv_punc=True,
     # `lower` is irrelevant here, but included for hierarchical consistency
     if lower:
         warn_about_irrelevant_argument('morphs_per_word', 'lower')
-    toks = ALL['_filter_toks'](doc, has_tag=has_tag, rmv_punc=rmv_punc)
-    tix_morph_count_dict = _get_tix_morph_count_dict()
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag=has_tag,
+                                         rmv_punc=rmv_punc)
+    records = ALL['_lemma_records'](doc)
     try:
-        return mean(tix_morph_count_dict[lem]
-                    for tok in toks
-                    for lem in tok.most_likely_lemmas(method=MOST_LIKELY)
-                    if lem in tix_morph_count_dict)
+        return mean(records[lem].morph_count
+                    for i in positions
+                    for lem in stats.lemmas[i]
+                    if records[lem].morph_count is not None)
     except StatisticsError:
         return zero_div_val
 
@@ -169,13 +174,15 @@ def max_morphs_per_word(doc: Document, has_tag='', lower=False, rmv_punc=True,
     # `lower` is irrelevant here, but included for hierarchical consistency
     if lower:
         warn_about_irrelevant_argument('max_morphs_per_word', 'lower')
-    toks = ALL['_filter_toks'](doc, has_tag=has_tag, rmv_punc=rmv_punc)
-    tix_morph_count_dict = _get_tix_morph_count_dict()
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag=has_tag,
+                                         rmv_punc=rmv_punc)
+    records = ALL['_lemma_records'](doc)
     try:
-        return max(tix_morph_count_dict[lem]
-                   for tok in toks
-                   for lem in tok.most_likely_lemmas(method=MOST_LIKELY)
-                   if lem in tix_morph_count_dict)
+        return max(records[lem].morph_count
+                   for i in positions
+                   for lem in stats.lemmas[i]
+                   if records[lem].morph_count is not None)
     except ValueError:
         return zero_div_val
 
@@ -187,11 +194,11 @@ def max_morphs_per_content_word(doc: Document, lower=False, rmv_punc=True,
     # `lower` is irrelevant here, but included for hierarchical consistency
     if lower:
         warn_about_irrelevant_argument('max_morphs_per_content_word', 'lower')
-    toks = ALL['_filter_toks'](doc, has_tag=('A', 'Adv', 'N', 'V'),
-                               rmv_punc=rmv_punc)
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag=('A', 'Adv', 'N', 'V'),
+                                         rmv_punc=rmv_punc)
     try:
-        return max(len(re.findall(vowel_re, tok.text, flags=re.I))
-                   for tok in toks)
+        return max(stats.num_sylls[i] for i in positions)
     except ValueError:
         return zero_div_val
 
@@ -200,10 +207,10 @@ def max_morphs_per_content_word(doc: Document, lower=False, rmv_punc=True,
 def morphs_per_content_word(doc: Document, rmv_punc=True,
                             zero_div_val=NaN) -> float:
     """Calculate the average number of morphemes per content word."""
-    toks = ALL['_filter_toks'](doc, has_tag=('A', 'Adv', 'N', 'V'),
-                               rmv_punc=rmv_punc)
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag=('A', 'Adv', 'N', 'V'),
+                                         rmv_punc=rmv_punc)
     try:
-        return mean(len(re.findall(vowel_re, tok.text, flags=re.I))
-                    for tok in toks)
+        return mean(stats.num_sylls[i] for i in positions)
     except StatisticsError:
         return zero_div_val
@@ -1,20 +1,28 @@
+from array import array
 import re
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
 from typing import List
+from typing import Set
 from typing import Tuple
 from typing import Union
 
 from ..document import Document
 from ..sentence import Sentence
+from ..tag import ambiguous_tag_dict
 from ..tag import Tag
 from ..tok import Token
+from .features import _get_lemma_record
 from .features import _get_RNC_tok_freq_dict
 from .features import _get_RNC_tok_freq_rank_dict
-from .features import _get_Sharoff_lem_freq_dict
-from .features import _get_Sharoff_lem_freq_rank_dict
 from .features import ALL
 from .features import add_to_ALL
+from .features import LemmaRecord
 from .features import MOST_LIKELY
 from .features import punc_re
+from .features import vowel_re
+from .stream import StreamDocument
 
 side_effects = None  # import this and get all the side effects for free!
 
@@ -32,6 +40,97 @@ def sentence_dependency_paths(sent: Sentence) -> List[List[int]]:
     return paths
 
 
+class TokenStats:
+    """Per-token columns of a Document, computed in a single pass.
+
+    Each column has one item per token, in the order of ``list(doc)``.
+    """
+    __slots__ = ['all_tags', 'is_punc', 'lemmas', 'mlr_ms_feats', 'mlr_tags',
+                 'num_chars', 'num_sylls', 'texts', 'tokens']
+    all_tags: Set[str]  # tags of all readings of all tokens
+    is_punc: 'array[int]'
+    lemmas: List[List[str]]  # lemmas of the most likely reading
+    mlr_ms_feats: List[FrozenSet[str]]
+    mlr_tags: List[FrozenSet[str]]  # including tags included in AnIn, etc.
+    num_chars: 'array[int]'
+    num_sylls: 'array[int]'
+    texts: List[str]
+    tokens: List[Token]  # or Nones, for StreamDocuments
+
+    def __init__(self):
+        self.all_tags = set()
+        self.is_punc = array('b')
+        self.lemmas = []
+        self.mlr_ms_feats = []
+        self.mlr_tags = []
+        self.num_chars = array('i')
+        self.num_sylls = array('i')
+        self.texts = []
+        self.tokens = []
+
+    def __len__(self):
+        return len(self.texts)
+
+    def append(self, tok: Token):
+        """Add a column entry for ``tok``."""
+        mlr = tok.most_likely_reading(method=MOST_LIKELY)
+        self.append_analysis(tok, tok.text, mlr.lemmas if mlr else [],
+                             mlr if mlr else (), tok.readings)
+
+    def append_analysis(self, tok, text: str, lemmas: List[str],
+                        tags: Iterable[Tag],
+                        readings_tags: Iterable[Iterable[Tag]]):
+        """Add a column entry for a token, given its surface form, the lemmas
+        and tags of its most likely reading, and the tags of each of its
+        readings. ``tok`` is only stored, so it need not be a
+        :py:class:`Token` (:py:class:`StreamDocument` stores None).
+        """
+        self.tokens.append(tok)
+        self.texts.append(text)
+        self.num_chars.append(len(text))
+        self.num_sylls.append(len(re.findall(vowel_re, text, flags=re.I)))
+        self.is_punc.append(bool(re.match(punc_re, text)))
+        self.lemmas.append(lemmas)
+        self.mlr_tags.append(frozenset(_expand_ambiguous(tags)))
+        self.mlr_ms_feats.append(frozenset(tag.ms_feat for tag in tags))
+        for reading_tags in readings_tags:
+            self.all_tags.update(_expand_ambiguous(reading_tags))
+
+
+def _expand_ambiguous(tags) -> Set[str]:
+    """Return names of ``tags``, plus the tags that ambiguous tags include,
+    e.g. ``AnIn`` adds ``Anim`` and ``Inan``.
+    """
+    names = set()
+    for tag in tags:
+        names.add(tag.name)
+        names.update(ambiguous_tag_dict.get(tag.name, ()))
+    return names
+
+
+def _check_depparse(doc: Union[Document, StreamDocument]):
+    """Raise TypeError if ``doc`` cannot have a dependency parse."""
+    if isinstance(doc, StreamDocument):
+        raise TypeError('StreamDocuments have no dependency parse. '
+                        'FeatureExtractor returns NaN for features that '
+                        'need one.')
+
+
+@add_to_ALL('_token_stats', category='_prior')
+def _token_stats(doc: Union[Document, StreamDocument]) -> TokenStats:
+    """Walk the Document once and fill per-token columns (surface string,
+    number of characters and syllables, punctuation status, lemmas and tags
+    of the most likely reading, etc.), from which most other features are
+    computed.
+    """
+    if isinstance(doc, StreamDocument):  # filled while reading the stream
+        return doc.token_stats
+    stats = TokenStats()
+    for tok in doc:
+        stats.append(tok)
+    return stats
+
+
 @add_to_ALL('_filter_str', category='_prior')
 def _filter_str(doc: Document, lower=False, rmv_punc=False,
                 rmv_whitespace=False, uniq=False) -> str:
@@ -54,14 +153,67 @@ def _filter_str(doc: Document, lower=False, rmv_punc=False,
 def _filter_surface_strs(doc: Document, lower=False,
                          rmv_punc=False) -> List[str]:
     """Convert surface tokens to lower case and/or remove punctuation."""
-    surface_toks = [tok.text for tok in doc]
+    stats = ALL['_token_stats'](doc)
+    surface_toks = stats.texts
     if rmv_punc:
-        surface_toks = [t for t in surface_toks if not re.match(punc_re, t)]
+        surface_toks = [t for t, is_punc in zip(surface_toks, stats.is_punc)
+                        if not is_punc]
     if lower:
         surface_toks = [t.lower() for t in surface_toks]
     return surface_toks
 
 
+@add_to_ALL('_tag_index', category='_prior')
+def _tag_index(doc: Document) -> Dict[str, Dict[str, List[int]]]:
+    """Make inverted index of the tags in each token's most likely reading.
+
+    Returns a dict with two indexes: ``'tags'`` maps tag names to the
+    positions (in ``list(doc)``) of tokens whose most likely reading contains
+    that tag, and ``'ms_feats'`` maps morphosyntactic features (e.g. ``CASE``)
+    to the positions of tokens whose most likely reading expresses them.
+    Ambiguous tags are also indexed under the tags they include, so that,
+    e.g., ``AnIn`` is found by both ``Anim`` and ``Inan``, just like
+    :py:meth:`Token.has_tag_in_most_likely_reading`.
+    """
+    stats = ALL['_token_stats'](doc)
+    tags: Dict[str, List[int]] = {}
+    ms_feats: Dict[str, List[int]] = {}
+    for i, (tok_tags, tok_ms_feats) in enumerate(zip(stats.mlr_tags,
+                                                     stats.mlr_ms_feats)):
+        for tag_name in tok_tags:
+            tags.setdefault(tag_name, []).append(i)
+        for ms_feat in tok_ms_feats:
+            ms_feats.setdefault(ms_feat, []).append(i)
+    return {'tags': tags, 'ms_feats': ms_feats}
+
+
+@add_to_ALL('_filter_positions', category='_prior')
+def _filter_positions(doc: Document,
+                      has_tag: Union[str, Tag, Tuple[Union[str, Tag]]] = '',
+                      rmv_punc=False) -> List[int]:
+    """Filter token positions (in ``list(doc)``) according to whether each
+    Token contains a given Tag or whether the original surface form is
+    punctuation.
+    """
+    stats = ALL['_token_stats'](doc)
+    if has_tag:
+        if isinstance(has_tag, str) or isinstance(has_tag, Tag):
+            has_tag = (has_tag,)
+        elif not isinstance(has_tag, tuple):
+            raise NotImplementedError('has_tag argument must be a str or Tag, '
+                                      'or a tuple of strs or Tags.')
+        tag_index = ALL['_tag_index'](doc)['tags']
+        positions: Set[int] = set()
+        for tag in has_tag:
+            positions.update(tag_index.get(str(tag), ()))
+        filtered = sorted(positions)
+    else:
+        filtered = list(range(len(stats)))
+    if rmv_punc:
+        filtered = [i for i in filtered if not stats.is_punc[i]]
+    return filtered
+
+
 @add_to_ALL('_filter_toks', category='_prior')
 def _filter_toks(doc: Document,
                  has_tag: Union[str, Tag, Tuple[Union[str, Tag]]] = '',
@@ -69,23 +221,18 @@ def _filter_toks(doc: Document,
     """Filter Token objects according to whether each Token contains a given
     Tag or whether the original surface form is punctuation.
     """
-    toks = list(doc)
-    if has_tag:
-        if isinstance(has_tag, str) or isinstance(has_tag, Tag):
-            toks = [t for t in toks
-                    if t.has_tag_in_most_likely_reading(has_tag,
-                                                        method=MOST_LIKELY)]
-        elif isinstance(has_tag, tuple):
-            toks = [t for t in toks
-                    if any(t.has_tag_in_most_likely_reading(tag,
-                                                            method=MOST_LIKELY)
-                           for tag in has_tag)]
-        else:
-            raise NotImplementedError('has_tag argument must be a str or Tag, '
-                                      'or a tuple of strs or Tags.')
-    if rmv_punc:
-        toks = [t for t in toks if not re.match(punc_re, t.text)]
-    return toks
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag=has_tag,
+                                         rmv_punc=rmv_punc)
+    return [stats.tokens[i] for i in positions]
+
+
+@add_to_ALL('_lemma_records', category='_prior')
+def _lemma_records(doc: Document) -> Dict[str, LemmaRecord]:
+    """Look up each unique lemma in the lexical resources once."""
+    stats = ALL['_token_stats'](doc)
+    return {lem: _get_lemma_record(lem)
+            for lem in set(lem for lemmas in stats.lemmas for lem in lemmas)}
 
 
 @add_to_ALL('_lemma_frequencies', category='_prior')
@@ -93,11 +240,11 @@ def _lemma_frequencies(doc: Document,
                        has_tag: Union[str, Tag, Tuple[Union[str, Tag]]] = '',
                        rmv_punc=True) -> List[float]:
     """Make list of lemma frequencies."""
-    toks = ALL['_filter_toks'](doc, has_tag=has_tag, rmv_punc=rmv_punc)
-    Sharoff_lem_freq_dict = _get_Sharoff_lem_freq_dict()
-    return [Sharoff_lem_freq_dict.get(lem, 0)
-            for t in toks
-            for lem in t.most_likely_lemmas(method=MOST_LIKELY)]
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag=has_tag,
+                                         rmv_punc=rmv_punc)
+    records = ALL['_lemma_records'](doc)
+    return [records[lem].freq for i in positions for lem in stats.lemmas[i]]
 
 
 @add_to_ALL('_lemma_frequency_ranks', category='_prior')
@@ -105,11 +252,13 @@ def _lemma_frequency_ranks(doc: Document,
                           has_tag: Union[str, Tag, Tuple[Union[str, Tag]]] = '',  # noqa: E501
                           rmv_punc=True) -> List[float]:
     """Make list of lemma frequency ranks."""
-    toks = ALL['_filter_toks'](doc, has_tag=has_tag, rmv_punc=rmv_punc)
-    Sharoff_lem_freq_rank_dict = _get_Sharoff_lem_freq_rank_dict()
-    return [Sharoff_lem_freq_rank_dict.get(lem, 0)
-            for t in toks
-            for lem in t.most_likely_lemmas(method=MOST_LIKELY)]
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag=has_tag,
+                                         rmv_punc=rmv_punc)
+    records = ALL['_lemma_records'](doc)
+    return [records[lem].freq_rank
+            for i in positions
+            for lem in stats.lemmas[i]]
 
 
 @add_to_ALL('_token_frequencies', category='_prior')
@@ -117,9 +266,11 @@ def _token_frequencies(doc: Document,
                        has_tag: Union[str, Tag, Tuple[Union[str, Tag]]] = '',
                        rmv_punc=True) -> List[float]:
     """Make list of token frequencies."""
-    toks = ALL['_filter_toks'](doc, has_tag=has_tag, rmv_punc=rmv_punc)
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag=has_tag,
+                                         rmv_punc=rmv_punc)
     RNC_tok_freq_dict = _get_RNC_tok_freq_dict()
-    return [RNC_tok_freq_dict.get(tok.text, 0) for tok in toks]
+    return [RNC_tok_freq_dict.get(stats.texts[i], 0) for i in positions]
 
 
 @add_to_ALL('_token_frequency_ranks', category='_prior')
@@ -127,9 +278,11 @@ def _token_frequency_ranks(doc: Document,
                            has_tag: Union[str, Tag, Tuple[Union[str, Tag]]] = '',  # noqa: E501
                            rmv_punc=True) -> List[int]:
     """Make list of token frequency ranks."""
-    toks = ALL['_filter_toks'](doc, has_tag=has_tag, rmv_punc=rmv_punc)
+    stats = ALL['_token_stats'](doc)
+    positions = ALL['_filter_positions'](doc, has_tag=has_tag,
+                                         rmv_punc=rmv_punc)
     RNC_tok_freq_rank_dict = _get_RNC_tok_freq_rank_dict()
-    return [RNC_tok_freq_rank_dict.get(tok.text, 0) for tok in toks]
+    return [RNC_tok_freq_rank_dict.get(stats.texts[i], 0) for i in positions]
 
 
 @add_to_ALL('_dependency_lengths', category='_prior')
@@ -137,6 +290,7 @@ def _dependency_lengths(doc: Document,
                         has_tag: Union[str, Tag, Tuple[Union[str, Tag]]] = '',
                         rmv_punc=True) -> List[int]:
     """Make list of dependency lengths."""
+    _check_depparse(doc)
     toks = ALL['_filter_toks'](doc, has_tag=has_tag, rmv_punc=rmv_punc)
     return [abs(int(tok.id) - tok.head) for tok in toks]
 
@@ -144,6 +298,7 @@ def _dependency_lengths(doc: Document,
 @add_to_ALL('_sentence_dependency_paths', category='_prior')
 def _sentence_dependency_paths(doc: Document) -> List[List[List[int]]]:
     """Make list of dependency paths."""
+    _check_depparse(doc)
     return [sentence_dependency_paths(sent) for sent in doc.sentences]
 
 
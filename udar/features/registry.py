@@ -0,0 +1,169 @@
+"""Precomputed metadata of the features in ``ALL``.
+
+Determining the dependencies and default keyword arguments of a
+:py:class:`Feature` requires :py:mod:`inspect` (reading and tokenizing its
+source code), which is slow, and impossible when the source files are not
+available (e.g. in a zipapp or a frozen application). Instead, this metadata
+is read from the generated module ``_registry.py``, which must be regenerated
+whenever a feature is added or changed::
+
+    python3 dev/make_feature_registry.py
+
+Features that are not in the registry fall back to :py:mod:`inspect`, and so
+do features whose module has changed since the registry was generated
+(detected by comparing :py:func:`source_digest` with the digest stored in
+the registry). If the source of a module cannot be read, its entries are
+trusted.
+"""
+
+from functools import partial
+import hashlib
+import sys
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import NamedTuple
+from typing import Optional
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .feature import Feature  # noqa: F401
+
+__all__ = ['get_registry', 'make_registry', 'RegistryEntry', 'source_digest']
+
+# Increment whenever the format of ``_registry.py`` changes. A registry with
+# a different version is ignored.
+REGISTRY_VERSION = 3
+
+
+class RegistryEntry(NamedTuple):
+    category: Optional[str]
+    func: str  # qualified name of the (underlying) function
+    default_kwargs: Dict[str, Any]
+    depends_on: List[str]
+    unresolved_deps: List[str]
+
+
+_registry: Optional[Dict[str, RegistryEntry]] = None
+# Digest of the source of each module, when the registry was generated
+_registry_sources: Dict[str, str] = {}
+# Digest of the source of each module, as it is now (memoized)
+_source_digests: Dict[str, Optional[str]] = {}
+
+
+def _func_module(func) -> str:
+    if isinstance(func, partial):
+        func = func.func
+    return func.__module__
+
+
+def func_name(func) -> str:
+    """Return the qualified name of a feature function, or of the function
+    wrapped by a :py:class:`functools.partial`.
+    """
+    if isinstance(func, partial):
+        func = func.func
+    return f'{func.__module__}.{func.__qualname__}'
+
+
+def source_digest(module_name: str) -> Optional[str]:
+    """Return a digest of the source file of the module `module_name`, or
+    None if it cannot be read. Line endings are normalized, so the digest is
+    the same on every platform and Python version.
+    """
+    try:
+        return _source_digests[module_name]
+    except KeyError:
+        pass
+    path = getattr(sys.modules.get(module_name), '__file__', None)
+    digest = None
+    if path is not None and path.endswith('.py'):
+        try:
+            with open(path, 'rb') as f:
+                src = f.read().replace(b'\r\n', b'\n')
+        except OSError:  # e.g. in a zipapp
+            pass
+        else:
+            digest = hashlib.sha256(src).hexdigest()[:16]
+    _source_digests[module_name] = digest
+    return digest
+
+
+def get_registry() -> Mapping[str, RegistryEntry]:
+    """Return the registry, mapping feature names to their metadata. The
+    registry is empty if ``_registry.py`` is missing or has a different
+    version.
+    """
+    global _registry
+    if _registry is None:
+        try:
+            from . import _registry as generated
+        except ImportError:
+            _registry = {}
+        else:
+            if generated.VERSION == REGISTRY_VERSION:
+                _registry = {name: RegistryEntry(*fields)
+                             for name, fields in generated.FEATURES.items()}
+                _registry_sources.update(generated.SOURCES)
+            else:
+                _registry = {}
+    return _registry
+
+
+def lookup(name: str, func) -> Optional[RegistryEntry]:
+    """Return the registry entry of feature `name`, or None if there is no
+    entry for it, if the entry was generated from a different function, or
+    if the module of the function has changed since.
+    """
+    entry = get_registry().get(name)
+    if entry is None or entry.func != func_name(func):
+        return None
+    module_name = _func_module(func)
+    digest = source_digest(module_name)
+    if digest is not None and digest != _registry_sources.get(module_name):
+        return None
+    return entry
+
+
+def make_registry(features: Iterable['Feature']) -> str:
+    """Return the source code of ``_registry.py`` for `features`, with their
+    metadata determined by :py:mod:`inspect` (except for dependencies that
+    were declared with ``depends_on``), sorted by name, and the digests of
+    the modules that define them.
+    """
+    features = sorted(features, key=lambda feat: feat.name)
+    lines = ['# flake8: noqa',
+             '# Generated by `python3 dev/make_feature_registry.py`. '
+             'Do not edit!',
+             '# name: (category, func, default_kwargs, depends_on, '
+             'unresolved_deps)',
+             '',
+             'from typing import Any',
+             'from typing import Dict',
+             'from typing import Tuple',
+             '',
+             "nan = float('nan')",
+             '',
+             f'VERSION = {REGISTRY_VERSION}',
+             '',
+             'FEATURES: Dict[str, Tuple[Any, ...]] = {']
+    for feat in features:
+        unresolved_deps: List[str]
+        if feat._declared_deps:
+            depends_on, unresolved_deps = feat.depends_on, []
+        else:
+            depends_on, unresolved_deps = feat._inspect_depends_on()
+        lines.extend([f'    {feat.name!r}: ({feat.category!r},',
+                      f'        {func_name(feat.func)!r},',
+                      f'        {feat._inspect_default_kwargs()!r},',
+                      f'        {depends_on!r},',
+                      f'        {unresolved_deps!r}),'])
+    lines.extend(['}', '', '# module: digest of its source',
+                  'SOURCES: Dict[str, str] = {'])
+    for module_name in sorted({_func_module(feat.func) for feat in features}):
+        lines.append(f'    {module_name!r}: '
+                     f'{source_digest(module_name)!r},')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,324 @@
+"""Stream CG3/HFST analyses into feature extraction, without building
+:py:class:`Token`/:py:class:`Reading`/:py:class:`Subreading` objects.
+"""
+
+from collections import namedtuple
+from pathlib import Path
+from random import choice
+import re
+import sys
+from typing import FrozenSet
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Union
+
+from ..tag import tag_dict
+
+if TYPE_CHECKING:
+    from .priors import TokenStats  # noqa: F401
+
+__all__ = ['iter_cg3', 'iter_hfst', 'iter_stream_documents',
+           'StreamDocument', 'StreamReading', 'StreamToken']
+
+# Lemmas and Tags of all subreadings of a reading, and its weight
+StreamReading = namedtuple('StreamReading', ['lemmas', 'tags', 'weight'])
+# Surface form, (remaining) readings, and ID and original text of the
+# sentence (from the ``# SENT ID:`` and ``# TEXT:`` annotations of CG3
+# streams, otherwise None)
+StreamToken = namedtuple('StreamToken', ['text', 'readings', 'sent_id',
+                                         'sent_text'])
+
+cg3_tok_re = re.compile(r'"<((?:.|\")*)>"')
+cg3_reading_re = re.compile(r'(;)?(\t+)"((?:.|\")*)" (.*?) <W:(.*)> ?(.*)$')
+cg3_sent_id_re = re.compile(r'# SENT ID: ([^\n]*)')
+cg3_sent_text_re = re.compile(r'# TEXT: ([^\n]*)')
+sent_final_re = re.compile(r'[.!?…]+')
+
+Source = Union[str, Path, Iterable[str]]
+
+
+def _iter_lines(source: Source) -> Iterator[str]:
+    """Yield lines (without newlines) of a file path or an iterable of lines
+    (e.g. an open file).
+    """
+    if isinstance(source, (str, Path)):
+        with open(source) as f:
+            for line in f:
+                yield line.rstrip('\n')
+    else:
+        for line in source:
+            yield line.rstrip('\n')
+
+
+def _parse_subreading(lemma: str, tag_names: List[str]):
+    return lemma, tuple(tag_dict[name] for name in tag_names if name)
+
+
+def iter_cg3(source: Source) -> Iterator[StreamToken]:
+    """Read a CG3-style analysis stream one line at a time, and yield a
+    :py:class:`StreamToken` for each cohort. Removed readings (prefixed by
+    ``;``) are skipped.
+
+    Parameters
+    ----------
+
+    source
+        Path to a CG3 file, or an iterable of its lines (e.g. an open file or
+        ``sys.stdin``)
+    """
+    sent_id = None
+    sent_text = None
+    text = None
+    readings: List[StreamReading] = []
+    skip = False  # whether the current reading is removed
+    for line in _iter_lines(source):
+        tok_match = cg3_tok_re.match(line)
+        if tok_match:
+            if text is not None:
+                yield StreamToken(text, tuple(readings), sent_id, sent_text)
+            text = tok_match.group(1)
+            readings = []
+            continue
+        reading_match = cg3_reading_re.match(line)
+        if reading_match:
+            removed, tabs, lemma, tags, weight, rule = reading_match.groups()
+            if len(tabs) == 1:
+                skip = bool(removed) or tags.endswith('?')
+            if skip:
+                continue
+            lemma, tags = _parse_subreading(lemma, tags.split(' '))
+            if len(tabs) == 1:
+                readings.append(StreamReading((lemma,), tags, float(weight)))
+            else:  # subreadings are listed last-to-first
+                last = readings[-1]
+                readings[-1] = StreamReading((lemma,) + last.lemmas,
+                                             tags + last.tags, last.weight)
+            continue
+        sent_id_match = cg3_sent_id_re.match(line)
+        sent_text_match = cg3_sent_text_re.match(line)
+        if sent_id_match:
+            if text is not None:
+                yield StreamToken(text, tuple(readings), sent_id, sent_text)
+                text = None
+            sent_id = sent_id_match.group(1)
+            sent_text = None
+        elif sent_text_match:
+            sent_text = sent_text_match.group(1)
+        elif line and not line.startswith(('# ', 'NB: ')):
+            print('WARNING (iter_cg3) unrecognized line:', line,
+                  file=sys.stderr)
+    if text is not None:
+        yield StreamToken(text, tuple(readings), sent_id, sent_text)
+
+
+def iter_hfst(source: Source) -> Iterator[StreamToken]:
+    """Read an HFST-/XFST-style analysis stream one line at a time, and yield
+    a :py:class:`StreamToken` for each cohort.
+
+    Parameters
+    ----------
+
+    source
+        Path to an HFST file, or an iterable of its lines (e.g. an open file
+        or ``sys.stdin``)
+    """
+    text = None
+    readings: List[StreamReading] = []
+    for line in _iter_lines(source):
+        if not line.strip():
+            if text is not None:
+                yield StreamToken(text, tuple(readings), None, None)
+            text = None
+            readings = []
+            continue
+        try:
+            text, reading, weight = line.split('\t')
+        except ValueError as e:
+            raise ValueError(line) from e
+        if reading.endswith('?'):
+            continue
+        lemmas = []
+        tags = ()
+        for sub in re.findall(r'([^+]*[^#]+)#?', reading):
+            lemma, *tag_names = re.split(r'\+(?=[^+])', sub)
+            lemma, sub_tags = _parse_subreading(lemma, tag_names)
+            lemmas.append(lemma)
+            tags += sub_tags
+        readings.append(StreamReading(tuple(lemmas), tags, float(weight)))
+    if text is not None:
+        yield StreamToken(text, tuple(readings), None, None)
+
+
+def most_likely_stream_reading(tok: StreamToken,
+                               method: str = 'weight'
+                               ) -> Optional[StreamReading]:
+    """Select the most likely reading of ``tok``, like
+    :py:meth:`Token.most_likely_reading`.
+
+    Parameters
+    ----------
+
+    tok
+        Token from :py:func:`iter_cg3` or :py:func:`iter_hfst`
+    method
+        * 'stanza' -- streams have no :py:mod:`stanza` analysis, so this is
+          the same as 'weight' (as for a Token that was not parsed)
+        * 'weight' -- pick the reading with the highest weight value. If
+          more than one reading shares the highest weight, randomly pick
+          between them.
+        * 'random' -- randomly select from readings
+    """
+    if method not in {'stanza', 'weight', 'random'}:
+        raise ValueError('`method` must be in {stanza, weight, random}.')
+    if not tok.readings:
+        return None
+    if method == 'random':
+        return choice(tok.readings)
+    max_weight = max(r.weight for r in tok.readings)
+    return choice([r for r in tok.readings if r.weight == max_weight])
+
+
+class StreamDocument:
+    """Lightweight stand-in for :py:class:`Document`, made from a stream of
+    :py:class:`StreamToken` s, which can be passed to
+    :py:class:`FeatureExtractor` in the same way as a Document.
+
+    Instead of Token objects, a StreamDocument only keeps the per-token
+    columns that features are computed from (see ``_token_stats``), which
+    are filled in a single pass over the stream: for each token, its surface
+    form, the lemmas and tags of its most likely reading, and the tags of
+    each of its readings. The stream itself is not held in memory, but these
+    columns are, so memory still grows linearly with the number of tokens
+    (of a single document at a time, with :py:func:`iter_stream_documents`).
+
+    Differences from a Document made from the same stream with
+    :py:meth:`Document.from_cg3` or :py:meth:`Document.from_hfst`:
+
+    * There is no dependency parse, so :py:class:`FeatureExtractor` returns
+      ``NaN`` (with a warning) for the features that need one (those that
+      depend on :py:attr:`unsupported_features`).
+    * Sentences are split at ``# SENT ID:`` annotations (CG3) or, if there
+      are none, after sentence-final punctuation, instead of by
+      ``sentence_splitter``. Only the number of sentences is kept.
+    * Unless the original ``text`` is given, features that are computed from
+      the text (``num_chars``, ``num_dialog_punc``, etc.) use the text of
+      the stream, which is reconstructed like that of
+      :py:meth:`Document.from_cg3`: the ``# TEXT:`` annotation of each
+      sentence (CG3), or else its tokens joined by spaces.
+    """
+    __slots__ = ['_feat_cache', 'features', 'num_sents', 'text',
+                 'token_stats']
+    _feat_cache: dict
+    features: Optional[tuple]
+    num_sents: int
+    text: str
+    token_stats: 'TokenStats'
+    # Priors that cannot be computed without a dependency parse
+    unsupported_features: FrozenSet[str] = frozenset({
+        '_dependency_lengths', '_sentence_dependency_paths'})
+
+    def __init__(self, tokens: Iterable[StreamToken],
+                 text: Optional[str] = None, method: Optional[str] = None):
+        """
+        Parameters
+        ----------
+
+        tokens
+            Iterable of :py:class:`StreamToken` s, e.g. from
+            :py:func:`iter_cg3` or :py:func:`iter_hfst`
+        text
+            (Optional) Original text of the Document
+        method
+            How to select the most likely reading of each token. See
+            :py:func:`most_likely_stream_reading`. (default: ``MOST_LIKELY``,
+            as for Documents)
+        """
+        # These modules import this module
+        from .features import MOST_LIKELY
+        from .priors import TokenStats
+        if method is None:
+            method = MOST_LIKELY
+        self._feat_cache = {}
+        self.features = None
+        self.num_sents = 0
+        self.token_stats = TokenStats()
+        sent_texts: List[str] = []  # only if `text` is not given
+        sent: List[str] = []  # surface forms of the current sentence
+        prev_tok = None
+        for tok in tokens:
+            if prev_tok is not None and (
+                    tok.sent_id != prev_tok.sent_id
+                    or (tok.sent_id is None
+                        and sent_final_re.fullmatch(prev_tok.text))):
+                self.num_sents += 1
+                if text is None:
+                    sent_texts.append(prev_tok.sent_text or ' '.join(sent))
+                sent = []
+            prev_tok = tok
+            if text is None:
+                sent.append(tok.text)
+            mlr = most_likely_stream_reading(tok, method=method)
+            self.token_stats.append_analysis(None, tok.text,
+                                             list(mlr.lemmas) if mlr else [],
+                                             mlr.tags if mlr else (),
+                                             [r.tags for r in tok.readings])
+        if prev_tok is not None:
+            self.num_sents += 1
+            if text is None:
+                sent_texts.append(prev_tok.sent_text or ' '.join(sent))
+        self.text = ' '.join(sent_texts) if text is None else text
+
+    @classmethod
+    def from_cg3(cls, source: Source, text: Optional[str] = None,
+                 method: Optional[str] = None) -> 'StreamDocument':
+        """Construct StreamDocument from CG3 stream (path or iterable of
+        lines). See :py:class:`StreamDocument` for the other arguments.
+        """
+        return cls(iter_cg3(source), text=text, method=method)
+
+    @classmethod
+    def from_hfst(cls, source: Source, text: Optional[str] = None,
+                  method: Optional[str] = None) -> 'StreamDocument':
+        """Construct StreamDocument from HFST/XFST stream (path or iterable
+        of lines). See :py:class:`StreamDocument` for the other arguments.
+        """
+        return cls(iter_hfst(source), text=text, method=method)
+
+    def __len__(self):
+        return len(self.token_stats)
+
+    def __repr__(self):
+        return f'StreamDocument({self.text[:30]!r}, {len(self)} tokens)'
+
+
+def iter_stream_documents(paths: Iterable[Union[str, Path]],
+                          fmt: str = 'cg3',
+                          method: Optional[str] = None
+                          ) -> Iterator[StreamDocument]:
+    """Yield a :py:class:`StreamDocument` for each file in ``paths``, one at
+    a time. This can be passed directly to :py:meth:`FeatureExtractor.to_npy`
+    to extract features from a whole corpus without holding more than one
+    document in memory.
+
+    Parameters
+    ----------
+
+    paths
+        Paths of analysis files, one Document per file
+    fmt
+        Format of the files: ``'cg3'`` or ``'hfst'``
+    method
+        How to select the most likely reading of each token. See
+        :py:func:`most_likely_stream_reading`.
+    """
+    if fmt == 'cg3':
+        reader = iter_cg3
+    elif fmt == 'hfst':
+        reader = iter_hfst
+    else:
+        raise ValueError(f'`fmt` must be in {{cg3, hfst}}; got {fmt!r}.')
+    for path in paths:
+        yield StreamDocument(reader(path), method=method)
@@ -1,15 +1,17 @@
 """Python wrapper of UDAR, a part-of-speech tagger for (accented) Russian"""
 
-from pkg_resources import resource_filename
 from typing import Dict
+from typing import Iterable
+from typing import List
 from typing import Optional
 from typing import Tuple
 from typing import TYPE_CHECKING
 from typing import Union
 
-import hfst  # type: ignore
-
+from .misc import CacheInfo
 from .misc import destress
+from .misc import LRUCache
+from .misc import RSRC_PATH
 
 if TYPE_CHECKING:
     from .reading import Reading  # noqa: F401
@@ -17,22 +19,58 @@ if TYPE_CHECKING:
 
 __all__ = ['Analyzer', 'Generator', 'get_analyzer', 'get_generator', 'get_g2p']
 
-RSRC_PATH = resource_filename('udar', 'resources/')
 G2P_FNAME = f'{RSRC_PATH}g2p.hfstol'
+GENERATOR_CACHE_SIZE = 2 ** 14
+_NOT_GENERATED = object()  # memo sentinel for readings that do not generate
+
+
+def _import_hfst():
+    """Import :py:mod:`hfst` only when the first transducer is loaded."""
+    try:
+        import hfst  # type: ignore
+    except ModuleNotFoundError as e:
+        raise ModuleNotFoundError('hfst is required for morphological '
+                                  'analysis. Try `python3 -m pip install '
+                                  '--user hfst`.') from e
+    return hfst
 
 
 class Udar:
     """Parent class for Analyzer and Generator."""
-    __slots__ = ['path2fst', 'fst']
+    __slots__ = ['cache', 'path2fst', 'fst']
+    cache: Optional[LRUCache]
     path2fst: str
     fst: 'libhfst.HfstTransducer'
 
     def __init__(self, fname: str):
+        self.cache = None
         self.path2fst = f'{RSRC_PATH}{fname}'
-        fst_stream = hfst.HfstInputStream(self.path2fst)
+        fst_stream = _import_hfst().HfstInputStream(self.path2fst)
         self.fst = fst_stream.read()
         assert fst_stream.is_eof()  # be sure the hfstol file only had one fst
 
+    def set_cache_size(self, maxsize: Optional[int]):
+        """Set the maximum number of lookups to memoize. If ``maxsize`` is
+        ``None`` or ``0``, the cache is disabled (and emptied).
+        """
+        if not maxsize:
+            self.cache = None
+        elif self.cache is None:
+            self.cache = LRUCache(maxsize)
+        else:
+            self.cache.resize(maxsize)
+
+    def cache_info(self) -> Optional[CacheInfo]:
+        """Return cache statistics, or ``None`` if the cache is disabled."""
+        if self.cache is None:
+            return None
+        return self.cache.info()
+
+    def cache_clear(self):
+        """Empty the cache and reset its statistics."""
+        if self.cache is not None:
+            self.cache.clear()
+
 
 class Analyzer(Udar):
     """HFST transducer that takes string and returns grammatical readings.
@@ -48,6 +86,14 @@ class Analyzer(Udar):
     >>> tok = ana('сло́ва')
     >>> tok
     (('слово+N+Neu+Inan+Sg+Gen', 5.9755859375),)
+
+    Lookups can be memoized in a size-bounded LRU cache, keyed by surface
+    form:
+
+    >>> ana = get_analyzer(cache_size=2**16)
+    >>> ana.cache_clear()
+    >>> ana.cache_info()
+    CacheInfo(hits=0, misses=0, evictions=0, maxsize=65536, currsize=0)
     """
     __slots__ = ['L2_errors']
     L2: bool
@@ -63,7 +109,23 @@ class Analyzer(Udar):
     def __call__(self, in_tok: str) -> Union[Tuple[str, str, str],
                                              Tuple[str, str]]:
         """If lookup returns nothing, try lookup with stress removed."""
-        return self.fst.lookup(in_tok) or self.fst.lookup(destress(in_tok))
+        if self.cache is None:
+            return (self.fst.lookup(in_tok)
+                    or self.fst.lookup(destress(in_tok)))
+        readings = self.cache.get(in_tok)
+        if readings is None:
+            readings = (self.fst.lookup(in_tok)
+                        or self.fst.lookup(destress(in_tok)))
+            self.cache[in_tok] = readings
+        return readings
+
+    def lookup_many(self, in_toks: Iterable[str]) -> List[Union[Tuple[str, str, str], Tuple[str, str]]]:  # noqa: E501
+        """Analyze a sequence of tokens, looking up each unique token only
+        once. Results are aligned with ``in_toks``.
+        """
+        in_toks = list(in_toks)
+        results = {tok: self(tok) for tok in dict.fromkeys(in_toks)}
+        return [results[tok] for tok in in_toks]
 
 
 class Generator(Udar):
@@ -79,12 +141,16 @@ class Generator(Udar):
     >>> gen = get_generator(stressed=True)  # this is better
     >>> gen('слово+N+Neu+Inan+Sg+Gen')
     'сло́ва'
+
+    Lookups are memoized in a size-bounded LRU cache, keyed by reading
+    string (see :py:meth:`Udar.set_cache_size`).
     """
     __slots__ = ['phonetic', 'stressed']
     phonetic: bool
     stressed: bool
 
-    def __init__(self, *, phonetic=False, stressed=False):
+    def __init__(self, *, phonetic=False, stressed=False,
+                 cache_size: Optional[int] = GENERATOR_CACHE_SIZE):
         if phonetic:
             fname = 'generator-gt-norm.phonetic.hfstol'
         elif stressed:
@@ -94,6 +160,7 @@ class Generator(Udar):
         super().__init__(fname=fname)
         self.phonetic = phonetic
         self.stressed = stressed
+        self.set_cache_size(cache_size)
 
     def __call__(self, read: Union['Reading', str]) -> Optional[str]:
         """Return str from a given lemma+Reading."""
@@ -102,45 +169,94 @@ class Generator(Udar):
             read = read.hfst_noL2_str()  # type: ignore
         except AttributeError:
             pass
+        if self.cache is None:
+            return self._lookup(read)  # type: ignore
+        wordform = self.cache.get(read, _NOT_GENERATED)
+        if wordform is _NOT_GENERATED:
+            wordform = self.cache[read] = self._lookup(read)  # type: ignore
+        return wordform
+
+    def _lookup(self, read: str) -> Optional[str]:
         try:
             return self.fst.lookup(read)[0][0]
         except IndexError:
             return None
 
+    def generate_many(self, reads: Iterable[Union['Reading', str]]) -> List[Optional[str]]:  # noqa: E501
+        """Generate a wordform for each of a sequence of readings, looking up
+        each unique reading only once. Results are aligned with ``reads``.
+        """
+        read_strs = []
+        for read in reads:
+            try:
+                read_strs.append(read.hfst_noL2_str())  # type: ignore
+            except AttributeError:
+                read_strs.append(read)
+        results = {read: self(read) for read in dict.fromkeys(read_strs)}
+        return [results[read] for read in read_strs]
+
 
 analyzer_cache: Dict[str, Analyzer] = {}
 generator_cache: Dict[str, Generator] = {}
 g2p: 'libhfst.HfstTransducer' = None
 
 
-def get_analyzer(**kwargs) -> Analyzer:
+def get_analyzer(cache_size: Optional[int] = None, **kwargs) -> Analyzer:
+    r"""Return the shared :py:class:`Analyzer` of the given flavor.
+
+    Parameters
+    ----------
+
+    cache_size
+        (Optional) If given, set the maximum number of lookups memoized by
+        the shared Analyzer (``0`` disables the cache). Lookups are not
+        cached by default.
+    \*\*kwargs
+        All the same keyword arguments accepted by :py:class:`Analyzer`
+    """
     global analyzer_cache
     signature = ['='.join((key, str(val)))
                  for key, val in sorted(kwargs.items())]
     flavor = '_'.join(signature)
     try:
-        return analyzer_cache[flavor]
+        analyzer = analyzer_cache[flavor]
     except KeyError:
-        analyzer_cache[flavor] = Analyzer(**kwargs)
-        return analyzer_cache[flavor]
+        analyzer = analyzer_cache[flavor] = Analyzer(**kwargs)
+    if cache_size is not None:
+        analyzer.set_cache_size(cache_size)
+    return analyzer
+
 
+def get_generator(cache_size: Optional[int] = None, **kwargs) -> Generator:
+    r"""Return the shared :py:class:`Generator` of the given flavor.
 
-def get_generator(**kwargs) -> Generator:
+    Parameters
+    ----------
+
+    cache_size
+        (Optional) If given, set the maximum number of lookups memoized by
+        the shared Generator (``0`` disables the cache). (default:
+        ``GENERATOR_CACHE_SIZE`` when the Generator is first created)
+    \*\*kwargs
+        All the same keyword arguments accepted by :py:class:`Generator`
+    """
     global generator_cache
     signature = ['='.join((key, str(val)))
                  for key, val in sorted(kwargs.items())]
     flavor = f'generator_{"_".join(signature)}'
     try:
-        return generator_cache[flavor]
+        generator = generator_cache[flavor]
     except KeyError:
-        generator_cache[flavor] = Generator(**kwargs)
-        return generator_cache[flavor]
+        generator = generator_cache[flavor] = Generator(**kwargs)
+    if cache_size is not None:
+        generator.set_cache_size(cache_size)
+    return generator
 
 
 def get_g2p():
     global g2p
     if g2p is None:
-        input_stream = hfst.HfstInputStream(G2P_FNAME)
+        input_stream = _import_hfst().HfstInputStream(G2P_FNAME)
         g2p = input_stream.read()
         assert input_stream.is_eof()  # hfstol file should only have one fst
         return g2p
@@ -1,35 +1,50 @@
 """Python wrapper of UDAR, a part-of-speech tagger for (accented) Russian"""
 
 from collections import namedtuple
+from collections import OrderedDict
 from enum import Enum
-from pkg_resources import resource_filename
+import os
 import re
+from typing import Any
 from typing import Dict
+from typing import Hashable
 from typing import List
 from typing import Set
 from typing import Union
 from warnings import warn
 
-import stanza  # type: ignore
-
 # This module should not import anything from udar. Modules that need to
 # import from udar should either be in convenience.py or in util/
 
 __all__ = ['StressParams', 'Result', 'result_names', 'destress',
            'compute_metrics', 'unspace_punct']
 
-RSRC_PATH = resource_filename('udar', 'resources/')
+# Same as pkg_resources.resource_filename('udar', 'resources/'), without
+# importing pkg_resources, which is slow
+RSRC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         'resources', '')
 ACUTE = '\u0301'  # acute combining accent: x́
 GRAVE = '\u0300'  # grave combining accent: x̀
 stanza_sent = None
 stanza_pretokenized = None
 
 SP = namedtuple('StressParams', ['disambiguate', 'selection', 'guess'])
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions',
+                                     'maxsize', 'currsize'])
+
+
+def _import_stanza():
+    """Import :py:mod:`stanza` (which imports torch) only when it is first
+    needed.
+    """
+    import stanza  # type: ignore
+    return stanza
 
 
 def get_stanza_sent_tokenizer():
     global stanza_sent
     if stanza_sent is None:
+        stanza = _import_stanza()
         stanza_sent = stanza.Pipeline(lang='ru', processors='tokenize',
                                       verbose=False)
     return stanza_sent
@@ -38,6 +53,7 @@ def get_stanza_sent_tokenizer():
 def get_stanza_pretokenized_pipeline():
     global stanza_pretokenized
     if stanza_pretokenized is None:
+        stanza = _import_stanza()
         stanza_pretokenized = stanza.Pipeline(lang='ru',
                                               tokenize_pretokenized=True,
                                               processors='tokenize,pos,lemma,depparse',  # noqa: E501
@@ -45,6 +61,90 @@ def get_stanza_pretokenized_pipeline():
     return stanza_pretokenized
 
 
+class LRUCache:
+    """Size-bounded mapping that evicts the least recently used entries.
+
+    Unlike :py:func:`functools.lru_cache`, the cache is a standalone object,
+    so that it can be attached to, inspected on, and cleared from instances
+    (such as transducers) that are shared across a whole process.
+    """
+    __slots__ = ['_data', 'evictions', 'hits', 'maxsize', 'misses']
+    _data: 'OrderedDict[Hashable, Any]'
+    evictions: int
+    hits: int
+    maxsize: int
+    misses: int
+
+    def __init__(self, maxsize: int):
+        """
+        Parameters
+        ----------
+
+        maxsize
+            Maximum number of entries. Must be positive.
+        """
+        if maxsize < 1:
+            raise ValueError(f'maxsize must be positive, got {maxsize}')
+        self._data = OrderedDict()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self):
+        return f'LRUCache({self.info()})'
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for ``key`` (marking it as recently used), or
+        ``default`` if it is not in the cache.
+        """
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        self._trim()
+
+    def resize(self, maxsize: int):
+        """Change the maximum number of entries, evicting entries if
+        necessary.
+        """
+        if maxsize < 1:
+            raise ValueError(f'maxsize must be positive, got {maxsize}')
+        self.maxsize = maxsize
+        self._trim()
+
+    def _trim(self):
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Remove all entries and reset counters."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Return hits, misses, evictions, maxsize, and currsize."""
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize,
+                         len(self._data))
+
+
 class StressParams(SP):
     def readable_name(self):
         cg, selection, guess = self
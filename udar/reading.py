@@ -6,10 +6,12 @@ import sys
 from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
 from typing import Union
 
 from .fsts import Generator
 from .fsts import get_generator
+from .misc import LRUCache
 from .subreading import Subreading
 from .tag import Tag
 from .conversion.OC_conflicts import OC_conflicts
@@ -19,6 +21,24 @@ from .conversion.UD_conflicts import UD_conflicts
 __all__ = ['Reading']
 
 TAB = '\t'
+SUBREADING_INTERN_SIZE = 2 ** 16
+
+_interned_subreadings = LRUCache(SUBREADING_INTERN_SIZE)
+
+
+def _intern_subreadings(subreadings: str) -> Tuple[Subreading, ...]:
+    """Return the parsed Subreadings of a raw reading string. Identical
+    strings share the same (immutable) Subreading objects, so each distinct
+    analysis is only parsed and stored once.
+    """
+    parsed = _interned_subreadings.get(subreadings)
+    if parsed is None:
+        parsed = tuple(Subreading(sub)
+                       for sub in re.findall(r'([^+]*[^#]+)#?', subreadings))
+        for sub in parsed:
+            sub._interned = True
+        _interned_subreadings[subreadings] = parsed
+    return parsed
 
 
 class Reading:
@@ -26,7 +46,9 @@ class Reading:
 
     Typically, a Reading has only one Subreading, but it can have more.
     """
-    __slots__ = ['cg_rule', 'is_most_likely', 'subreadings', 'weight']
+    __slots__ = ['_hfst_noL2_str', 'cg_rule', 'is_most_likely', 'subreadings',
+                 'weight']
+    _hfst_noL2_str: Optional[str]
     cg_rule: str
     is_most_likely: bool
     subreadings: List[Subreading]
@@ -51,11 +73,10 @@ class Reading:
             (Optional) The Constraint Grammar rule responsible for this
             reading's removal/selection/etc.
         """
+        self._hfst_noL2_str = None
         self.cg_rule = cg_rule
         self.is_most_likely = False
-        self.subreadings = [Subreading(sub)
-                            for sub in re.findall(r'([^+]*[^#]+)#?',
-                                                  subreadings)]
+        self.subreadings = list(_intern_subreadings(subreadings))
         if isinstance(weight, float):
             self.weight = f'{weight:.6f}'
         else:
@@ -91,7 +112,10 @@ class Reading:
 
     def hfst_noL2_str(self) -> str:
         """Reading HFST-/XFST-style stream, excluding L2 error tags."""
-        return f'''{'#'.join(f"""{s.hfst_noL2_str()}""" for s in self.subreadings)}'''  # noqa: E501
+        # This is the key used by Generator, so it is only built once
+        if self._hfst_noL2_str is None:
+            self._hfst_noL2_str = f'''{'#'.join(f"""{s.hfst_noL2_str()}""" for s in self.subreadings)}'''  # noqa: E501
+        return self._hfst_noL2_str
 
     def cg3_str(self, traces=False) -> str:
         """CG3-style stream
@@ -159,11 +183,16 @@ class Reading:
             Index or slice of :py:attr:`self.subreadings` of the subreading(s)
             in which to replace the tag.
         """
+        self._hfst_noL2_str = None
         if isinstance(which_subreading, slice):
-            for s in self.subreadings[which_subreading]:
-                s.replace_tag(orig_tag, new_tag)
+            indices = range(len(self.subreadings))[which_subreading]
         else:
-            self.subreadings[which_subreading].replace_tag(orig_tag, new_tag)
+            indices = [which_subreading]  # type: ignore
+        for i in indices:
+            # copy-on-write: interned Subreadings are shared by other Readings
+            if self.subreadings[i]._interned:
+                self.subreadings[i] = self.subreadings[i].copy()
+            self.subreadings[i].replace_tag(orig_tag, new_tag)
 
     def _is_compatible_with_stanza_reading(self, stanza_tags: Set[str]):
         """Check whether the given stanza reading information conflicts with
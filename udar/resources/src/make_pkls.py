@@ -5,10 +5,19 @@ import re
 from statistics import mean
 from sys import stderr
 
+from udar.features.mmap_dict import write_mmap_dict
+
 
 RSRC_PATH = resource_filename('udar', 'resources/')
 
 
+def dump(dct, name):
+    """Write `dct` as both a pickle and a memory-mappable ``.mdict`` file."""
+    with open(f'{RSRC_PATH}{name}.pkl', 'wb') as f:
+        pickle.dump(dct, f)
+    write_mmap_dict(dct, f'{RSRC_PATH}{name}.mdict')
+
+
 if __name__ == '__main__':
     ###########################################################################
     print('making Tixonov_dict.pkl and Tix_morph_count_dict.pkl ...',
@@ -40,8 +49,7 @@ if __name__ == '__main__':
 
     with open(f'{RSRC_PATH}Tixonov_dict.pkl', 'wb') as f:
         pickle.dump(tix_dict, f)
-    with open(f'{RSRC_PATH}Tix_morph_count_dict.pkl', 'wb') as f:
-        pickle.dump(morph_count_dict, f)
+    dump(morph_count_dict, 'Tix_morph_count_dict')
 
     ###########################################################################
     print('making lexmin_dict.pkl ...', file=stderr)
@@ -58,8 +66,7 @@ if __name__ == '__main__':
                     #           lexmin_dict[lemma], file=stderr)
                     lexmin_dict[lemma] = level
 
-    with open(f'{RSRC_PATH}lexmin_dict.pkl', 'wb') as f:
-        pickle.dump(lexmin_dict, f)
+    dump(lexmin_dict, 'lexmin_dict')
 
     ###########################################################################
     print('making kelly_dict.pkl ...', file=stderr)
@@ -74,8 +81,7 @@ if __name__ == '__main__':
             #           kelly_dict[lemma], file=stderr)
             kelly_dict[lemma] = level
 
-    with open(f'{RSRC_PATH}kelly_dict.pkl', 'wb') as f:
-        pickle.dump(kelly_dict, f)
+    dump(kelly_dict, 'kelly_dict')
 
     ###########################################################################
     print('making RNC_tok_freq_dict.pkl and RNC_tok_freq_rank_dict.pkl ...',
@@ -99,10 +105,8 @@ if __name__ == '__main__':
                 continue
             RNC_tok_freq_dict[tok] = float(tok_freq)
             RNC_tok_freq_rank_dict[tok] = rank
-    with open(f'{RSRC_PATH}RNC_tok_freq_dict.pkl', 'wb') as f:
-        pickle.dump(RNC_tok_freq_dict, f)
-    with open(f'{RSRC_PATH}RNC_tok_freq_rank_dict.pkl', 'wb') as f:
-        pickle.dump(RNC_tok_freq_rank_dict, f)
+    dump(RNC_tok_freq_dict, 'RNC_tok_freq_dict')
+    dump(RNC_tok_freq_rank_dict, 'RNC_tok_freq_rank_dict')
 
     ###########################################################################
     print('making Sharoff_lem_freq_dict.pkl '
@@ -130,7 +134,5 @@ if __name__ == '__main__':
                 continue
             Sharoff_lem_freq_dict[lemma] = float(freq)
             Sharoff_lem_freq_rank_dict[lemma] = rank
-    with open(f'{RSRC_PATH}Sharoff_lem_freq_dict.pkl', 'wb') as f:
-        pickle.dump(Sharoff_lem_freq_dict, f)
-    with open(f'{RSRC_PATH}Sharoff_lem_freq_rank_dict.pkl', 'wb') as f:
-        pickle.dump(Sharoff_lem_freq_rank_dict, f)
+    dump(Sharoff_lem_freq_dict, 'Sharoff_lem_freq_dict')
+    dump(Sharoff_lem_freq_rank_dict, 'Sharoff_lem_freq_rank_dict')
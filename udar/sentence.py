@@ -2,11 +2,14 @@
 
 from collections import Counter
 from pathlib import Path
-from pkg_resources import resource_filename
+from queue import Queue
 import re
+from shutil import which
 from subprocess import PIPE
 from subprocess import Popen
 import sys
+from threading import Lock
+from threading import Thread
 from time import strftime
 from typing import Any
 from typing import Callable
@@ -20,26 +23,30 @@ from typing import Type
 from typing import Union
 from warnings import warn
 
-import pexpect  # type: ignore
-
 from .fsts import get_analyzer
 from .misc import get_stanza_pretokenized_pipeline
 from .misc import destress
 from .misc import result_names
+from .misc import RSRC_PATH
 from .misc import StressParams
 from .misc import unspace_punct
 from .tok import Token
 from .transliterate import transliterate
 
 if TYPE_CHECKING:
+    import pexpect  # type: ignore  # noqa: F401
     import stanza  # type: ignore  # noqa: F401
     from .document import Document
 
 __all__ = ['hfst_tokenize', 'Sentence']
 
-RSRC_PATH = resource_filename('udar', 'resources/')
 NEWLINE = '\n'
+CG3_FLUSH = '<STREAMCMD:FLUSH>'
+TOK_SENTINEL = 'НF§Ŧ'  # marks the end of each input to hfst-tokenize
 _pexpect_hfst_tokenize = None
+_pipe_hfst_tokenize = None
+_tokenizer_pools: Dict[Tuple[str, int], 'TokenizerPool'] = {}
+_cg3_workers: Dict[Tuple[str, bool], 'CG3Worker'] = {}
 
 
 Tokenizer = Callable[[str], List[str]]
@@ -70,6 +77,7 @@ class HFSTTokenizer:
 
     def __init__(self):
         tokenizer_path = f'{RSRC_PATH}/tokeniser-disamb-gt-desc.pmhfst'
+        import pexpect  # type: ignore
         self.tokenizer = pexpect.spawn(f'hfst-tokenize {tokenizer_path}',
                                        echo=False, encoding='utf8',
                                        timeout=None)
@@ -83,14 +91,270 @@ class HFSTTokenizer:
         self.tokenizer.expect(r'\r\nНF§Ŧ(\r\n){2}')
         return self.tokenizer.before.split('\r\n')
 
+    def tokenize_many(self, input_strs: Iterable[str]) -> List[List[str]]:
+        """Tokenize many strings (e.g. all the sentences of a document) in a
+        single exchange with the subprocess. Each string is followed by its
+        own sentinel, and the output is split back into one list of tokens
+        per input string.
+        """
+        input_strs = list(input_strs)
+        # Write from another thread so that the subprocess's output cannot
+        # fill up the pty while we are still writing.
+        writer = Thread(target=self._sendlines, args=(input_strs,),
+                        daemon=True)
+        writer.start()
+        outputs = []
+        for _ in input_strs:
+            self.tokenizer.expect(r'\r\nНF§Ŧ(\r\n){2}')
+            outputs.append(self.tokenizer.before.split('\r\n'))
+        writer.join()
+        return outputs
+
+    def _sendlines(self, input_strs: List[str]):
+        for input_str in input_strs:
+            self.tokenizer.sendline(f'{input_str} НF§Ŧ\n')
+
+
+class PipeTokenizer:
+    """An HFST tokenizer implemented using plain pipes. The subprocess is
+    opened once, and a reader thread splits its output into one record per
+    input string, using the same sentinel as :py:class:`HFSTTokenizer`.
+
+    Unlike :py:class:`HFSTTokenizer`, there is no pty, so there is no
+    ``\\r\\n`` translation or terminal line-length limit, and writes are
+    pipelined: :py:meth:`tokenize_many` sends all of its inputs without
+    waiting for the output of each one.
+    """
+    __slots__ = ['_lock', '_reader', '_records', 'process']
+    _lock: Lock
+    _reader: Thread
+    _records: 'Queue[Optional[List[str]]]'
+    process: Popen
+
+    def __init__(self):
+        tokenizer_path = f'{RSRC_PATH}tokeniser-disamb-gt-desc.pmhfst'
+        # Without stdbuf, hfst-tokenize block-buffers its output to a pipe,
+        # so a sentinel can be stuck in the buffer forever.
+        if not which('stdbuf'):
+            raise FileNotFoundError('stdbuf (GNU coreutils) must be '
+                                    'installed to use PipeTokenizer. Use '
+                                    'HFSTTokenizer instead.')
+        cmd = ['stdbuf', '-oL', 'hfst-tokenize', tokenizer_path]
+        try:
+            self.process = Popen(cmd, stdin=PIPE, stdout=PIPE,
+                                 encoding='utf8', bufsize=1)
+        except FileNotFoundError as e:
+            raise FileNotFoundError('Command-line hfst must be installed to '
+                                    'use the tokenizer.') from e
+        self._lock = Lock()
+        self._records = Queue()
+        self._reader = Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    def _read(self):
+        toks: List[str] = []
+        after_sentinel = False
+        for line in self.process.stdout:  # type: ignore
+            line = line.rstrip(NEWLINE)
+            if after_sentinel:
+                after_sentinel = False
+                if line == '':  # the blank line that follows each sentinel
+                    continue
+            if line == TOK_SENTINEL:
+                self._records.put(toks)
+                toks = []
+                after_sentinel = True
+            else:
+                toks.append(line)
+        self._records.put(None)  # EOF
 
-def get_tokenizer(use_pexpect=True) -> Tokenizer:
+    def _write(self, input_strs: List[str]):
+        try:
+            for input_str in input_strs:
+                self.process.stdin.write(f'{input_str} {TOK_SENTINEL}\n\n')  # type: ignore  # noqa: E501
+            self.process.stdin.flush()  # type: ignore
+        except (BrokenPipeError, OSError):
+            pass  # the reader sees EOF
+
+    def __call__(self, input_str: str) -> List[str]:
+        return self.tokenize_many([input_str])[0]
+
+    def tokenize_many(self, input_strs: Iterable[str]) -> List[List[str]]:
+        """Tokenize many strings, with all of them in flight at once. Output
+        is returned in the same order as ``input_strs``.
+        """
+        input_strs = list(input_strs)
+        with self._lock:  # keep records aligned with concurrent callers
+            writer = Thread(target=self._write, args=(input_strs,),
+                            daemon=True)
+            writer.start()
+            outputs = []
+            for _ in input_strs:
+                toks = self._records.get()
+                if toks is None:
+                    self._records.put(None)  # for any later callers
+                    raise EOFError('hfst-tokenize exited unexpectedly.')
+                outputs.append(toks)
+            writer.join()
+        return outputs
+
+    def close(self):
+        """Terminate the ``hfst-tokenize`` subprocess."""
+        try:
+            self.process.stdin.close()  # type: ignore
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.wait()
+
+
+class TokenizerPool:
+    """A pool of ``hfst-tokenize`` processes, so that tokenization can use
+    multiple cores.
+
+    :py:meth:`tokenize_many` deals its inputs out round-robin to the
+    workers, which run concurrently, and then reassembles the output in the
+    original order. Single calls go to the worker with the fewest strings in
+    flight.
+
+    It is generally recommended to use ``get_tokenizer(n_procs=N)`` to obtain
+    a TokenizerPool object.
+    """
+    __slots__ = ['_in_flight', '_lock', '_worker_locks', 'workers']
+    _in_flight: List[int]
+    _lock: Lock
+    _worker_locks: List[Lock]
+    workers: List[Union['HFSTTokenizer', 'PipeTokenizer']]
+
+    def __init__(self, n: int, worker_class: Type = None):
+        """
+        Parameters
+        ----------
+
+        n
+            Number of worker processes
+        worker_class
+            (Optional) Class of the workers; :py:class:`PipeTokenizer` or
+            :py:class:`HFSTTokenizer`. (default: :py:class:`PipeTokenizer`,
+            or :py:class:`HFSTTokenizer` if ``stdbuf`` is not installed)
+        """
+        if n < 1:
+            raise ValueError(f'n must be positive, got {n}')
+        if worker_class is None:
+            worker_class = PipeTokenizer if which('stdbuf') else HFSTTokenizer
+        self.workers = [worker_class() for _ in range(n)]
+        self._in_flight = [0] * n
+        self._lock = Lock()
+        self._worker_locks = [Lock() for _ in range(n)]
+
+    def __len__(self):
+        return len(self.workers)
+
+    def __call__(self, input_str: str) -> List[str]:
+        with self._lock:
+            i = min(range(len(self.workers)),
+                    key=self._in_flight.__getitem__)
+            self._in_flight[i] += 1
+        try:
+            with self._worker_locks[i]:
+                return self.workers[i](input_str)
+        finally:
+            with self._lock:
+                self._in_flight[i] -= 1
+
+    def tokenize_many(self, input_strs: Iterable[str]) -> List[List[str]]:
+        """Tokenize many strings using all workers at once. Output is
+        returned in the same order as ``input_strs``.
+        """
+        input_strs = list(input_strs)
+        n = len(self.workers)
+        outputs: List[Optional[List[List[str]]]] = [None] * n
+        errors: List[BaseException] = []
+
+        def run(i):
+            with self._lock:
+                self._in_flight[i] += len(input_strs[i::n])
+            try:
+                with self._worker_locks[i]:
+                    outputs[i] = self.workers[i].tokenize_many(input_strs[i::n])  # noqa: E501
+            except BaseException as e:  # re-raised in the calling thread
+                errors.append(e)
+            finally:
+                with self._lock:
+                    self._in_flight[i] -= len(input_strs[i::n])
+
+        threads = [Thread(target=run, args=(i,), daemon=True)
+                   for i in range(min(n, len(input_strs)))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        return [outputs[i % n][i // n]  # type: ignore
+                for i in range(len(input_strs))]
+
+    def close(self):
+        """Terminate all worker subprocesses."""
+        for worker in self.workers:
+            close = getattr(worker, 'close', None)
+            if close is not None:
+                close()
+
+
+def get_tokenizer(use_pexpect=True, backend: str = None,
+                  n_procs: int = 1) -> Tokenizer:
+    """Return a tokenizer function (or callable object).
+
+    Parameters
+    ----------
+
+    use_pexpect
+        If ``backend`` is not given, whether to use the ``'pexpect'`` backend
+        (default) or the ``'subprocess'`` backend.
+    backend
+        (Optional) Which ``hfst-tokenize`` backend to use:
+
+        * 'pexpect' -- shared :py:class:`HFSTTokenizer`
+        * 'pipe' -- shared :py:class:`PipeTokenizer` (requires ``stdbuf``;
+          otherwise, falls back to 'pexpect' with a warning)
+        * 'subprocess' -- :py:func:`hfst_tokenize` (new process for each call)
+    n_procs
+        Number of ``hfst-tokenize`` processes. If greater than 1, return a
+        shared :py:class:`TokenizerPool` of ``'pexpect'`` or ``'pipe'``
+        workers. (default: 1)
+    """
     global _pexpect_hfst_tokenize
-    if pexpect.which('hfst-tokenize'):
-        if use_pexpect:
+    global _pipe_hfst_tokenize
+    if backend is None:
+        backend = 'pexpect' if use_pexpect else 'subprocess'
+    if backend not in {'pexpect', 'pipe', 'subprocess'}:
+        raise ValueError("backend must be in {'pexpect', 'pipe', "
+                         f"'subprocess'}}, got {backend!r}")
+    if n_procs < 1:
+        raise ValueError(f'n_procs must be positive, got {n_procs}')
+    if backend == 'pipe' and not which('stdbuf'):
+        warn("stdbuf not found. Using the 'pexpect' backend instead of "
+             "'pipe'.", stacklevel=2)
+        backend = 'pexpect'
+    if which('hfst-tokenize'):
+        if n_procs > 1 and backend != 'subprocess':
+            key = (backend, n_procs)
+            if key not in _tokenizer_pools:
+                if backend == 'pexpect':
+                    worker_class: Type = HFSTTokenizer
+                else:
+                    worker_class = PipeTokenizer
+                pool = TokenizerPool(n_procs, worker_class=worker_class)
+                _tokenizer_pools[key] = pool
+            return _tokenizer_pools[key]
+        elif backend == 'pexpect':
             if _pexpect_hfst_tokenize is None:
                 _pexpect_hfst_tokenize = HFSTTokenizer()
             return _pexpect_hfst_tokenize
+        elif backend == 'pipe':
+            if _pipe_hfst_tokenize is None:
+                _pipe_hfst_tokenize = PipeTokenizer()
+            return _pipe_hfst_tokenize
         else:
             return hfst_tokenize
     else:  # TODO use stanza instead of nltk?
@@ -110,6 +374,167 @@ def get_tokenizer(use_pexpect=True) -> Tokenizer:
             return nltk.word_tokenize
 
 
+class CG3Worker:
+    """A long-lived ``vislcg3`` process. The grammar is compiled only once,
+    and then each call streams cohorts through the running process.
+
+    Each input is followed by a ``<STREAMCMD:FLUSH>`` command, which closes
+    the current window (so sentence boundaries are the same as when each
+    sentence is given to its own ``vislcg3`` process) and serves as the
+    sentinel that separates the outputs. If the process dies, it is restarted
+    automatically.
+
+    It is generally recommended to use :py:func:`get_cg3_worker` to obtain a
+    CG3Worker object.
+    """
+    __slots__ = ['cmd', 'gram_path', 'process', 'traces']
+    cmd: List[str]
+    gram_path: str
+    process: Optional[Popen]
+    traces: bool
+
+    def __init__(self, gram_path: str, traces: bool = True):
+        self.gram_path = gram_path
+        self.traces = traces
+        if traces:
+            self.cmd = ['vislcg3', '-t', '-g', gram_path]
+        else:
+            self.cmd = ['vislcg3', '-g', gram_path]
+        self.process = None
+        self.start()
+
+    def start(self):
+        """(Re)start the ``vislcg3`` subprocess."""
+        self.close()
+        try:
+            self.process = Popen(self.cmd, stdin=PIPE, stdout=PIPE,
+                                 encoding='utf8')
+        except FileNotFoundError as e:
+            raise FileNotFoundError('vislcg3 must be installed and be in your '
+                                    'PATH variable to disambiguate a text.') from e  # noqa: E501
+
+    def close(self):
+        """Terminate the ``vislcg3`` subprocess."""
+        if self.process is not None:
+            try:
+                self.process.stdin.close()  # type: ignore
+            except (BrokenPipeError, OSError):
+                pass
+            self.process.wait()
+            self.process = None
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def __call__(self, cg3_strs: List[str]) -> List[str]:
+        """Return the output of the grammar for each CG3 stream in
+        ``cg3_strs``, using a single round trip to ``vislcg3``.
+        """
+        if not self.is_alive():
+            self.start()
+        try:
+            return self._communicate(cg3_strs)
+        except (BrokenPipeError, EOFError):
+            self.start()
+            return self._communicate(cg3_strs)
+
+    def _communicate(self, cg3_strs: List[str]) -> List[str]:
+        payload = ''.join(f'{s.rstrip(NEWLINE)}\n{CG3_FLUSH}\n'
+                          for s in cg3_strs)
+        # Write from another thread so that large inputs cannot deadlock
+        # against a full stdout pipe.
+        writer = Thread(target=self._write, args=(payload,), daemon=True)
+        writer.start()
+        outputs: List[str] = []
+        lines: List[str] = []
+        while len(outputs) < len(cg3_strs):
+            line = self.process.stdout.readline()  # type: ignore
+            if not line:
+                raise EOFError('vislcg3 exited unexpectedly.')
+            if line.rstrip(NEWLINE) == CG3_FLUSH:
+                outputs.append(''.join(lines))
+                lines = []
+            else:
+                lines.append(line)
+        writer.join()
+        return outputs
+
+    def _write(self, payload: str):
+        try:
+            self.process.stdin.write(payload)  # type: ignore
+            self.process.stdin.flush()  # type: ignore
+        except (BrokenPipeError, OSError):
+            pass  # the reader sees EOF and the worker is restarted
+
+
+def get_cg3_worker(gram_path: Union[str, Path] = '',
+                   traces: bool = True) -> CG3Worker:
+    """Return the shared :py:class:`CG3Worker` for the given grammar."""
+    if gram_path == '':
+        gram_path = f'{RSRC_PATH}disambiguator.cg3'
+    key = (str(gram_path), traces)
+    try:
+        return _cg3_workers[key]
+    except KeyError:
+        _cg3_workers[key] = CG3Worker(str(gram_path), traces=traces)
+        return _cg3_workers[key]
+
+
+def cg3_disambiguate(cg3_strs: List[str], gram_path: Union[str, Path] = '',
+                     traces: bool = True,
+                     persistent: bool = True) -> List[str]:
+    """Run each CG3 stream in ``cg3_strs`` through ``vislcg3`` in a single
+    round trip, and return the output for each stream.
+
+    Parameters
+    ----------
+
+    cg3_strs
+        CG3-style analysis streams, typically one per sentence
+    gram_path
+        Path to Constraint Grammar file. (default: the bundled grammar)
+    traces
+        Whether to keep track of readings that are *removed* by the
+        Constraint Grammar. (default: True)
+    persistent
+        Whether to use the shared, long-lived ``vislcg3`` process (see
+        :py:func:`get_cg3_worker`) instead of starting a new process.
+        (default: True)
+    """
+    if not cg3_strs:
+        return []
+    if persistent:
+        return get_cg3_worker(gram_path=gram_path, traces=traces)(cg3_strs)
+    if gram_path == '':
+        gram_path = f'{RSRC_PATH}disambiguator.cg3'
+    if isinstance(gram_path, Path):
+        gram_path = str(gram_path)
+    if traces:
+        cmd = ['vislcg3', '-t', '-g', gram_path]
+    else:
+        cmd = ['vislcg3', '-g', gram_path]
+    try:
+        p = Popen(cmd, stdin=PIPE, stdout=PIPE, universal_newlines=True)
+    except FileNotFoundError as e:
+        raise FileNotFoundError('vislcg3 must be installed and be in your '
+                                'PATH variable to disambiguate a text.') from e
+    output, error = p.communicate(input=''.join(f'{s.rstrip(NEWLINE)}\n'
+                                                f'{CG3_FLUSH}\n'
+                                                for s in cg3_strs))
+    outputs = []
+    lines: List[str] = []
+    for line in output.splitlines(keepends=True):
+        if line.rstrip(NEWLINE) == CG3_FLUSH:
+            outputs.append(''.join(lines))
+            lines = []
+        else:
+            lines.append(line)
+    if len(outputs) != len(cg3_strs):
+        raise AssertionError(f'vislcg3 returned output for {len(outputs)} '
+                             f'streams, expected {len(cg3_strs)}.')
+    return outputs
+
+
 class Sentence:
     """Sequence of :py:class:`Token` objects.
 
@@ -157,7 +582,8 @@ class Sentence:
                  annotation: str = '',
                  features: Tuple = None,
                  feat_cache: Dict[str, Any] = None,
-                 orig_text: str = ''):
+                 orig_text: str = '',
+                 _toks: List[str] = None):
         """
         Parameters
         ----------
@@ -195,6 +621,9 @@ class Sentence:
         orig_text
             (Optional) Original text of the sentence. This can be used when
             ``input_text`` is a list of :py:class:`Token` objects.
+        _toks
+            (Optional) Tokens of ``input_text``, if it has already been
+            tokenized (e.g. by :py:meth:`HFSTTokenizer.tokenize_many`).
         """
         self._analyzed = False
         self._disambiguated = False
@@ -219,8 +648,13 @@ class Sentence:
         # if input_text is a `str`...
         if isinstance(input_text, str):
             self._from_str = True
-            self._tokenized = False
-            self._toks = []
+            if _toks is None:
+                self._tokenized = False
+                self._toks = []
+            else:
+                self._tokenized = True
+                self._toks = _toks
+                tokenize = False
             self.text = input_text
         # elif input_text is a sequence of `str`s...
         elif ((hasattr(input_text, '__iter__')
@@ -439,18 +873,23 @@ class Sentence:
         if _experiment is None:
             _experiment = self._experiment
         if _experiment:
-            self.tokens = [Token(destress(t), _analyzer=_analyzer,
-                                 analyze=True, analyze_L2_errors=L2_errors)
-                           for t in self._toks]
+            toks = [destress(t) for t in self._toks]
+        else:
+            toks = self._toks
+        try:
+            lookup_many = _analyzer.lookup_many  # type: ignore
+        except AttributeError:  # custom analyzer
+            analyses = [_analyzer(t) for t in toks]
         else:
-            self.tokens = [Token(t, _analyzer=_analyzer, analyze=True,
-                                 analyze_L2_errors=L2_errors)
-                           for t in self._toks]
+            analyses = lookup_many(toks)
+        self.tokens = [Token(t, readings=list(analysis))
+                       for t, analysis in zip(toks, analyses)]
         self._analyzed = True
         self._toks = []
 
     def disambiguate(self, gram_path: Union[str, Path] = '',
-                     traces: bool = True, force: str = None):
+                     traces: bool = True, force: str = None,
+                     persistent: bool = True):
         """Use Constraint Grammar to remove as many ambiguous readings as
         possible.
 
@@ -467,21 +906,19 @@ class Sentence:
             Use the given method to force removal of ambiguity left by the
             Constraint Grammar. See :py:meth:`Token.most_likely_reading` for
             the list of available methods.  # TODO kwargs?
+        persistent
+            Whether to use the shared, long-lived ``vislcg3`` process (see
+            :py:func:`get_cg3_worker`) instead of starting a new process for
+            this sentence. (default: True)
+        """
+        output = cg3_disambiguate([self.cg3_str()], gram_path=gram_path,
+                                  traces=traces, persistent=persistent)[0]
+        self._apply_cg3(output, force=force)
+
+    def _apply_cg3(self, output: str, force: str = None):
+        """Update readings of this sentence's tokens using the output of
+        ``vislcg3``.
         """
-        if gram_path == '':
-            gram_path = f'{RSRC_PATH}disambiguator.cg3'
-        if isinstance(gram_path, Path):
-            gram_path = repr(gram_path)
-        if traces:
-            cmd = ['vislcg3', '-t', '-g', gram_path]
-        else:
-            cmd = ['vislcg3', '-g', gram_path]
-        try:
-            p = Popen(cmd, stdin=PIPE, stdout=PIPE, universal_newlines=True)
-        except FileNotFoundError as e:
-            raise FileNotFoundError('vislcg3 must be installed and be in your '
-                                    'PATH variable to disambiguate a text.') from e  # noqa: E501
-        output, error = p.communicate(input=self.cg3_str())
         new_tokens = self.parse_cg3(output)
         if len(self) != len(new_tokens):
             triangle = '\u25B6'
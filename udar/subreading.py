@@ -16,7 +16,8 @@ class Subreading:
     """Grammatical analysis (lemma and tags) of a Token. Although a Reading can
     have multiple Subreadings, it usually only has one.
     """
-    __slots__ = ['_lemma', 'tags', 'tagset']
+    __slots__ = ['_interned', '_lemma', 'tags', 'tagset']
+    _interned: bool  # shared between Readings, so it must not be mutated
     _lemma: str
     tags: List[Tag]
     tagset: Set[Tag]
@@ -31,10 +32,20 @@ class Subreading:
             Lemma and tags, separated by ``+``s, e.g.
             ``слово+N+Neu+Inan+Sg+Nom``
         """
+        self._interned = False
         self._lemma, *tags = re.split(r'\+(?=[^+])', subreading)  # TODO timeit
         self.tags = [tag_dict[t] for t in tags]
         self.tagset = set(self.tags)
 
+    def copy(self) -> 'Subreading':
+        """Return a mutable copy of this Subreading (without re-parsing)."""
+        new = Subreading.__new__(Subreading)
+        new._interned = False
+        new._lemma = self._lemma
+        new.tags = list(self.tags)
+        new.tagset = set(self.tagset)
+        return new
+
     @property
     def lemma(self):
         return self._lemma
@@ -90,6 +101,10 @@ class Subreading:
         new_tag
             Tag to replace the ``orig_tag`` with
         """
+        if self._interned:
+            raise TypeError('This Subreading is shared by multiple Readings '
+                            'and cannot be modified. Use '
+                            'Reading.replace_tag() or Subreading.copy().')
         # if given tags are `str`s, convert them to `Tag`s.
         # (`Tag`s are mapped to themselves.)
         orig_tag = tag_dict[orig_tag]
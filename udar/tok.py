@@ -34,12 +34,14 @@ GRAVE = '\u0300'
 
 class Token:
     # TODO class docstring
-    __slots__ = ['_readings', '_stanza_token', 'annotation', 'end_char',
-                 'features', 'lemmas', 'misc', 'phon_predictions',
-                 'removed_readings', 'start_char', 'stress_ambig',
+    __slots__ = ['_phon_transcriptions', '_readings', '_stanza_token',
+                 '_stresses', 'annotation', 'end_char', 'features', 'lemmas',
+                 'misc', 'phon_predictions', 'removed_readings', 'start_char',
                  'stress_predictions', 'text', '_upper_indices']
+    _phon_transcriptions: Optional[Set[str]]
     _readings: List[Reading]
     _stanza_token: Optional['stanza.models.common.doc.Token']
+    _stresses: Dict[bool, Set[str]]  # keys are values of `recase`
     annotation: str
     end_char: int  # TODO
     features: Tuple
@@ -48,7 +50,6 @@ class Token:
     phon_predictions: Dict[StressParams, set]
     removed_readings: List[Reading]
     start_char: int  # TODO
-    stress_ambig: int  # number of stressed alternatives
     stress_predictions: Dict[StressParams, Tuple[str, Result]]
     text: str
     _upper_indices: Set[int]
@@ -130,13 +131,21 @@ class Token:
         else:
             return ''
 
+    @property
+    def stress_ambig(self) -> int:
+        """Number of stressed alternatives."""
+        return len(self._get_stresses(recase=True))
+
     def _update_lemmas_stress_and_phon(self):
         self.lemmas = set()
         for r in self.readings:
             self.lemmas.update(r.lemmas)
         self.phon_predictions = {}
         self.stress_predictions = {}
-        self.stress_ambig = len(self.stresses())
+        # Generated forms are computed lazily (see stresses() and
+        # phonetic_transcriptions()), and invalidated whenever readings change
+        self._phon_transcriptions = None
+        self._stresses = {}
 
     def __contains__(self, key: Union[str, Tag]):
         """Enable `in` Token."""
@@ -406,17 +415,28 @@ class Token:
             If ``True``, make each word match the capitalization of the
             original text (default: ``True``)
         """
+        return set(self._get_stresses(recase=recase))
+
+    def _get_stresses(self, recase: bool = True) -> Set[str]:
+        """Return the cached set of stressed forms. Callers must not modify
+        the returned set.
+        """
+        try:
+            return self._stresses[recase]
+        except KeyError:
+            pass
         acc_gen = get_generator(stressed=True)
+        generated = acc_gen.generate_many(self.readings)
         if recase:
             try:
-                stresses = {self.recase(r.generate(_generator=acc_gen))
-                            for r in self.readings}
+                stresses = {self.recase(s) for s in generated}
             except AttributeError as e:  # pragma: no cover
                 raise AttributeError('Problem generating stresses from: '
                                      f'{self} {self.readings}.') from e
         else:
-            stresses = {r.generate(_generator=acc_gen) for r in self.readings}
+            stresses = set(generated)
         stresses = {s for s in stresses if s is not None}
+        self._stresses[recase] = stresses  # type: ignore
         return stresses  # type: ignore
 
     def stressed(self, *, selection: str = 'safe', guess: bool = False,
@@ -551,10 +571,12 @@ class Token:
         """Return set of all phonetic transcriptions from
         :py:attr:`self.readings`.
         """
-        phon_gen = get_generator(phonetic=True)
-        phon_transcriptions = {r.generate(_generator=phon_gen)
-                               for r in self.readings}
-        return {t for t in phon_transcriptions if t is not None}
+        if self._phon_transcriptions is None:
+            phon_gen = get_generator(phonetic=True)
+            phon_transcriptions = set(phon_gen.generate_many(self.readings))
+            self._phon_transcriptions = {t for t in phon_transcriptions
+                                         if t is not None}
+        return set(self._phon_transcriptions)
 
     def phonetic(self, *, selection: str = 'safe', guess: bool = False,
                  lemma: str = None, _experiment: bool = False,